@@ -4,7 +4,14 @@ Autor: Felipe Alcântara
 Descrição: Gera um número de CPF válido permitindo escolher a região fiscal desejada
 """
 
+import os
 import random
+import sys
+
+# Permite importar o pacote cpf a partir da raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores, formatar_cpf  # noqa: E402
 
 
 def obter_regioes_fiscais():
@@ -73,79 +80,36 @@ def solicitar_regiao():
             exit(0)
 
 
-def gerar_oito_digitos_aleatorios():
+def gerar_oito_digitos_aleatorios(gerador=random):
     """
     Gera os primeiros 8 dígitos aleatórios do CPF.
     
+    Args:
+        gerador: Fonte de aleatoriedade com randint (padrão: módulo random;
+            use random.Random(semente) para resultados reproduzíveis)
+        
     Returns:
         list: Lista com 8 números aleatórios entre 0 e 9
     """
-    return [random.randint(0, 9) for _ in range(8)]
+    return [gerador.randint(0, 9) for _ in range(8)]
 
 
-def gerar_nove_digitos_com_regiao(regiao_escolhida):
+def gerar_nove_digitos_com_regiao(regiao_escolhida, gerador=random):
     """
     Gera os primeiros 9 dígitos do CPF com o 9º dígito definido pela região.
     
     Args:
         regiao_escolhida (int): Dígito da região fiscal (0-9)
+        gerador: Fonte de aleatoriedade repassada a gerar_oito_digitos_aleatorios
         
     Returns:
         list: Lista com 9 dígitos (8 aleatórios + 1 da região)
     """
-    digitos = gerar_oito_digitos_aleatorios()
+    digitos = gerar_oito_digitos_aleatorios(gerador)
     digitos.append(regiao_escolhida)  # 9º dígito = região fiscal
     return digitos
 
 
-def calcular_primeiro_digito(digitos):
-    """
-    Calcula o primeiro dígito verificador do CPF.
-    
-    Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
-        
-    Returns:
-        int: Primeiro dígito verificador
-    """
-    soma = sum(digitos[i] * (10 - i) for i in range(9))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
-
-
-def calcular_segundo_digito(digitos, primeiro_digito):
-    """
-    Calcula o segundo dígito verificador do CPF.
-    
-    Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
-        primeiro_digito (int): Primeiro dígito verificador
-        
-    Returns:
-        int: Segundo dígito verificador
-    """
-    digitos_completos = digitos + [primeiro_digito]
-    soma = sum(digitos_completos[i] * (11 - i) for i in range(10))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
-
-
-def formatar_cpf(digitos, digito1, digito2):
-    """
-    Formata o CPF no padrão XXX.XXX.XXX-XX.
-    
-    Args:
-        digitos (list): Lista com os 9 primeiros dígitos
-        digito1 (int): Primeiro dígito verificador
-        digito2 (int): Segundo dígito verificador
-        
-    Returns:
-        str: CPF formatado
-    """
-    cpf_numeros = ''.join(map(str, digitos))
-    return f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{digito1}{digito2}"
-
-
 def exibir_resultado(cpf_formatado, digitos, digito1, digito2, regiao_escolhida):
     """
     Exibe o resultado da geração do CPF com informações detalhadas.
@@ -204,9 +168,12 @@ def perguntar_gerar_novamente():
             print("❌ Por favor, responda com S (Sim) ou N (Não).")
 
 
-def gerar_cpf_por_regiao():
+def gerar_cpf_por_regiao(gerador=random):
     """
     Função principal que coordena a geração interativa do CPF por região.
+    
+    Args:
+        gerador: Fonte de aleatoriedade repassada a gerar_nove_digitos_com_regiao
     """
     print("\n" + "="*70)
     print("          🎯 GERADOR DE CPF VÁLIDO POR REGIÃO 🎯")
@@ -221,11 +188,10 @@ def gerar_cpf_por_regiao():
         regiao_escolhida = solicitar_regiao()
         
         # Gera os 9 primeiros dígitos (8 aleatórios + 1 da região)
-        digitos = gerar_nove_digitos_com_regiao(regiao_escolhida)
+        digitos = gerar_nove_digitos_com_regiao(regiao_escolhida, gerador)
         
         # Calcula os dígitos verificadores
-        primeiro_digito = calcular_primeiro_digito(digitos)
-        segundo_digito = calcular_segundo_digito(digitos, primeiro_digito)
+        primeiro_digito, segundo_digito = calcular_digitos_verificadores(digitos)
         
         # Formata o CPF
         cpf_formatado = formatar_cpf(digitos, primeiro_digito, segundo_digito)
@@ -245,6 +211,7 @@ def gerar_cpf_por_regiao():
 
 if __name__ == "__main__":
     try:
-        gerar_cpf_por_regiao()
+        # CPF_SEMENTE fixa a semente para repetir a mesma sequência de CPFs
+        gerar_cpf_por_regiao(random.Random(os.environ.get("CPF_SEMENTE")))
     except KeyboardInterrupt:
         print("\n\n👋 Programa encerrado pelo usuário. Até logo!")
@@ -4,49 +4,28 @@ Autor: Felipe Alcântara
 Descrição: Gera um número de CPF válido com dígitos verificadores corretos
 """
 
+import os
 import random
+import sys
 
+# Permite importar o pacote cpf a partir da raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def gerar_nove_digitos():
-    """
-    Gera os primeiros 9 dígitos aleatórios do CPF.
-    
-    Returns:
-        list: Lista com 9 números aleatórios entre 0 e 9
-    """
-    return [random.randint(0, 9) for _ in range(9)]
+from cpf import calcular_digitos_verificadores, formatar_cpf  # noqa: E402
 
 
-def calcular_primeiro_digito(digitos):
+def gerar_nove_digitos(gerador=random):
     """
-    Calcula o primeiro dígito verificador do CPF.
+    Gera os primeiros 9 dígitos aleatórios do CPF.
     
     Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
+        gerador: Fonte de aleatoriedade com randint (padrão: módulo random;
+            use random.Random(semente) para resultados reproduzíveis)
         
     Returns:
-        int: Primeiro dígito verificador
-    """
-    soma = sum(digitos[i] * (10 - i) for i in range(9))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
-
-
-def calcular_segundo_digito(digitos, primeiro_digito):
-    """
-    Calcula o segundo dígito verificador do CPF.
-    
-    Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
-        primeiro_digito (int): Primeiro dígito verificador
-        
-    Returns:
-        int: Segundo dígito verificador
+        list: Lista com 9 números aleatórios entre 0 e 9
     """
-    digitos_completos = digitos + [primeiro_digito]
-    soma = sum(digitos_completos[i] * (11 - i) for i in range(10))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
+    return [gerador.randint(0, 9) for _ in range(9)]
 
 
 def identificar_regiao_fiscal(digitos):
@@ -78,22 +57,6 @@ def identificar_regiao_fiscal(digitos):
     return nono_digito, mapa_regioes[nono_digito]
 
 
-def formatar_cpf(digitos, digito1, digito2):
-    """
-    Formata o CPF no padrão XXX.XXX.XXX-XX.
-    
-    Args:
-        digitos (list): Lista com os 9 primeiros dígitos
-        digito1 (int): Primeiro dígito verificador
-        digito2 (int): Segundo dígito verificador
-        
-    Returns:
-        str: CPF formatado
-    """
-    cpf_numeros = ''.join(map(str, digitos))
-    return f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{digito1}{digito2}"
-
-
 def exibir_mensagem_geracao(cpf_formatado, digitos, digito1, digito2):
     """
     Exibe uma mensagem descritiva e bonita sobre o CPF gerado.
@@ -132,16 +95,18 @@ def exibir_mensagem_geracao(cpf_formatado, digitos, digito1, digito2):
     print()
 
 
-def gerar_cpf_valido():
+def gerar_cpf_valido(gerador=random):
     """
     Função principal que coordena a geração do CPF e exibe o resultado.
+    
+    Args:
+        gerador: Fonte de aleatoriedade repassada a gerar_nove_digitos
     """
     # Gera os 9 primeiros dígitos
-    digitos = gerar_nove_digitos()
+    digitos = gerar_nove_digitos(gerador)
     
     # Calcula os dígitos verificadores
-    primeiro_digito = calcular_primeiro_digito(digitos)
-    segundo_digito = calcular_segundo_digito(digitos, primeiro_digito)
+    primeiro_digito, segundo_digito = calcular_digitos_verificadores(digitos)
     
     # Formata o CPF
     cpf_formatado = formatar_cpf(digitos, primeiro_digito, segundo_digito)
@@ -153,4 +118,5 @@ def gerar_cpf_valido():
 
 
 if __name__ == "__main__":
-    gerar_cpf_valido()
\ No newline at end of file
+    # CPF_SEMENTE fixa a semente para repetir a mesma geração
+    gerar_cpf_valido(random.Random(os.environ.get("CPF_SEMENTE")))
\ No newline at end of file
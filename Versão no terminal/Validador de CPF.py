@@ -2,155 +2,162 @@
 Validador de CPF
 Autor: Felipe Alcântara
 Descrição: Valida se um CPF é válido ou não usando o algoritmo de dígitos verificadores
+
+Uso:
+    python "Validador de CPF.py"                   # modo interativo
+    python "Validador de CPF.py" CPF [CPF...]       # uma linha por CPF, para scripts
+    python "Validador de CPF.py" --coprocesso [N]   # lê CPFs da entrada padrão
+
+No modo para scripts, a saída é "CPF<TAB>motivo" e o código de saída é 0 se
+todos forem válidos. Só o núcleo em Python puro é importado: nada de NumPy
+nem de módulos que não sejam usados em uma validação avulsa.
+
+No modo coprocesso, o programa fica aberto lendo um CPF por linha e
+responde uma linha "CPF<TAB>motivo" para cada um, descarregando a saída a
+cada N respostas (padrão: 1, para quem espera a resposta antes de mandar o
+próximo CPF). Quando a entrada fecha, a vazão é exibida na saída de erro.
 """
 
-import re
+import os
+import sys
+import time
+
+# Permite importar o pacote cpf a partir da raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from cpf.motivos import NOMES_MOTIVOS, Motivo  # noqa: E402
+from cpf.validacao import motivo_cpf  # noqa: E402
+from cpf.validacao import validar_cpf as validar_cpf_nucleo  # noqa: E402
 
-def limpar_cpf(cpf):
+
+def identificar_regiao_fiscal(nono_digito):
     """
-    Remove todos os caracteres não numéricos do CPF.
+    Identifica a região fiscal baseada no 9º dígito do CPF.
     
     Args:
-        cpf (str): CPF em qualquer formato
+        nono_digito (int): 9º dígito do CPF
         
     Returns:
-        str: CPF apenas com números
+        str: Região/estados correspondentes
     """
-    return re.sub(r'\D', '', cpf)
+    mapa_regioes = {
+        0: "RS (Rio Grande do Sul)",
+        1: "DF, GO, MT, MS, TO (Distrito Federal, Goiás, Mato Grosso, Mato Grosso do Sul, Tocantins)",
+        2: "AC, AM, AP, PA, RO, RR (Acre, Amazonas, Amapá, Pará, Rondônia, Roraima)",
+        3: "CE, MA, PI (Ceará, Maranhão, Piauí)",
+        4: "AL, PB, PE, RN (Alagoas, Paraíba, Pernambuco, Rio Grande do Norte)",
+        5: "BA, SE (Bahia, Sergipe)",
+        6: "MG (Minas Gerais)",
+        7: "ES, RJ (Espírito Santo, Rio de Janeiro)",
+        8: "SP (São Paulo)",
+        9: "PR, SC (Paraná, Santa Catarina)"
+    }
+    
+    return mapa_regioes[nono_digito]
 
 
-def validar_formato(cpf_limpo):
+def mensagem_de_erro(informacoes):
     """
-    Verifica se o CPF tem 11 dígitos e não é uma sequência repetida.
+    Monta a mensagem exibida para o motivo da invalidação.
     
     Args:
-        cpf_limpo (str): CPF apenas com números
+        informacoes (ResultadoValidacao): Resultado de um CPF inválido
         
     Returns:
-        tuple: (bool: é_valido, str: mensagem_erro)
+        str: Mensagem para o usuário
     """
-    # Verifica se tem 11 dígitos
-    if len(cpf_limpo) != 11:
-        return False, f"CPF deve ter 11 dígitos. Você digitou {len(cpf_limpo)} dígitos."
-    
-    # Verifica se não é uma sequência repetida (111.111.111-11, 222.222.222-22, etc)
-    if cpf_limpo == cpf_limpo[0] * 11:
-        return False, "CPF não pode ser uma sequência de números iguais."
-    
-    return True, ""
+    motivo = informacoes.motivo
+    if motivo is Motivo.NAO_NUMERICO:
+        return "CPF deve conter apenas números, pontos, traço e espaços."
+    if motivo is Motivo.TAMANHO:
+        return f"CPF deve ter 11 dígitos. Você digitou {len(informacoes.cpf_limpo)} dígitos."
+    if motivo is Motivo.REPETIDO:
+        return "CPF não pode ser uma sequência de números iguais."
+    if motivo is Motivo.PRIMEIRO_VERIFICADOR:
+        return "Primeiro dígito verificador inválido"
+    return "Segundo dígito verificador inválido"
 
 
-def calcular_primeiro_digito(digitos):
+def validar_cpf(cpf):
     """
-    Calcula o primeiro dígito verificador do CPF.
+    Valida um CPF completo.
     
     Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
+        cpf (str): CPF em qualquer formato
         
     Returns:
-        int: Primeiro dígito verificador
+        tuple: (bool: é_valido, ResultadoValidacao: informações, montadas
+        só quando acessadas)
     """
-    soma = sum(digitos[i] * (10 - i) for i in range(9))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
+    resultado = validar_cpf_nucleo(cpf)
+    return resultado.valido, resultado
 
 
-def calcular_segundo_digito(digitos, primeiro_digito):
+def linha_resultado(cpf_original, motivo):
     """
-    Calcula o segundo dígito verificador do CPF.
+    Monta a linha compacta do resultado, para uso em scripts.
     
     Args:
-        digitos (list): Lista com os 9 primeiros dígitos do CPF
-        primeiro_digito (int): Primeiro dígito verificador
+        cpf_original (str): CPF como foi recebido
+        motivo (Motivo): Resultado da validação
         
     Returns:
-        int: Segundo dígito verificador
+        str: "CPF<TAB>motivo", com o nome curto do motivo (ex.: "valido")
     """
-    digitos_completos = digitos + [primeiro_digito]
-    soma = sum(digitos_completos[i] * (11 - i) for i in range(10))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
+    return f"{cpf_original}\t{NOMES_MOTIVOS[motivo]}"
 
 
-def identificar_regiao_fiscal(digitos):
+def validar_argumentos(cpfs):
     """
-    Identifica a região fiscal baseada no 9º dígito do CPF.
+    Valida os CPFs passados na linha de comando, sem interação.
     
     Args:
-        digitos (list): Lista com os 11 dígitos do CPF
+        cpfs (list): CPFs em qualquer formato
         
     Returns:
-        tuple: (dígito, região/estados correspondentes)
+        int: Código de saída (0 se todos forem válidos, 1 caso contrário)
     """
-    mapa_regioes = {
-        0: "RS (Rio Grande do Sul)",
-        1: "DF, GO, MT, MS, TO (Distrito Federal, Goiás, Mato Grosso, Mato Grosso do Sul, Tocantins)",
-        2: "AC, AM, AP, PA, RO, RR (Acre, Amazonas, Amapá, Pará, Rondônia, Roraima)",
-        3: "CE, MA, PI (Ceará, Maranhão, Piauí)",
-        4: "AL, PB, PE, RN (Alagoas, Paraíba, Pernambuco, Rio Grande do Norte)",
-        5: "BA, SE (Bahia, Sergipe)",
-        6: "MG (Minas Gerais)",
-        7: "ES, RJ (Espírito Santo, Rio de Janeiro)",
-        8: "SP (São Paulo)",
-        9: "PR, SC (Paraná, Santa Catarina)"
-    }
-    
-    nono_digito = digitos[8]
-    return nono_digito, mapa_regioes[nono_digito]
+    todos_validos = True
+    for cpf in cpfs:
+        motivo = motivo_cpf(cpf)
+        print(linha_resultado(cpf, motivo))
+        todos_validos = todos_validos and motivo is Motivo.VALIDO
+    return 0 if todos_validos else 1
 
 
-def validar_cpf(cpf):
+def validar_coprocesso(entrada, saida, descarregar_a_cada=1, relatorio=None):
     """
-    Valida um CPF completo.
+    Valida um CPF por linha até a entrada fechar, sem prompts nem molduras.
     
     Args:
-        cpf (str): CPF em qualquer formato
+        entrada: Arquivo de texto com um CPF por linha
+        saida: Arquivo de texto que recebe uma linha "CPF<TAB>motivo" por CPF
+        descarregar_a_cada (int): Respostas acumuladas antes de cada flush
+        relatorio: Arquivo de texto que recebe a vazão no final (opcional)
         
     Returns:
-        tuple: (bool: é_valido, dict: informações)
+        int: Código de saída (sempre 0; cada CPF inválido é só uma resposta)
     """
-    # Remove formatação
-    cpf_limpo = limpar_cpf(cpf)
-    
-    # Valida formato básico
-    formato_valido, mensagem_erro = validar_formato(cpf_limpo)
-    if not formato_valido:
-        return False, {"erro": mensagem_erro}
-    
-    # Converte para lista de inteiros
-    digitos = [int(d) for d in cpf_limpo]
-    
-    # Pega os 9 primeiros dígitos
-    nove_digitos = digitos[:9]
+    total = validos = pendentes = 0
+    inicio = time.perf_counter()
     
-    # Calcula os dígitos verificadores
-    primeiro_calculado = calcular_primeiro_digito(nove_digitos)
-    segundo_calculado = calcular_segundo_digito(nove_digitos, primeiro_calculado)
+    for linha in entrada:
+        cpf = linha.rstrip("\r\n")
+        motivo = motivo_cpf(cpf)
+        saida.write(linha_resultado(cpf, motivo) + "\n")
+        total += 1
+        validos += motivo is Motivo.VALIDO
+        pendentes += 1
+        if pendentes >= descarregar_a_cada:
+            saida.flush()
+            pendentes = 0
+    saida.flush()
     
-    # Pega os dígitos verificadores informados
-    primeiro_informado = digitos[9]
-    segundo_informado = digitos[10]
-    
-    # Verifica se os dígitos conferem
-    if primeiro_calculado != primeiro_informado or segundo_calculado != segundo_informado:
-        return False, {
-            "erro": "Dígitos verificadores inválidos",
-            "verificadores_informados": f"{primeiro_informado}{segundo_informado}",
-            "verificadores_corretos": f"{primeiro_calculado}{segundo_calculado}"
-        }
-    
-    # CPF válido! Retorna informações adicionais
-    nono_digito, regiao = identificar_regiao_fiscal(digitos)
-    
-    return True, {
-        "cpf_formatado": f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:11]}",
-        "nove_primeiros": ' '.join(map(str, nove_digitos)),
-        "primeiro_verificador": primeiro_calculado,
-        "segundo_verificador": segundo_calculado,
-        "nono_digito": nono_digito,
-        "regiao_fiscal": regiao
-    }
+    if relatorio is not None:
+        segundos = max(time.perf_counter() - inicio, 1e-9)
+        print(f"{total:,} CPFs ({validos:,} válidos) em {segundos:.2f} s: "
+              f"{total / segundos:,.0f} CPFs/s", file=relatorio)
+    return 0
 
 
 def exibir_resultado(cpf_original, valido, informacoes):
@@ -160,7 +167,7 @@ def exibir_resultado(cpf_original, valido, informacoes):
     Args:
         cpf_original (str): CPF original digitado
         valido (bool): Se o CPF é válido
-        informacoes (dict): Informações sobre o CPF
+        informacoes (ResultadoValidacao): Informações sobre o CPF
     """
     print("\n" + "="*70)
     
@@ -168,15 +175,16 @@ def exibir_resultado(cpf_original, valido, informacoes):
         print("               ✅ CPF VÁLIDO!")
         print("="*70)
         print()
-        print(f"📄 CPF Formatado: {informacoes['cpf_formatado']}")
+        print(f"📄 CPF Formatado: {informacoes.cpf_formatado}")
         print()
         print("📋 Detalhes da Validação:")
-        print(f"   ├─ Primeiros 9 dígitos: {informacoes['nove_primeiros']}")
-        print(f"   ├─ 1º dígito verificador: {informacoes['primeiro_verificador']}")
-        print(f"   └─ 2º dígito verificador: {informacoes['segundo_verificador']}")
+        print(f"   ├─ Primeiros 9 dígitos: {informacoes.nove_primeiros}")
+        print(f"   ├─ 1º dígito verificador: {informacoes.primeiro_verificador}")
+        print(f"   └─ 2º dígito verificador: {informacoes.segundo_verificador}")
         print()
         print("🗺️  Informação da Região Fiscal:")
-        print(f"   └─ 9º dígito ({informacoes['nono_digito']}): {informacoes['regiao_fiscal']}")
+        regiao = identificar_regiao_fiscal(informacoes.nono_digito)
+        print(f"   └─ 9º dígito ({informacoes.nono_digito}): {regiao}")
         print()
         print("="*70)
         print("💡 Este CPF possui dígitos verificadores corretos.")
@@ -188,14 +196,13 @@ def exibir_resultado(cpf_original, valido, informacoes):
         print()
         print("❌ Motivo da Invalidação:")
         
-        if "erro" in informacoes:
-            print(f"   └─ {informacoes['erro']}")
-            
-            if "verificadores_informados" in informacoes:
-                print()
-                print("🔍 Comparação dos Dígitos Verificadores:")
-                print(f"   ├─ Dígitos informados: {informacoes['verificadores_informados']}")
-                print(f"   └─ Dígitos corretos:   {informacoes['verificadores_corretos']}")
+        print(f"   └─ {mensagem_de_erro(informacoes)}")
+        
+        if informacoes.verificadores_informados is not None:
+            print()
+            print("🔍 Comparação dos Dígitos Verificadores:")
+            print(f"   ├─ Dígitos informados: {informacoes.verificadores_informados}")
+            print(f"   └─ Dígitos corretos:   {informacoes.verificadores_corretos}")
         
         print()
         print("="*70)
@@ -280,6 +287,17 @@ def main():
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--coprocesso"]:
+        # Bytes inválidos em UTF-8 viram um caractere não numérico, não um erro
+        sys.stdin.reconfigure(errors="replace")
+        lote = sys.argv[2] if len(sys.argv) > 2 else "1"
+        if not (lote.isascii() and lote.isdigit() and int(lote) > 0):
+            print(f"❌ Erro: N deve ser um número inteiro positivo, não {lote!r}.", file=sys.stderr)
+            sys.exit(2)
+        lote = int(lote)
+        sys.exit(validar_coprocesso(sys.stdin, sys.stdout, lote, sys.stderr))
+    if len(sys.argv) > 1:
+        sys.exit(validar_argumentos(sys.argv[1:]))
     try:
         main()
     except KeyboardInterrupt:
@@ -0,0 +1,92 @@
+"""
+Benchmark do Conjunto de CPFs
+Autor: Felipe Alcântara
+Descrição: Compara o ConjuntoCPF (bases ordenadas mapeadas em memória com
+índice esparso) com um set de str carregado de um arquivo de texto: tempo
+de abertura, memória, consulta avulsa (acertos e erros) e interseção com uma
+coluna inteira.
+
+Uso:
+    python benchmarks/bench_conjunto.py [quantidade] [consultas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.conjunto import ConjuntoCPF, construir_conjunto  # noqa: E402
+from cpf.lote import FORMATO_MASCARA, gerar_lote  # noqa: E402
+from cpf.matriz import np  # noqa: E402
+
+
+def abrir(funcao):
+    """Executa a abertura e devolve (objeto, segundos, bytes alocados no heap do Python)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    objeto = funcao()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objeto, segundos, memoria
+
+
+def carregar_set(caminho):
+    with open(caminho, encoding="ascii") as arquivo:
+        return set(arquivo.read().splitlines())
+
+
+def por_consulta(funcao, consultas):
+    """Microssegundos por consulta, melhor de 3."""
+    return min(timeit.repeat(lambda: [funcao(cpf) for cpf in consultas], number=1, repeat=3)) / len(consultas) * 1e6
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    total_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        texto = os.path.join(pasta, "bloqueio.txt")
+        binario = os.path.join(pasta, "bloqueio.cpfset")
+        with open(texto, "wb") as arquivo:
+            arquivo.write(gerar_lote(quantidade, formato=FORMATO_MASCARA))
+
+        inicio = time.perf_counter()
+        with open(texto, "rb") as entrada:
+            _, distintos = construir_conjunto(entrada, binario)
+        print(f"{quantidade:,} CPFs ({distintos:,} distintos); construção do arquivo em "
+              f"{time.perf_counter() - inicio:.2f} s, {os.path.getsize(binario) / 2**20:.1f} MiB no disco\n")
+
+        lista, segundos_set, memoria_set = abrir(lambda: carregar_set(texto))
+        conjunto, segundos_conjunto, memoria_conjunto = abrir(lambda: ConjuntoCPF(binario))
+
+        amostra = list(lista)[:total_consultas // 2]
+        ausentes = gerar_lote(total_consultas // 2, formato=FORMATO_MASCARA).decode().splitlines()
+        consultas = amostra + ausentes
+        assert [cpf in conjunto for cpf in consultas] == [cpf in lista for cpf in consultas]
+
+        coluna = np.array(consultas, dtype=object)
+        resultados = {}
+        for nome, teste in [("set", lambda: np.array([cpf in lista for cpf in coluna])),
+                            ("ConjuntoCPF", lambda: conjunto.intersectar(coluna))]:
+            resultados[nome] = min(timeit.repeat(teste, number=1, repeat=3))
+        assert (conjunto.intersectar(coluna) == np.array([cpf in lista for cpf in coluna])).all()
+
+        print(f"{'':<14} {'abertura':>10} {'memória':>12} {'acerto':>10} {'erro':>10} {'intersectar':>16}")
+        for nome, segundos, memoria, contem in [
+            ("set de str", segundos_set, memoria_set, lista.__contains__),
+            ("ConjuntoCPF", segundos_conjunto, memoria_conjunto, conjunto.contem),
+        ]:
+            chave = "set" if nome == "set de str" else "ConjuntoCPF"
+            print(f"{nome:<14} {segundos:>8.3f} s {memoria / 2**20:>8.1f} MiB"
+                  f" {por_consulta(contem, amostra):>7.2f} µs {por_consulta(contem, ausentes):>7.2f} µs"
+                  f" {len(consultas) / resultados[chave]:>10,.0f} CPFs/s")
+        conjunto.fechar()
+
+
+if __name__ == "__main__":
+    main()
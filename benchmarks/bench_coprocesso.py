@@ -0,0 +1,70 @@
+"""
+Benchmark do Validador como Coprocesso
+Autor: Felipe Alcântara
+Descrição: Compara três jeitos de outro programa validar CPFs com o
+"Validador de CPF.py": um processo novo por CPF, um coprocesso aberto
+respondendo um CPF por vez (pergunta e resposta pelo pipe) e um coprocesso
+recebendo o arquivo inteiro de uma vez.
+
+Uso:
+    python benchmarks/bench_coprocesso.py [quantidade]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.lote import gerar_lote  # noqa: E402
+
+VALIDADOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "Versão no terminal", "Validador de CPF.py")
+
+
+def processo_por_cpf(cpfs):
+    """Um processo novo para cada CPF, como em um laço de shell."""
+    for cpf in cpfs:
+        subprocess.run([sys.executable, VALIDADOR, cpf], stdout=subprocess.DEVNULL, check=False)
+
+
+def pergunta_e_resposta(cpfs):
+    """Um coprocesso aberto; cada CPF espera a resposta antes do próximo."""
+    processo = subprocess.Popen([sys.executable, VALIDADOR, "--coprocesso"], stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    respostas = []
+    for cpf in cpfs:
+        processo.stdin.write(cpf + "\n")
+        respostas.append(processo.stdout.readline())
+    processo.stdin.close()
+    processo.wait()
+    assert all(resposta.endswith("\tvalido\n") for resposta in respostas)
+
+
+def arquivo_inteiro(dados):
+    """Um coprocesso recebendo tudo pelo pipe, com flush a cada 4096 respostas."""
+    resultado = subprocess.run([sys.executable, VALIDADOR, "--coprocesso", "4096"], input=dados,
+                               capture_output=True, check=True)
+    assert resultado.stdout.count(b"\tvalido\n") == dados.count(b"\n")
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    dados = gerar_lote(quantidade)
+    cpfs = dados.decode().splitlines()
+
+    cenarios = [
+        ("processo por CPF", lambda: processo_por_cpf(cpfs[:100]), 100),
+        ("coprocesso, pergunta e resposta", lambda: pergunta_e_resposta(cpfs[:20_000]), min(quantidade, 20_000)),
+        ("coprocesso, arquivo inteiro", lambda: arquivo_inteiro(dados), quantidade),
+    ]
+    for nome, cenario, total in cenarios:
+        inicio = time.perf_counter()
+        cenario()
+        segundos = time.perf_counter() - inicio
+        print(f"{nome:<34} {total / segundos:>10,.0f} CPFs/s  {segundos / total * 1e6:>10,.1f} µs por CPF")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark dos Dígitos Verificadores
+Autor: Felipe Alcântara
+Descrição: Compara o motor de tabelas do pacote cpf com as funções originais
+copiadas nos scripts de terminal.
+
+Uso:
+    python benchmarks/bench_digitos.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores  # noqa: E402
+
+
+def calcular_primeiro_digito_original(digitos):
+    """Versão original, com expressão geradora."""
+    soma = sum(digitos[i] * (10 - i) for i in range(9))
+    resto = soma % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def calcular_segundo_digito_original(digitos, primeiro_digito):
+    """Versão original, que aloca uma nova lista a cada chamada."""
+    digitos_completos = digitos + [primeiro_digito]
+    soma = sum(digitos_completos[i] * (11 - i) for i in range(10))
+    resto = soma % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def original(bases):
+    for digitos in bases:
+        primeiro = calcular_primeiro_digito_original(digitos)
+        calcular_segundo_digito_original(digitos, primeiro)
+
+
+def tabelas(bases):
+    for digitos in bases:
+        calcular_digitos_verificadores(digitos)
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bases = [[random.randint(0, 9) for _ in range(9)] for _ in range(quantidade)]
+
+    # Confere que as duas implementações concordam antes de medir
+    for digitos in bases[:10_000]:
+        primeiro = calcular_primeiro_digito_original(digitos)
+        esperado = (primeiro, calcular_segundo_digito_original(digitos, primeiro))
+        assert calcular_digitos_verificadores(digitos) == esperado, digitos
+
+    tempo_original = min(timeit.repeat(lambda: original(bases), number=1, repeat=5))
+    tempo_tabelas = min(timeit.repeat(lambda: tabelas(bases), number=1, repeat=5))
+    aceleracao = tempo_original / tempo_tabelas
+
+    print(f"CPFs por rodada:      {quantidade:,}")
+    print(f"Original:             {quantidade / tempo_original:>14,.0f} CPFs/s")
+    print(f"Tabelas (uma passada):{quantidade / tempo_tabelas:>14,.0f} CPFs/s")
+    print(f"Aceleração:           {aceleracao:.2f}x")
+
+    if aceleracao <= 1:
+        print("❌ O motor de tabelas não foi mais rápido que o original.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark do Formato Empacotado
+Autor: Felipe Alcântara
+Descrição: Compara o espaço de uma coleção de CPFs como lista de str, como
+texto com máscara e no formato empacotado (uint32), e mede a vazão das
+conversões entre eles e da leitura pelo arquivo mapeado em memória.
+
+Uso:
+    python benchmarks/bench_empacotado.py [quantidade]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.empacotado import (  # noqa: E402
+    ArquivoEmpacotado,
+    desempacotar,
+    desempacotar_textos,
+    empacotar,
+    empacotar_registros,
+    gravar_empacotado,
+)
+from cpf.lote import FORMATO_MASCARA, gerar_lote  # noqa: E402
+
+
+def medir(nome, funcao, quantidade):
+    """Executa a função uma vez e exibe a vazão em CPFs/s."""
+    inicio = time.perf_counter()
+    resultado = funcao()
+    tempo = time.perf_counter() - inicio
+    print(f"{nome:<38} {quantidade / tempo:>14,.0f} CPFs/s")
+    return resultado
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    texto = gerar_lote(quantidade, formato=FORMATO_MASCARA)
+
+    tracemalloc.start()
+    textos = texto.decode("ascii").splitlines()
+    memoria_lista = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{quantidade:,} CPFs\n")
+    bases = medir("registros com máscara -> empacotado", lambda: empacotar_registros(texto, FORMATO_MASCARA),
+                  quantidade)
+    medir("lista de str -> empacotado", lambda: empacotar(textos), quantidade)
+    assert medir("empacotado -> registros com máscara", lambda: desempacotar(bases, FORMATO_MASCARA),
+                 quantidade) == texto
+    medir("empacotado -> lista de str", lambda: desempacotar_textos(bases, FORMATO_MASCARA), quantidade)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "cpfs.pak")
+        medir("gravar arquivo (com índice de regiões)", lambda: gravar_empacotado(caminho, bases, True), quantidade)
+        with ArquivoEmpacotado(caminho) as arquivo:
+            medir("arquivo mapeado -> registros", lambda: b"".join(arquivo.blocos(FORMATO_MASCARA)), quantidade)
+            amostra = min(quantidade, 200_000)
+            medir("arquivo.cpf(i) avulso (sem NumPy)", lambda: [arquivo.cpf(i) for i in range(amostra)], amostra)
+        tamanho_arquivo = os.path.getsize(caminho)
+
+    print(f"\n{'Espaço':<38} {'bytes/CPF':>14}")
+    for nome, tamanho in [
+        ("lista de str (memória)", memoria_lista),
+        ("texto com máscara", len(texto)),
+        ("empacotado (memória)", bases.nbytes),
+        ("empacotado (arquivo)", tamanho_arquivo),
+    ]:
+        print(f"{nome:<38} {tamanho / quantidade:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark do Tempo de Importação
+Autor: Felipe Alcântara
+Descrição: Roda cada ponto de entrada com "python -X importtime" e soma o
+tempo gasto importando módulos além dos que o próprio interpretador já
+carrega na partida ("python -c pass"). Falha (código de saída 1) se algum
+ponto de entrada passar do seu limite ou importar um backend pesado, como
+o NumPy, que só deve ser carregado no primeiro uso em lote.
+
+Uso:
+    python benchmarks/bench_importacao.py [repeticoes]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TERMINAL = os.path.join(RAIZ, "Versão no terminal")
+
+# Módulos que nenhum ponto de entrada leve pode importar na partida
+PROIBIDOS = {"numpy", "pyarrow", "pandas", "asyncio"}
+
+# (nome, argumentos do python, entrada padrão, limite em ms das importações extras)
+PONTOS_DE_ENTRADA = [
+    ("import cpf", ["-c", "import cpf"], None, 8),
+    ("cpf.validacao", ["-c", "import cpf.validacao"], None, 20),
+    ("Validador de CPF.py CPF", [os.path.join(TERMINAL, "Validador de CPF.py"), "529.982.247-25"], None, 20),
+    ("Gerador de CPF.py", [os.path.join(TERMINAL, "Gerador de CPF.py")], None, 15),
+    ("Gerador de CPF por Região.py", [os.path.join(TERMINAL, "Gerador de CPF por Região.py")], "\n8\nN\n", 15),
+    ("python -m cpf --help", ["-m", "cpf", "--help"], None, 45),
+]
+
+
+def importacoes(argumentos, entrada=None):
+    """
+    Roda o python com -X importtime e lê o tempo próprio de cada módulo.
+
+    Returns:
+        tuple: (dict módulo -> microssegundos, segundos de parede do processo)
+    """
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", *argumentos],
+        cwd=RAIZ, input=entrada, capture_output=True, text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    segundos = time.perf_counter() - inicio
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if linha.startswith("import time:") and "|" in linha and "self [us]" not in linha:
+            proprio, _, nome = linha[len("import time:"):].split("|")
+            tempos[nome.strip()] = int(proprio)
+    return tempos, segundos
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    base = set()
+    partidas = []
+    for _ in range(repeticoes):
+        tempos, segundos = importacoes(["-c", "pass"])
+        base |= set(tempos)
+        partidas.append(segundos)
+    partida = statistics.median(partidas)
+    print(f"Partida do interpretador (python -c pass): {partida * 1000:.1f} ms\n")
+    print(f"{'Ponto de entrada':<30} {'módulos':>8} {'importação':>12} {'limite':>8} {'processo':>10}")
+
+    falhas = []
+    for nome, argumentos, entrada, limite in PONTOS_DE_ENTRADA:
+        extras, totais, processos = set(), [], []
+        for _ in range(repeticoes):
+            tempos, segundos = importacoes(argumentos, entrada)
+            novos = {modulo: tempo for modulo, tempo in tempos.items() if modulo not in base}
+            extras |= set(novos)
+            totais.append(sum(novos.values()) / 1000)
+            processos.append(segundos)
+
+        total = statistics.median(totais)
+        proibidos = sorted(modulo for modulo in extras if modulo.split(".")[0] in PROIBIDOS)
+        situacao = "ok"
+        if total > limite:
+            situacao = "LENTO"
+            falhas.append(f"{nome}: {total:.1f} ms de importação (limite {limite} ms)")
+        if proibidos:
+            situacao = "PESADO"
+            falhas.append(f"{nome}: importa {', '.join(proibidos)} na partida")
+        print(f"{nome:<30} {len(extras):>8} {total:>9.1f} ms {limite:>5} ms "
+              f"{(statistics.median(processos) - partida) * 1000:>+7.1f} ms  {situacao}")
+
+    if falhas:
+        print("\nRegressões:\n  " + "\n  ".join(falhas))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
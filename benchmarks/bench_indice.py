@@ -0,0 +1,102 @@
+"""
+Benchmark do Índice Pré-calculado
+Autor: Felipe Alcântara
+Descrição: Mede a latência de consulta ao índice mapeado em memória contra o
+cálculo direto dos verificadores, e quanto do arquivo fica residente na
+memória (páginas do page cache mapeadas pelo processo) após as consultas.
+
+Uso:
+    python benchmarks/bench_indice.py [bases_no_indice] [consultas]
+
+Sem argumentos, gera um índice de 10^8 bases (100 MB). Use 1000000000 para
+o índice completo de 1 GB.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores  # noqa: E402
+from cpf.indice import IndiceVerificadores, gerar_indice  # noqa: E402
+from cpf.matriz import np  # noqa: E402
+
+
+def memoria_residente(caminho):
+    """Rss (em KiB) do mapeamento do arquivo, lido de /proc/self/smaps."""
+    try:
+        with open("/proc/self/smaps") as smaps:
+            linhas = smaps.read().splitlines()
+    except OSError:
+        return None
+
+    dentro = False
+    for linha in linhas:
+        if linha[0].isalnum() and "-" in linha.split()[0] and ":" not in linha.split()[0]:
+            dentro = linha.endswith(caminho)
+        elif dentro and linha.startswith("Rss:"):
+            return int(linha.split()[1])
+    return None
+
+
+def formatar_residente(kib, total):
+    """Texto do footprint, ou n/d quando /proc não está disponível."""
+    if kib is None:
+        return "n/d"
+    return f"{kib / 1024:,.1f} MiB ({kib * 1024 / total:.1%} do arquivo)"
+
+
+def main():
+    bases = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "indice.bin")
+
+        inicio = time.perf_counter()
+        gerar_indice(caminho, bases)
+        print(f"Geração de {bases:,} bases: {time.perf_counter() - inicio:.1f} s "
+              f"({os.path.getsize(caminho) / 2**20:,.0f} MiB)")
+
+        sorteadas = [random.randrange(bases) for _ in range(consultas)]
+        textos = [f"{base:09d}" for base in sorteadas]
+        digitos = [list(map(int, texto)) for texto in textos]
+
+        with IndiceVerificadores(caminho) as indice:
+            print(f"Residente após abrir:      {formatar_residente(memoria_residente(caminho), bases)}")
+
+            for base, lista in zip(sorteadas[:1000], digitos):
+                assert indice.verificadores(base) == calcular_digitos_verificadores(lista)
+
+            tempos = {
+                "cálculo direto (lista)": min(timeit.repeat(
+                    lambda: [calcular_digitos_verificadores(d) for d in digitos], number=1, repeat=5)),
+                "cálculo direto (texto)": min(timeit.repeat(
+                    lambda: [calcular_digitos_verificadores(list(map(int, t[:9]))) for t in textos],
+                    number=1, repeat=5)),
+                "índice (inteiro)": min(timeit.repeat(
+                    lambda: [indice.verificadores(b) for b in sorteadas], number=1, repeat=5)),
+                "índice (texto)": min(timeit.repeat(
+                    lambda: [indice.verificadores_texto(t) for t in textos], number=1, repeat=5)),
+            }
+
+            vetor = np.array(sorteadas)
+            tempo_lote = min(timeit.repeat(lambda: indice.verificadores_lote(vetor), number=1, repeat=5))
+
+            print(f"Residente após {consultas:,} consultas: "
+                  f"{formatar_residente(memoria_residente(caminho), bases)}")
+
+        print()
+        base = tempos["cálculo direto (lista)"]
+        for nome, tempo in tempos.items():
+            print(f"{nome:<24} {tempo / consultas * 1e9:>8.0f} ns/consulta  ({base / tempo:.2f}x)")
+        print(f"{'índice (lote NumPy)':<24} {tempo_lote / consultas * 1e9:>8.0f} ns/consulta  "
+              f"({base / tempo_lote:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
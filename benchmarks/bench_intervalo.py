@@ -0,0 +1,53 @@
+"""
+Benchmark da Enumeração de Intervalos
+Autor: Felipe Alcântara
+Descrição: Compara enumerar_cpfs, que reaproveita as somas entre bases
+vizinhas, com o cálculo completo de cada base do intervalo.
+
+Uso:
+    python benchmarks/bench_intervalo.py [quantidade_de_bases]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores, formatar_cpf  # noqa: E402
+from cpf.intervalo import enumerar_cpfs  # noqa: E402
+
+
+def enumerar_recalculando(inicio, fim, regiao=None):
+    """Calcula cada base do zero, como os geradores fazem para um CPF avulso."""
+    for base in range(inicio, fim + 1):
+        if regiao is not None and base % 10 != regiao:
+            continue
+        digitos = list(map(int, f"{base:09d}"))
+        if len(set(digitos)) == 1:
+            continue
+        yield formatar_cpf(digitos, *calcular_digitos_verificadores(digitos))
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    inicio = 123_000_000
+    fim = inicio + quantidade - 1
+
+    assert list(enumerar_cpfs(inicio, inicio + 9999)) == list(enumerar_recalculando(inicio, inicio + 9999))
+
+    for regiao in (None, 8):
+        recalculando = min(timeit.repeat(
+            lambda: sum(1 for _ in enumerar_recalculando(inicio, fim, regiao)), number=1, repeat=3))
+        incremental = min(timeit.repeat(
+            lambda: sum(1 for _ in enumerar_cpfs(inicio, fim, regiao)), number=1, repeat=3))
+        gerados = quantidade if regiao is None else quantidade // 10
+
+        print(f"{quantidade:,} bases, região {'todas' if regiao is None else regiao}:")
+        print(f"  recalculando cada base: {gerados / recalculando:>12,.0f} CPFs/s")
+        print(f"  enumerar_cpfs:          {gerados / incremental:>12,.0f} CPFs/s"
+              f"  ({recalculando / incremental:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
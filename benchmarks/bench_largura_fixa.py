@@ -0,0 +1,46 @@
+"""
+Benchmark da Validação de Largura Fixa
+Autor: Felipe Alcântara
+Descrição: Compara a leitura em blocos de fluxo.validar_arquivo com o arquivo
+mapeado em memória de largura_fixa, nos layouts com e sem máscara.
+
+Uso:
+    python benchmarks/bench_largura_fixa.py [registros]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.fluxo import validar_arquivo  # noqa: E402
+from cpf.largura_fixa import validar_largura_fixa  # noqa: E402
+from cpf.lote import FORMATO_MASCARA, FORMATO_NUMEROS, gerar_lote  # noqa: E402
+
+
+def main():
+    registros = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    for formato in (FORMATO_MASCARA, FORMATO_NUMEROS):
+        with tempfile.NamedTemporaryFile(suffix=".txt") as arquivo:
+            for inicio in range(0, registros, 1_000_000):
+                arquivo.write(gerar_lote(min(1_000_000, registros - inicio), formato=formato))
+            arquivo.flush()
+
+            with open(arquivo.name, "rb") as entrada:
+                estatisticas = validar_arquivo(entrada)
+            vazao_fluxo = estatisticas.linhas / estatisticas.segundos
+
+            inicio = time.perf_counter()
+            validos, _ = validar_largura_fixa(arquivo.name)
+            vazao_mmap = len(validos) / (time.perf_counter() - inicio)
+
+        print(f"Layout {formato}:")
+        print(f"  fluxo (blocos de 8 MiB):   {vazao_fluxo:>14,.0f} registros/s")
+        print(f"  largura fixa (mmap):       {vazao_mmap:>14,.0f} registros/s  ({vazao_mmap / vazao_fluxo:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark do Normalizador de CPF
+Autor: Felipe Alcântara
+Descrição: Compara o limpar_cpf do núcleo com as versões com regex que
+existiam em "Validador de CPF.py" e em docs/gerador.py (que fazia o
+import re dentro da função), usando uma mistura realista de entradas.
+
+Uso:
+    python benchmarks/bench_limpar.py [quantidade]
+"""
+
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import formatar_cpf, limpar_cpf  # noqa: E402
+
+
+def limpar_cpf_regex(cpf):
+    """Versão do terminal, com regex."""
+    return re.sub(r'\D', '', cpf)
+
+
+def limpar_cpf_web(cpf):
+    """Versão web, que importava re a cada chamada."""
+    import re
+    return re.sub(r'\D', '', cpf)
+
+
+def montar_entradas(quantidade):
+    """Mistura de formatos, com pesos parecidos com os de uma base real."""
+    entradas = []
+    for _ in range(quantidade):
+        digitos = [random.randint(0, 9) for _ in range(11)]
+        mascara = formatar_cpf(digitos[:9], digitos[9], digitos[10])
+        numeros = "".join(map(str, digitos))
+        entradas.append(random.choices(
+            [
+                numeros,                                  # 11 dígitos
+                mascara,                                  # XXX.XXX.XXX-XX
+                f" {mascara} ",                           # espaços nas pontas
+                f"{numeros[:9]}-{numeros[9:]}",           # máscara parcial
+                f"{numeros[:3]} {numeros[3:6]} {numeros[6:9]} {numeros[9:]}",
+                numeros[:random.randint(0, 10)],          # incompleto
+                f"CPF: {mascara}",                        # texto junto
+                mascara.replace(".", "·"),                # caractere fora do ASCII
+                "",                                       # vazio
+            ],
+            weights=[40, 35, 6, 5, 4, 4, 3, 2, 1],
+        )[0])
+    return entradas
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    entradas = montar_entradas(quantidade)
+
+    for entrada in entradas:
+        assert limpar_cpf(entrada) == limpar_cpf_regex(entrada), entrada
+
+    tempos = {}
+    for nome, funcao in [("regex (terminal)", limpar_cpf_regex),
+                         ("regex + import (web)", limpar_cpf_web),
+                         ("núcleo (caminhos rápidos)", limpar_cpf)]:
+        tempos[nome] = min(timeit.repeat(lambda: [funcao(e) for e in entradas], number=1, repeat=5))
+
+    base = tempos["regex (terminal)"]
+    for nome, tempo in tempos.items():
+        print(f"{nome:<27} {quantidade / tempo:>14,.0f} CPFs/s  ({base / tempo:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark da Geração em Lote
+Autor: Felipe Alcântara
+Descrição: Compara a vazão de gerar_lote com o caminho de um CPF por vez
+usado em "Gerador de CPF.py" (random.randint por dígito + formatar_cpf).
+
+Uso:
+    python benchmarks/bench_lote.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores, formatar_cpf  # noqa: E402
+from cpf.lote import FORMATO_DIGITOS, FORMATO_MASCARA, FORMATO_NUMEROS, gerar_lote  # noqa: E402
+
+
+def gerar_um_por_vez(quantidade):
+    """Caminho atual dos scripts de terminal, sem a parte de exibição."""
+    cpfs = []
+    for _ in range(quantidade):
+        digitos = [random.randint(0, 9) for _ in range(9)]
+        primeiro, segundo = calcular_digitos_verificadores(digitos)
+        cpfs.append(formatar_cpf(digitos, primeiro, segundo))
+    return cpfs
+
+
+def medir(funcao, quantidade):
+    inicio = time.perf_counter()
+    funcao(quantidade)
+    return quantidade / (time.perf_counter() - inicio)
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    quantidade_lenta = min(quantidade, 200_000)
+
+    vazao_original = medir(gerar_um_por_vez, quantidade_lenta)
+    print(f"Um por vez (randint):        {vazao_original:>14,.0f} CPFs/s  ({quantidade_lenta:,} CPFs)")
+
+    for formato in (FORMATO_MASCARA, FORMATO_NUMEROS, FORMATO_DIGITOS):
+        vazao = medir(lambda n: gerar_lote(n, formato=formato), quantidade)
+        print(f"gerar_lote ({formato + ')':<9}        {vazao:>14,.0f} CPFs/s"
+              f"  ({vazao / vazao_original:.0f}x)")
+
+    vazao = medir(lambda n: gerar_lote(n, regiao=8), quantidade)
+    print(f"gerar_lote (região 8)       {vazao:>14,.0f} CPFs/s  ({vazao / vazao_original:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
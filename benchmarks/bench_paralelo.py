@@ -0,0 +1,60 @@
+"""
+Benchmark de Escalabilidade da Validação Paralela
+Autor: Felipe Alcântara
+Descrição: Mede a vazão de validar_arquivo_paralelo de 1 até N processos e
+confere que a saída anotada é idêntica em todos os casos.
+
+Uso:
+    python benchmarks/bench_paralelo.py [linhas] [max_processos]
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.lote import gerar_lote  # noqa: E402
+from cpf.paralelo import validar_arquivo_paralelo  # noqa: E402
+
+
+class Resumo:
+    """Saída binária que só calcula o hash do que recebe."""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+
+    def write(self, dados):
+        self.hash.update(dados)
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    contagens = sorted({1, *(2 ** i for i in range(maximo.bit_length()) if 2 ** i <= maximo), maximo})
+
+    with tempfile.NamedTemporaryFile(suffix=".txt") as arquivo:
+        for inicio in range(0, linhas, 1_000_000):
+            arquivo.write(gerar_lote(min(1_000_000, linhas - inicio)))
+        arquivo.flush()
+        tamanho_mb = os.path.getsize(arquivo.name) / 1e6
+        print(f"Arquivo: {linhas:,} linhas, {tamanho_mb:,.0f} MB")
+        print(f"{'Processos':>9} {'linhas/s':>14} {'MB/s':>9} {'Aceleração':>11} {'Eficiência':>11}")
+
+        base = None
+        referencia = None
+        for processos in contagens:
+            saida = Resumo()
+            estatisticas = validar_arquivo_paralelo(arquivo.name, processos, anotado=saida)
+            vazao = estatisticas.linhas / estatisticas.segundos
+            base = base or vazao
+            digest = saida.hash.hexdigest()
+            referencia = referencia or digest
+            assert digest == referencia, f"Saída diferente com {processos} processos"
+            print(f"{processos:>9} {vazao:>14,.0f} {tamanho_mb / estatisticas.segundos:>9,.1f}"
+                  f" {vazao / base:>10.2f}x {vazao / base / processos:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark do Resultado da Validação
+Autor: Felipe Alcântara
+Descrição: Compara o validar_cpf antigo, que montava um dicionário com
+vários f-strings a cada chamada, com o ResultadoValidacao de campos
+preguiçosos e com o caminho só booleano cpf_valido. Mede chamadas por
+segundo e memória alocada por resultado mantido (tracemalloc).
+
+Uso:
+    python benchmarks/bench_resultado.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf import calcular_digitos_verificadores, formatar_cpf, limpar_cpf  # noqa: E402
+from cpf.validacao import cpf_valido, validar_cpf  # noqa: E402
+
+REGIOES = {digito: f"Região {digito}" for digito in range(10)}
+
+# Rodadas de medição de cada caminho
+REPETICOES = 9
+
+
+def validar_cpf_dicionario(cpf):
+    """validar_cpf como era em "Validador de CPF.py", devolvendo um dicionário."""
+    cpf_limpo = limpar_cpf(cpf)
+    if len(cpf_limpo) != 11:
+        return False, {"erro": f"CPF deve ter 11 dígitos. Você digitou {len(cpf_limpo)} dígitos."}
+    if cpf_limpo == cpf_limpo[0] * 11:
+        return False, {"erro": "CPF não pode ser uma sequência de números iguais."}
+
+    digitos = [int(d) for d in cpf_limpo]
+    nove_digitos = digitos[:9]
+    primeiro_calculado, segundo_calculado = calcular_digitos_verificadores(nove_digitos)
+    if primeiro_calculado != digitos[9] or segundo_calculado != digitos[10]:
+        return False, {
+            "erro": "Dígitos verificadores inválidos",
+            "verificadores_informados": f"{digitos[9]}{digitos[10]}",
+            "verificadores_corretos": f"{primeiro_calculado}{segundo_calculado}"
+        }
+
+    return True, {
+        "cpf_formatado": f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:11]}",
+        "nove_primeiros": ' '.join(map(str, nove_digitos)),
+        "primeiro_verificador": primeiro_calculado,
+        "segundo_verificador": segundo_calculado,
+        "nono_digito": digitos[8],
+        "regiao_fiscal": REGIOES[digitos[8]]
+    }
+
+
+def montar_entradas(quantidade):
+    """90% válidos, o resto com verificador errado."""
+    entradas = []
+    for _ in range(quantidade):
+        digitos = [random.randint(0, 9) for _ in range(9)]
+        primeiro, segundo = calcular_digitos_verificadores(digitos)
+        if random.random() < 0.1:
+            segundo = (segundo + 1) % 10
+        entradas.append(formatar_cpf(digitos, primeiro, segundo))
+    return entradas
+
+
+def memoria_por_resultado(funcao, entradas):
+    """Bytes alocados por resultado, mantendo todos os resultados vivos."""
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    resultados = [funcao(cpf) for cpf in entradas]
+    depois, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultados
+    return (depois - antes) / len(entradas)
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    entradas = montar_entradas(quantidade)
+
+    for cpf in entradas[:10_000]:
+        valido, informacoes = validar_cpf_dicionario(cpf)
+        resultado = validar_cpf(cpf)
+        assert valido == resultado.valido == cpf_valido(cpf) == cpf_valido(cpf.replace(".", "").replace("-", ""))
+        assert informacoes.get("cpf_formatado", resultado.cpf_formatado) == resultado.cpf_formatado
+
+    caminhos = [
+        ("dicionário (antigo)", validar_cpf_dicionario),
+        ("ResultadoValidacao", validar_cpf),
+        ("cpf_valido (bool)", cpf_valido),
+    ]
+    # Tempos medidos antes de ligar o tracemalloc, que deixa tudo mais lento.
+    # As repetições se alternam entre os caminhos para que uma oscilação da
+    # máquina não pese só sobre um deles; vale o menor tempo de cada um.
+    tempos = [float("inf")] * len(caminhos)
+    for _ in range(REPETICOES):
+        for i, (_, funcao) in enumerate(caminhos):
+            tempos[i] = min(tempos[i], timeit.timeit(lambda: [funcao(cpf) for cpf in entradas], number=1))
+    base = tempos[0]
+    for (nome, funcao), tempo in zip(caminhos, tempos):
+        memoria = memoria_por_resultado(funcao, entradas)
+        print(f"{nome:<21} {quantidade / tempo:>12,.0f} chamadas/s ({base / tempo:.2f}x)"
+              f"   {memoria:>6.0f} bytes por resultado")
+
+
+if __name__ == "__main__":
+    main()
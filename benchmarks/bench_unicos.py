@@ -0,0 +1,62 @@
+"""
+Benchmark de CPFs Únicos
+Autor: Felipe Alcântara
+Descrição: Compara a geração sem repetição por permutação (GeradorUnico)
+com o caminho atual: gerar_lote seguido de deduplicação com um set do
+Python. Mede vazão e pico de memória (tracemalloc).
+
+Uso:
+    python benchmarks/bench_unicos.py [quantidade]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpf.lote import TAMANHO_BLOCO, gerar_lote  # noqa: E402
+from cpf.unicos import GeradorUnico  # noqa: E402
+
+
+def deduplicar_com_set(quantidade, destino):
+    """Gera em blocos e descarta os repetidos guardando todos em um set."""
+    vistos = set()
+    while len(vistos) < quantidade:
+        bloco = gerar_lote(min(TAMANHO_BLOCO, quantidade - len(vistos)))
+        novos = [cpf for cpf in bytes(bloco).split(b"\n")[:-1] if cpf not in vistos]
+        vistos.update(novos)
+        destino.write(b"\n".join(novos) + b"\n")
+
+
+def por_permutacao(quantidade, destino):
+    """Gera pela permutação com chave; nada além do bloco atual fica em memória."""
+    for bloco in GeradorUnico(chave=2024).gerar(quantidade):
+        destino.write(bloco)
+
+
+def medir(funcao, quantidade):
+    """Devolve (segundos, pico de memória em bytes)."""
+    with open(os.devnull, "wb") as destino:
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        funcao(quantidade, destino)
+        segundos = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return segundos, pico
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+
+    print(f"{quantidade:,} CPFs distintos:")
+    for nome, funcao in [("gerar_lote + set", deduplicar_com_set),
+                         ("GeradorUnico (permutação)", por_permutacao)]:
+        segundos, pico = medir(funcao, quantidade)
+        print(f"  {nome:<26} {quantidade / segundos:>12,.0f} CPFs/s   pico de memória {pico / 2**20:>8,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark da Validação Vetorizada
+Autor: Felipe Alcântara
+Descrição: Compara validar_coluna com a chamada de validar_cpf linha a linha,
+como é feito hoje em "Validador de CPF.py".
+
+Uso:
+    python benchmarks/bench_vetorizado.py [quantidade]
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from cpf.lote import gerar_lote  # noqa: E402
+from cpf.matriz import np  # noqa: E402
+from cpf.motivos import Motivo  # noqa: E402
+from cpf.vetorizado import validar_coluna  # noqa: E402
+
+
+def carregar_validador():
+    """Importa "Validador de CPF.py", cujo nome não é um identificador válido."""
+    caminho = os.path.join(RAIZ, "Versão no terminal", "Validador de CPF.py")
+    especificacao = importlib.util.spec_from_file_location("validador_de_cpf", caminho)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+def montar_coluna(quantidade):
+    """Mistura CPFs válidos, com verificador trocado e sem máscara (dtype U)."""
+    cpfs = np.frombuffer(bytes(gerar_lote(quantidade)), dtype="S15").astype("U14")
+    cpfs[1::3] = np.char.replace(np.char.replace(cpfs[1::3], ".", ""), "-", "")
+    cpfs[2::3] = np.char.add(cpfs[2::3].astype("U13"), "9")
+    return cpfs
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    quantidade_lenta = min(quantidade, 200_000)
+    validador = carregar_validador()
+    coluna = montar_coluna(quantidade)
+
+    linhas = coluna[:quantidade_lenta].tolist()
+    inicio = time.perf_counter()
+    esperado = [validador.validar_cpf(cpf)[0] for cpf in linhas]
+    vazao_original = quantidade_lenta / (time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    validos, motivos = validar_coluna(coluna)
+    vazao = quantidade / (time.perf_counter() - inicio)
+
+    assert validos[:quantidade_lenta].tolist() == esperado
+    print(f"validar_cpf por linha:  {vazao_original:>14,.0f} linhas/s")
+    print(f"validar_coluna:         {vazao:>14,.0f} linhas/s  ({vazao / vazao_original:.0f}x)")
+    print(f"Motivos (contagem):     {np.bincount(motivos, minlength=len(Motivo)).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
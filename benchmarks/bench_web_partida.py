@@ -0,0 +1,160 @@
+"""
+Benchmark da Partida da Versão Web
+Autor: Felipe Alcântara
+Descrição: Mede, em um navegador headless (Chrome ou Chromium), o tempo
+desde o início da navegação até o primeiro CPF gerado na página, comparando
+a página original (Brython e biblioteca padrão completos do CDN) com o
+pacote local montado por docs/construir.py.
+
+A página, aberta com ?partida, clica em "Gerar CPF Aleatório" até o CPF
+aparecer e envia o tempo e os bytes baixados para este script, que serve
+a pasta docs. Cada repetição abre o navegador com um perfil novo, ou seja,
+sem cache.
+
+Uso:
+    python benchmarks/bench_web_partida.py [--navegador CAMINHO] [--repeticoes N] [--sem-cdn]
+"""
+
+import argparse
+import functools
+import glob
+import json
+import os
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCS = os.path.join(RAIZ, "docs")
+
+# Executáveis procurados no PATH, nesta ordem
+NAVEGADORES = ("chrome-headless-shell", "chromium", "chromium-browser", "google-chrome", "google-chrome-stable", "chrome")
+
+# (nome, caminho da página no servidor)
+PAGINAS = [
+    ("CDN completo", "/index.html"),
+    ("pacote local", "/dist/index.html"),
+]
+
+
+class Servidor(SimpleHTTPRequestHandler):
+    """Serve a pasta docs e recebe as medições enviadas pela página."""
+
+    def __init__(self, *args, medicoes, **kwargs):
+        self.medicoes = medicoes
+        super().__init__(*args, directory=DOCS, **kwargs)
+
+    def do_POST(self):
+        tamanho = int(self.headers.get("Content-Length", 0))
+        if self.path == "/partida":
+            self.medicoes.put(json.loads(self.rfile.read(tamanho)))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def localizar_navegador(caminho=None):
+    """
+    Encontra um Chrome ou Chromium para rodar em modo headless.
+
+    Args:
+        caminho (str | None): Executável escolhido pelo usuário
+
+    Returns:
+        str | None: Caminho do executável ou None se nenhum for encontrado
+    """
+    if caminho:
+        return caminho
+    for nome in NAVEGADORES:
+        encontrado = shutil.which(nome)
+        if encontrado:
+            return encontrado
+    # Navegadores baixados pelo Puppeteer
+    baixados = sorted(glob.glob(os.path.expanduser("~/.cache/puppeteer/chrome*/*/*/chrome*")))
+    executaveis = [arquivo for arquivo in baixados if os.access(arquivo, os.X_OK) and os.path.isfile(arquivo)]
+    return executaveis[-1] if executaveis else None
+
+
+def medir(navegador, url, medicoes, limite=120):
+    """
+    Abre a página em um perfil novo e espera a medição.
+
+    Args:
+        navegador (str): Executável do navegador
+        url (str): Endereço da página, com ?partida
+        medicoes (queue.Queue): Fila onde o servidor coloca as medições
+        limite (float): Segundos de espera pelo primeiro CPF
+
+    Returns:
+        dict: {"pagina", "ms", "recursos", "bytes"}
+
+    Raises:
+        TimeoutError: Se o primeiro CPF não aparecer a tempo
+        RuntimeError: Se o navegador fechar antes da medição
+    """
+    with tempfile.TemporaryDirectory() as perfil:
+        processo = subprocess.Popen(
+            [navegador, "--headless=new", "--no-sandbox", "--disable-gpu", "--no-first-run",
+             "--disable-extensions", f"--user-data-dir={perfil}", url],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            for _ in range(int(limite * 10)):
+                try:
+                    return medicoes.get(timeout=0.1)
+                except queue.Empty:
+                    if processo.poll() is not None:
+                        raise RuntimeError(f"o navegador terminou com código {processo.returncode} "
+                                           f"antes do primeiro CPF em {url}") from None
+            raise TimeoutError(f"nenhum CPF gerado em {limite} s em {url}")
+        finally:
+            processo.terminate()
+            processo.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo até o primeiro CPF na versão web.")
+    parser.add_argument("--navegador", help="executável do Chrome/Chromium (padrão: procurar no PATH)")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--sem-cdn", action="store_true", help="mede só o pacote local (sem rede)")
+    parser.add_argument("--brython", help="pasta com os arquivos do Brython, repassada a docs/construir.py")
+    args = parser.parse_args()
+
+    navegador = localizar_navegador(args.navegador)
+    if navegador is None:
+        sys.exit("Nenhum Chrome/Chromium encontrado; use --navegador.")
+
+    construcao = [sys.executable, os.path.join(DOCS, "construir.py")]
+    if args.brython:
+        construcao += ["--brython", args.brython]
+    subprocess.run(construcao, check=True)
+
+    medicoes = queue.Queue()
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(Servidor, medicoes=medicoes))
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    endereco = f"http://127.0.0.1:{servidor.server_address[1]}"
+
+    print(f"Navegador: {navegador}\n")
+    print(f"{'Página':<14} {'primeiro CPF (mediana)':>24} {'mínimo':>10} {'recursos':>9} {'baixado':>10}")
+    try:
+        for nome, caminho in PAGINAS:
+            if args.sem_cdn and caminho == "/index.html":
+                continue
+            resultados = [medir(navegador, f"{endereco}{caminho}?partida", medicoes)
+                          for _ in range(args.repeticoes)]
+            tempos = [resultado["ms"] for resultado in resultados]
+            print(f"{nome:<14} {statistics.median(tempos):>21,.0f} ms {min(tempos):>7,.0f} ms "
+                  f"{resultados[-1]['recursos']:>9} {resultados[-1]['bytes'] / 1024:>6,.0f} KiB")
+    finally:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Teste de Carga do Servidor
+Autor: Felipe Alcântara
+Descrição: Sobe "python -m cpf servir" em uma porta livre e dispara clientes
+asyncio simultâneos contra ele, com conexões keep-alive. Mede requisições/s
+em POST /validar e requisições/s e bytes/s em GET /cpfs, e acompanha a
+memória residente (VmRSS) do servidor enquanto clientes lentos leem a
+geração em fluxo, mostrando que ela não cresce com o tamanho da resposta.
+
+Uso:
+    python benchmarks/carga_servidor.py [--clientes N] [--duracao S] [--n CPFS]
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def iniciar_servidor():
+    """Sobe o servidor em uma porta livre e devolve (processo, host, porta)."""
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "cpf", "servir", "--porta", "0"],
+        cwd=RAIZ, stderr=subprocess.PIPE, text=True,
+    )
+    linha = processo.stderr.readline()
+    endereco = re.search(r"http://([^:]+):(\d+)", linha)
+    if endereco is None:
+        processo.kill()
+        raise RuntimeError(f"Servidor não subiu: {linha!r}")
+    return processo, endereco.group(1), int(endereco.group(2))
+
+
+def memoria_residente(pid):
+    """VmRSS do processo em KiB."""
+    with open(f"/proc/{pid}/status") as status:
+        for linha in status:
+            if linha.startswith("VmRSS:"):
+                return int(linha.split()[1])
+    return 0
+
+
+async def ler_resposta(leitor, atraso=0.0):
+    """Lê uma resposta (com ou sem chunked) e devolve o tamanho do corpo."""
+    status = await leitor.readline()
+    if not status.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(f"Resposta inesperada: {status!r}")
+    cabecalhos = {}
+    while (linha := await leitor.readline()) not in (b"\r\n", b""):
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+
+    if cabecalhos.get("transfer-encoding") != "chunked":
+        return len(await leitor.readexactly(int(cabecalhos["content-length"])))
+
+    total = 0
+    while tamanho := int(await leitor.readline(), 16):
+        await leitor.readexactly(tamanho + 2)
+        total += tamanho
+        if atraso:
+            await asyncio.sleep(atraso)
+    await leitor.readline()
+    return total
+
+
+async def cliente(host, porta, requisicao, fim, contadores, atraso=0.0):
+    """Repete a mesma requisição em uma conexão keep-alive até o prazo."""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        while time.perf_counter() < fim:
+            escritor.write(requisicao)
+            # O await fica fora do +=, senão os clientes perdem as somas uns dos outros
+            tamanho = await ler_resposta(leitor, atraso)
+            contadores[0] += 1
+            contadores[1] += tamanho
+    finally:
+        escritor.close()
+
+
+async def rodar(host, porta, requisicao, clientes, duracao, atraso=0.0, pid=None):
+    """Roda os clientes e devolve (requisições, bytes, segundos, pico de VmRSS)."""
+    contadores = [0, 0]
+    inicio = time.perf_counter()
+    tarefas = [asyncio.create_task(cliente(host, porta, requisicao, inicio + duracao, contadores, atraso))
+               for _ in range(clientes)]
+    pico = 0
+    while not all(tarefa.done() for tarefa in tarefas):
+        if pid is not None:
+            pico = max(pico, memoria_residente(pid))
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tarefas)
+    return contadores[0], contadores[1], time.perf_counter() - inicio, pico
+
+
+def requisicao_get(caminho):
+    return f"GET {caminho} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+
+
+def requisicao_post(caminho, corpo):
+    return (f"POST {caminho} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(corpo)}\r\n\r\n{corpo}").encode()
+
+
+async def principal(argumentos):
+    processo, host, porta = iniciar_servidor()
+    try:
+        print(f"Servidor em {host}:{porta}, {argumentos.clientes} clientes, {argumentos.duracao:.0f} s por cenário")
+        print(f"VmRSS do servidor parado: {memoria_residente(processo.pid) / 1024:.1f} MiB\n")
+
+        n = argumentos.n
+        cenarios = [
+            ("POST /validar", requisicao_post("/validar", '{"cpf": "529.982.247-25"}'), 0.0),
+            (f"GET /cpfs?n={n}", requisicao_get(f"/cpfs?n={n}"), 0.0),
+            (f"GET /cpfs?n={n}&saida=csv", requisicao_get(f"/cpfs?n={n}&saida=csv&formato=numeros"), 0.0),
+            (f"GET /cpfs?n={n * 100} (lento)", requisicao_get(f"/cpfs?n={n * 100}"), argumentos.atraso),
+        ]
+        for nome, requisicao, atraso in cenarios:
+            feitas, total, segundos, pico = await rodar(
+                host, porta, requisicao, argumentos.clientes, argumentos.duracao, atraso, processo.pid
+            )
+            print(f"{nome:<32} {feitas / segundos:>9,.1f} req/s {total / segundos / 2**20:>9.1f} MiB/s"
+                  f"   pico VmRSS {pico / 1024:>6.1f} MiB")
+    finally:
+        processo.terminate()
+        processo.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clientes", type=int, default=16, help="Conexões simultâneas (padrão: 16)")
+    parser.add_argument("--duracao", type=float, default=5.0, help="Segundos por cenário (padrão: 5)")
+    parser.add_argument("--n", type=int, default=100_000, help="CPFs por GET /cpfs (padrão: 100000)")
+    parser.add_argument("--atraso", type=float, default=0.01,
+                        help="Segundos que o cliente lento espera a cada pedaço (padrão: 0.01)")
+    asyncio.run(principal(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Linha de Comando do Pacote CPF
+Autor: Felipe Alcântara
+Descrição: Ponto de entrada não interativo, para uso em scripts e pipelines.
+
+Uso:
+    python -m cpf validar ARQUIVO|- [--coluna N|NOME] [--cabecalho]
+                          [--validos ARQ] [--invalidos ARQ] [--anotado ARQ]
+                          [--processos N]
+    python -m cpf validar ARQUIVO --formato fixo [--registro N] [--posicao P] [--largura 11|14]
+    python -m cpf conjunto ARQUIVO|- SAIDA [--coluna N|NOME] [--cabecalho]
+    python -m cpf servir [--host H] [--porta P] [--lote-maximo N] [--espera-maxima MS]
+"""
+
+import argparse
+import contextlib
+import sys
+
+
+def abrir_saida(caminho, pilha):
+    """
+    Abre um arquivo de saída binário, aceitando "-" para a saída padrão.
+
+    Args:
+        caminho (str | None): Caminho do arquivo, "-" ou None
+        pilha (contextlib.ExitStack): Pilha que fecha o arquivo no final
+
+    Returns:
+        Arquivo binário aberto ou None
+    """
+    if caminho is None:
+        return None
+    if caminho == "-":
+        return sys.stdout.buffer
+    return pilha.enter_context(open(caminho, "wb"))
+
+
+def inteiro_positivo(texto):
+    """Tipo do argparse para inteiros maiores que zero."""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inteiro inválido: {texto!r}") from None
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero, não {valor}")
+    return valor
+
+
+def inteiro_nao_negativo(texto):
+    """Tipo do argparse para inteiros maiores ou iguais a zero."""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inteiro inválido: {texto!r}") from None
+    if valor < 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a zero, não {valor}")
+    return valor
+
+
+def numero_nao_negativo(texto):
+    """Tipo do argparse para números (float) maiores ou iguais a zero."""
+    try:
+        valor = float(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inválido: {texto!r}") from None
+    if not valor >= 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a zero, não {valor}")
+    return valor
+
+
+def comando_validar(argumentos):
+    """
+    Valida a coluna de CPFs de um arquivo em fluxo e exibe a vazão no final.
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos do subcomando validar
+
+    Returns:
+        int: Código de saída do processo
+    """
+    from .fluxo import SEPARADORES, detectar_formato, validar_arquivo
+
+    if argumentos.processos != 1 and argumentos.arquivo == "-":
+        print("❌ Erro: a validação paralela precisa de um arquivo, não da entrada padrão.", file=sys.stderr)
+        return 2
+
+    formato = argumentos.formato or detectar_formato(argumentos.arquivo)
+    separador = argumentos.separador or SEPARADORES.get(formato)
+    if formato == "fixo" and (argumentos.arquivo == "-" or argumentos.processos != 1):
+        print("❌ Erro: o formato fixo mapeia o arquivo em memória e usa um único processo.", file=sys.stderr)
+        return 2
+    if not (argumentos.validos or argumentos.invalidos or argumentos.anotado):
+        argumentos.anotado = "-"
+
+    with contextlib.ExitStack() as pilha:
+        try:
+            opcoes = dict(
+                coluna=argumentos.coluna,
+                separador=separador,
+                cabecalho=argumentos.cabecalho,
+                validos=abrir_saida(argumentos.validos, pilha),
+                invalidos=abrir_saida(argumentos.invalidos, pilha),
+                anotado=abrir_saida(argumentos.anotado, pilha),
+                tamanho_bloco=argumentos.bloco,
+            )
+            if formato == "fixo":
+                from .largura_fixa import validar_arquivo_largura_fixa
+
+                del opcoes["coluna"], opcoes["cabecalho"], opcoes["tamanho_bloco"]
+                estatisticas = validar_arquivo_largura_fixa(
+                    argumentos.arquivo, argumentos.registro, argumentos.posicao, argumentos.largura, **opcoes
+                )
+            elif argumentos.processos != 1:
+                from .paralelo import validar_arquivo_paralelo
+
+                estatisticas = validar_arquivo_paralelo(argumentos.arquivo, argumentos.processos or None, **opcoes)
+            elif argumentos.arquivo == "-":
+                estatisticas = validar_arquivo(sys.stdin.buffer, **opcoes)
+            else:
+                estatisticas = validar_arquivo(pilha.enter_context(open(argumentos.arquivo, "rb")), **opcoes)
+        except (ValueError, OSError) as erro:
+            print(f"❌ Erro: {erro}", file=sys.stderr)
+            return 2
+
+    print(estatisticas.resumo(), file=sys.stderr)
+    return 0
+
+
+def comando_conjunto(argumentos):
+    """
+    Constrói o arquivo de um ConjuntoCPF a partir da coluna de CPFs de um arquivo.
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos do subcomando conjunto
+
+    Returns:
+        int: Código de saída do processo
+    """
+    from .conjunto import construir_conjunto
+    from .fluxo import SEPARADORES, detectar_formato
+
+    formato = argumentos.formato or detectar_formato(argumentos.arquivo)
+    separador = argumentos.separador or SEPARADORES.get(formato)
+
+    with contextlib.ExitStack() as pilha:
+        try:
+            if argumentos.arquivo == "-":
+                entrada = sys.stdin.buffer
+            else:
+                entrada = pilha.enter_context(open(argumentos.arquivo, "rb"))
+            estatisticas, quantidade = construir_conjunto(
+                entrada, argumentos.saida, argumentos.coluna, separador, argumentos.cabecalho, argumentos.bloco
+            )
+        except (ValueError, OSError) as erro:
+            print(f"❌ Erro: {erro}", file=sys.stderr)
+            return 2
+
+    print(estatisticas.resumo(), file=sys.stderr)
+    print(f"{quantidade:,} CPFs distintos gravados em {argumentos.saida}", file=sys.stderr)
+    return 0
+
+
+def comando_servir(argumentos):
+    """
+    Sobe o servidor HTTP/JSON de validação e geração até ser interrompido (Ctrl+C).
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos do subcomando servir
+
+    Returns:
+        int: Código de saída do processo
+    """
+    from .servidor import servir
+
+    def avisar(endereco):
+        print(f"Servidor em http://{endereco[0]}:{endereco[1]}", file=sys.stderr)
+
+    try:
+        servir(argumentos.host, argumentos.porta, argumentos.lote_maximo,
+               argumentos.espera_maxima / 1000, ao_iniciar=avisar)
+    except KeyboardInterrupt:
+        pass
+    except OSError as erro:
+        print(f"❌ Erro: {erro}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def criar_parser():
+    """
+    Monta o parser de argumentos com todos os subcomandos.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(prog="python -m cpf", description="Ferramentas de CPF em lote.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    validar = subcomandos.add_parser("validar", help="Valida uma coluna de CPFs de um arquivo em fluxo.")
+    validar.add_argument("arquivo", help='Arquivo CSV, TSV ou com um CPF por linha ("-" para a entrada padrão)')
+    validar.add_argument("--formato", choices=["csv", "tsv", "linhas", "fixo"],
+                         help="Formato da entrada (padrão: pela extensão do arquivo)")
+    validar.add_argument("--separador", help="Separador de campos, se diferente do padrão do formato")
+    validar.add_argument("--coluna", default="1", help="Número (a partir de 1) ou nome da coluna com o CPF")
+    validar.add_argument("--cabecalho", action="store_true", help="A primeira linha é um cabeçalho")
+    validar.add_argument("--validos", metavar="ARQ", help="Grava as linhas válidas neste arquivo")
+    validar.add_argument("--invalidos", metavar="ARQ", help="Grava as linhas inválidas neste arquivo")
+    validar.add_argument("--anotado", metavar="ARQ",
+                         help='Grava todas as linhas com o motivo como última coluna ("-" = saída padrão)')
+    validar.add_argument("--bloco", type=inteiro_positivo, default=8 << 20, help="Bytes lidos por vez (padrão: 8 MiB)")
+    validar.add_argument("--registro", type=inteiro_positivo,
+                         help="Formato fixo: bytes por registro, com a quebra de linha (padrão: detecta)")
+    validar.add_argument("--posicao", type=inteiro_nao_negativo, default=0,
+                         help="Formato fixo: posição do CPF no registro, a partir de 0 (padrão: 0)")
+    validar.add_argument("--largura", type=int, choices=[11, 14],
+                         help="Formato fixo: 11 (só dígitos) ou 14 (XXX.XXX.XXX-XX) (padrão: detecta)")
+    validar.add_argument("--processos", type=int, default=1,
+                         help="Processos em paralelo; 0 usa todos os núcleos (padrão: 1)")
+    validar.set_defaults(executar=comando_validar)
+
+    conjunto = subcomandos.add_parser("conjunto", help="Constrói um conjunto de CPFs (lista de bloqueio) mapeável.")
+    conjunto.add_argument("arquivo", help='Arquivo CSV, TSV ou com um CPF por linha ("-" para a entrada padrão)')
+    conjunto.add_argument("saida", help="Arquivo do conjunto a gravar")
+    conjunto.add_argument("--formato", choices=["csv", "tsv", "linhas"],
+                          help="Formato da entrada (padrão: pela extensão do arquivo)")
+    conjunto.add_argument("--separador", help="Separador de campos, se diferente do padrão do formato")
+    conjunto.add_argument("--coluna", default="1", help="Número (a partir de 1) ou nome da coluna com o CPF")
+    conjunto.add_argument("--cabecalho", action="store_true", help="A primeira linha é um cabeçalho")
+    conjunto.add_argument("--bloco", type=inteiro_positivo, default=8 << 20, help="Bytes lidos por vez (padrão: 8 MiB)")
+    conjunto.set_defaults(executar=comando_conjunto)
+
+    servir = subcomandos.add_parser("servir", help="Sobe um servidor HTTP/JSON local de validação e geração de CPFs.")
+    servir.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1)")
+    servir.add_argument("--porta", type=int, default=8080, help="Porta TCP (padrão: 8080)")
+    servir.add_argument("--lote-maximo", type=inteiro_positivo, default=1024,
+                        help="Máximo de CPFs avulsos validados juntos em um micro-lote (padrão: 1024)")
+    servir.add_argument("--espera-maxima", type=numero_nao_negativo, default=2.0,
+                        help="Milissegundos que um CPF espera o micro-lote encher (padrão: 2)")
+    servir.set_defaults(executar=comando_servir)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Função principal da linha de comando.
+
+    Args:
+        argv (list | None): Argumentos; None usa sys.argv
+
+    Returns:
+        int: Código de saída do processo
+    """
+    argumentos = criar_parser().parse_args(argv)
+    return argumentos.executar(argumentos)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Fluxos Aleatórios Reproduzíveis
+Autor: Felipe Alcântara
+Descrição: Deriva, a partir de uma única semente, fluxos aleatórios
+independentes para cada fatia de uma geração em lote.
+
+Cada fatia usa o filho de número igual ao seu índice na SeedSequence da
+semente, e não o filho do processo que a executa. Por isso a mesma semente
+gera o mesmo arquivo, byte a byte, com 1 ou N processos.
+"""
+
+import multiprocessing
+import os
+
+from .lote import FORMATO_DIGITOS, FORMATO_MASCARA, LARGURA, gerar_lote, validar_parametros
+from .matriz import np
+
+# Quantidade de CPFs de cada fatia da geração paralela (fixa, para que a
+# divisão do trabalho não dependa da quantidade de processos)
+CPFS_POR_FATIA = 1 << 20
+
+
+class FluxosAleatorios:
+    """
+    Família de geradores NumPy independentes derivados de uma semente.
+
+    Os fluxos não se sobrepõem (SeedSequence garante filhos independentes)
+    e o fluxo de índice i é sempre o mesmo para a mesma semente.
+
+    Atributos:
+        semente (int): Semente raiz
+    """
+
+    def __init__(self, semente):
+        self.semente = semente
+
+    def gerador(self, indice):
+        """
+        Devolve o gerador do fluxo de número indice.
+
+        Args:
+            indice (int): Número do fluxo (por exemplo, o da fatia)
+
+        Returns:
+            numpy.random.Generator: Gerador independente dos demais
+        """
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(self.semente, spawn_key=(indice,))))
+
+    def geradores(self, quantidade):
+        """
+        Devolve os geradores dos fluxos 0 até quantidade - 1.
+
+        Equivale a SeedSequence(semente).spawn(quantidade).
+
+        Args:
+            quantidade (int): Quantidade de fluxos
+
+        Returns:
+            list: Lista de numpy.random.Generator
+        """
+        return [self.gerador(indice) for indice in range(quantidade)]
+
+
+def _gerar_fatia(tarefa):
+    """Gera uma fatia com o fluxo do seu índice e grava na posição dela no arquivo."""
+    caminho, semente, indice, quantidade, regiao, formato = tarefa
+    gerador = FluxosAleatorios(semente).gerador(indice)
+    registros = gerar_lote(quantidade, regiao, formato, sortear_bytes=gerador.bytes)
+
+    with open(caminho, "r+b") as arquivo:
+        arquivo.seek(indice * CPFS_POR_FATIA * LARGURA[formato])
+        arquivo.write(registros)
+    return quantidade
+
+
+def gerar_arquivo(caminho, n, semente, processos=1, regiao=None, formato=FORMATO_MASCARA):
+    """
+    Gera um arquivo com N CPFs válidos de forma reproduzível e paralela.
+
+    O arquivo é dividido em fatias de CPFS_POR_FATIA registros de largura
+    fixa; cada processo grava as fatias que recebe direto na posição delas.
+
+    Args:
+        caminho (str): Arquivo de saída (sobrescrito)
+        n (int): Quantidade de CPFs
+        semente (int): Semente raiz; a mesma semente gera o mesmo arquivo
+        processos (int | None): Quantidade de processos (None: núcleos da máquina)
+        regiao (int | None): Dígito da região fiscal (0-9) ou None para aleatória
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+
+    Raises:
+        ValueError: Se a quantidade, a região ou o formato forem inválidos
+    """
+    if n < 0:
+        raise ValueError(f"A quantidade de CPFs não pode ser negativa ({n}).")
+    validar_parametros(regiao, formato)
+    if formato == FORMATO_DIGITOS:
+        raise ValueError("O formato 'digitos' não pode ser gravado em arquivo de texto.")
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.truncate(n * LARGURA[formato])
+
+    tarefas = [(caminho, semente, indice, min(CPFS_POR_FATIA, n - inicio), regiao, formato)
+               for indice, inicio in enumerate(range(0, n, CPFS_POR_FATIA))]
+
+    processos = processos or os.cpu_count() or 1
+    if processos == 1:
+        for tarefa in tarefas:
+            _gerar_fatia(tarefa)
+        return
+
+    with multiprocessing.Pool(processos) as pool:
+        for _ in pool.imap_unordered(_gerar_fatia, tarefas):
+            pass
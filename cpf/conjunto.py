@@ -0,0 +1,207 @@
+"""
+Conjunto de CPFs Mapeado em Memória
+Autor: Felipe Alcântara
+Descrição: Conjunto somente leitura de CPFs (por exemplo, uma lista de
+bloqueio) guardado como bases uint32 distintas e ordenadas em um arquivo
+empacotado, consultado direto do mmap.
+
+Um índice esparso com uma base a cada PASSO_INDICE fica em memória: a
+busca binária começa nele e termina dentro de um único trecho de 512
+bytes do arquivo. 50 milhões de CPFs ocupam 200 MB no disco (compartilhados
+pelo page cache entre processos) e uns 15 MB de índice, contra vários GB de
+um set de str, e o conjunto abre sem ler o arquivo inteiro.
+
+A consulta avulsa (contem, in) usa só mmap e bisect; intersectar e a
+construção usam NumPy.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+
+from .empacotado import ArquivoEmpacotado, gravar_empacotado
+from .nucleo import limpar_cpf
+from .validacao import cpf_valido
+
+# Uma base a cada PASSO_INDICE vai para o índice esparso em memória
+PASSO_INDICE = 128
+
+
+class ConjuntoCPF:
+    """
+    Conjunto de CPFs lido de um arquivo empacotado ordenado.
+
+    Atributos:
+        caminho (str): Arquivo do conjunto
+        quantidade (int): Quantidade de CPFs distintos
+    """
+
+    def __init__(self, caminho, passo=PASSO_INDICE):
+        self._arquivo = ArquivoEmpacotado(caminho)
+        if not self._arquivo.ordenado:
+            self._arquivo.fechar()
+            raise ValueError(f"{caminho} não foi gravado ordenado (use construir_conjunto).")
+        self._visao = self._arquivo.visao()
+        self._amostras = self._visao[::passo].tolist()
+        self._passo = passo
+        self.caminho = caminho
+        self.quantidade = len(self._arquivo)
+
+    def __len__(self):
+        return self.quantidade
+
+    def contem_base(self, base):
+        """
+        Confere se a base (9 primeiros dígitos como número) está no conjunto.
+
+        Args:
+            base (int): Base de 0 a 999.999.999
+
+        Returns:
+            bool: True se algum CPF do conjunto tiver essa base
+        """
+        trecho = bisect_right(self._amostras, base) - 1
+        if trecho < 0:
+            return False
+        inicio = trecho * self._passo
+        fim = min(inicio + self._passo, self.quantidade)
+        posicao = bisect_left(self._visao, base, inicio, fim)
+        return posicao < fim and self._visao[posicao] == base
+
+    def contem(self, cpf):
+        """
+        Confere se um CPF está no conjunto.
+
+        Só CPFs válidos podem estar no conjunto: o CPF é validado por
+        completo apenas quando a base é encontrada.
+
+        Args:
+            cpf (str): CPF em qualquer formato
+
+        Returns:
+            bool: True se o CPF for válido e estiver no conjunto
+        """
+        cpf_limpo = limpar_cpf(cpf)
+        if len(cpf_limpo) != 11 or not self.contem_base(int(cpf_limpo[:9])):
+            return False
+        return cpf_valido(cpf)
+
+    __contains__ = contem
+
+    @property
+    def bases(self):
+        """Vetor uint32 com as bases ordenadas, sem cópia (requer NumPy)."""
+        return self._arquivo.bases
+
+    def intersectar_bases(self, bases):
+        """
+        Marca quais bases estão no conjunto (requer NumPy).
+
+        Args:
+            bases (numpy.ndarray): Vetor de bases
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde a base está no conjunto
+        """
+        from .matriz import np
+
+        bases = np.asarray(bases, dtype=np.uint32)
+        conjunto = self.bases
+        if len(conjunto) == 0:
+            return np.zeros(len(bases), dtype=bool)
+        # Consultas em ordem crescente percorrem o arquivo em um único sentido
+        ordem = np.argsort(bases, kind="stable")
+        posicoes = np.minimum(np.searchsorted(conjunto, bases[ordem]), len(conjunto) - 1)
+        encontrados = np.empty(len(bases), dtype=bool)
+        encontrados[ordem] = conjunto[posicoes] == bases[ordem]
+        return encontrados
+
+    def intersectar(self, coluna, tamanho_bloco=1 << 18):
+        """
+        Marca quais CPFs de uma coluna estão no conjunto (requer NumPy).
+
+        Args:
+            coluna: Lista, numpy.ndarray, pyarrow.Array ou pandas.Series de
+                textos, como em validar_coluna
+            tamanho_bloco (int): Quantidade de linhas processadas por vez
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde o CPF é válido e está
+            no conjunto
+        """
+        from .empacotado import bases_de_caracteres
+        from .matriz import np
+        from .vetorizado import _blocos
+
+        encontrados = np.empty(len(coluna), dtype=bool)
+        inicio = 0
+        for caracteres, longas in _blocos(coluna, tamanho_bloco):
+            bases, motivos = bases_de_caracteres(caracteres, longas)
+            fim = inicio + len(bases)
+            encontrados[inicio:fim] = self.intersectar_bases(bases) & (motivos == 0)
+            inicio = fim
+        return encontrados
+
+    def fechar(self):
+        """Desfaz o mapeamento do arquivo."""
+        self._visao.release()
+        self._arquivo.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def construir_conjunto(entrada, caminho, coluna=1, separador=None, cabecalho=False, tamanho_bloco=8 << 20):
+    """
+    Lê a coluna de CPFs de um arquivo em fluxo e grava o conjunto ordenado.
+
+    Linhas inválidas são ignoradas e contadas por motivo; CPFs repetidos
+    entram uma única vez.
+
+    Args:
+        entrada: Arquivo de entrada aberto em modo binário
+        caminho (str): Arquivo do conjunto a gravar
+        coluna (int | str): Número da coluna (a partir de 1) ou nome no cabeçalho
+        separador (str | None): Separador de campos; None para uma linha por CPF
+        cabecalho (bool): Se a primeira linha é um cabeçalho
+        tamanho_bloco (int): Quantidade de bytes lidos por vez
+
+    Returns:
+        tuple: (estatisticas, quantidade) - Estatisticas da leitura e
+        quantidade de CPFs distintos gravados
+    """
+    from .empacotado import bases_de_caracteres
+    from .fluxo import Estatisticas, caracteres_do_bloco, indice_da_coluna, ler_blocos
+    from .matriz import np
+    from .motivos import Motivo
+
+    estatisticas = Estatisticas()
+    indice = None
+    partes = []
+    inicio = time.perf_counter()
+
+    for bloco in ler_blocos(entrada, tamanho_bloco):
+        estatisticas.bytes += len(bloco)
+
+        if indice is None:
+            linha_cabecalho = None
+            if cabecalho:
+                fim_cabecalho = bloco.index(b"\n") + 1
+                linha_cabecalho, bloco = bloco[:fim_cabecalho], bloco[fim_cabecalho:]
+            indice = indice_da_coluna(coluna, linha_cabecalho, separador)
+            if not bloco:
+                continue
+
+        _, caracteres, longas = caracteres_do_bloco(np.frombuffer(bloco, dtype=np.uint8), separador, indice)
+        bases, motivos = bases_de_caracteres(caracteres, longas)
+        estatisticas.linhas += len(motivos)
+        estatisticas.por_motivo += np.bincount(motivos, minlength=len(Motivo))
+        partes.append(bases[motivos == Motivo.VALIDO])
+
+    bases = np.concatenate(partes) if partes else np.zeros(0, dtype=np.uint32)
+    gravar_empacotado(caminho, bases, ordenar=True)
+    estatisticas.segundos = time.perf_counter() - inicio
+    with ArquivoEmpacotado(caminho) as arquivo:
+        return estatisticas, len(arquivo)
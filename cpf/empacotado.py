@@ -0,0 +1,397 @@
+"""
+Formato Empacotado de Coleções de CPF
+Autor: Felipe Alcântara
+Descrição: Guarda cada CPF como a base de 9 dígitos em um uint32 (4 bytes),
+em memória e em disco. Os verificadores não são armazenados: são calculados
+de novo na leitura, então 100 milhões de CPFs ocupam 400 MB, contra 1,5 GB
+em texto com máscara e uns 7 GB como lista de str.
+
+Arquivo (little-endian):
+    assinatura (8 bytes) | quantidade (uint64) | opções (uint32) | reservado (uint32)
+    fim de cada região fiscal (10 x uint64, zeros sem o índice de regiões)
+    bases (quantidade x uint32)
+
+Com o índice de regiões, as bases ficam agrupadas pelo 9º dígito (região
+fiscal) e cada região vira uma fatia contígua do arquivo. Ordenado, o
+arquivo guarda bases distintas em ordem crescente (usado por ConjuntoCPF).
+
+A leitura avulsa (ArquivoEmpacotado.cpf) usa só mmap e struct; as conversões
+em massa usam NumPy.
+"""
+
+import mmap
+import struct
+
+from .motivos import NOMES_MOTIVOS, Motivo
+from .nucleo import calcular_digitos_verificadores, formatar_cpf
+
+# Cabeçalho do arquivo: assinatura, quantidade, opções, reservado e o índice de regiões
+ASSINATURA = b"CPFPAK\x01\x00"
+_CABECALHO = struct.Struct("<8sQII10Q")
+TAMANHO_CABECALHO = _CABECALHO.size
+_BASE = struct.Struct("<I")
+
+# Bits de opções: bases agrupadas por região fiscal, com o índice preenchido,
+# ou bases distintas em ordem crescente
+OPCAO_POR_REGIAO = 1
+OPCAO_ORDENADO = 2
+
+# Linhas convertidas por vez nas conversões de texto
+TAMANHO_BLOCO = 1 << 18
+
+
+def bases_de_digitos(cpfs):
+    """
+    Empacota uma matriz de dígitos nas bases uint32.
+
+    Args:
+        cpfs (numpy.ndarray): Matriz (N, 9) ou (N, 11) com os dígitos de cada CPF
+
+    Returns:
+        numpy.ndarray: Vetor uint32 com os 9 primeiros dígitos como número
+    """
+    from .matriz import np
+
+    bases = np.zeros(len(cpfs), dtype=np.uint32)
+    for coluna in range(9):
+        bases *= 10
+        bases += cpfs[:, coluna]
+    return bases
+
+
+def digitos_de_bases(bases):
+    """
+    Desempacota bases uint32 em CPFs completos, recalculando os verificadores.
+
+    Args:
+        bases (numpy.ndarray): Vetor de bases (0 a 999.999.999)
+
+    Returns:
+        numpy.ndarray: Matriz (N, 11) uint8 com os dígitos de cada CPF
+    """
+    from .matriz import calcular_verificadores, np
+
+    cpfs = np.empty((len(bases), 11), dtype=np.uint8)
+    restante = np.array(bases, dtype=np.uint32)
+    for coluna in range(8, -1, -1):
+        cpfs[:, coluna] = restante % 10
+        restante //= 10
+    cpfs[:, 9], cpfs[:, 10] = calcular_verificadores(cpfs[:, :9])
+    return cpfs
+
+
+def _conferir(motivos, inicio):
+    """Recusa o bloco se algum CPF não for válido (o formato só guarda CPFs válidos)."""
+    from .matriz import np
+
+    invalidos = np.flatnonzero(motivos)
+    if len(invalidos):
+        linha = int(invalidos[0])
+        raise ValueError(
+            f"CPF inválido na linha {inicio + linha} ({NOMES_MOTIVOS[motivos[linha]]}): "
+            "só CPFs válidos podem ser empacotados."
+        )
+
+
+def bases_de_caracteres(caracteres, longas=None):
+    """
+    Converte uma matriz de caracteres (um CPF em texto por linha) em bases.
+
+    Args:
+        caracteres (numpy.ndarray): Matriz (N, largura) uint8 com códigos ASCII
+        longas (numpy.ndarray | None): Linhas truncadas em LARGURA_MAXIMA
+
+    Returns:
+        tuple: (bases, motivos) - vetor uint32 (sem sentido nas linhas
+        inválidas) e vetor uint8 com o código do Motivo de cada linha
+    """
+    from .vetorizado import extrair_digitos, linhas_nao_numericas, validar_digitos
+
+    digitos, quantidade = extrair_digitos(caracteres)
+    if longas is not None:
+        quantidade[longas] = 0
+    _, motivos = validar_digitos(digitos, quantidade)
+    motivos[linhas_nao_numericas(caracteres)] = Motivo.NAO_NUMERICO
+    return bases_de_digitos(digitos), motivos
+
+
+def empacotar(coluna, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Empacota uma coluna de CPFs em texto, em qualquer formato aceito por
+    validar_coluna (com ou sem máscara).
+
+    Args:
+        coluna: Lista, numpy.ndarray, pyarrow.Array ou pandas.Series de textos
+        tamanho_bloco (int): Quantidade de linhas convertidas por vez
+
+    Returns:
+        numpy.ndarray: Vetor uint32 com as bases
+
+    Raises:
+        ValueError: Se algum CPF for inválido
+    """
+    from .matriz import np
+    from .vetorizado import _blocos
+
+    bases = np.empty(len(coluna), dtype=np.uint32)
+    inicio = 0
+    for caracteres, longas in _blocos(coluna, tamanho_bloco):
+        bases_bloco, motivos = bases_de_caracteres(caracteres, longas)
+        _conferir(motivos, inicio)
+        bases[inicio:inicio + len(bases_bloco)] = bases_bloco
+        inicio += len(bases_bloco)
+    return bases
+
+
+def empacotar_registros(dados, formato):
+    """
+    Empacota registros de largura fixa, como os gravados por gerar_lote.
+
+    Caminho rápido para arquivos de fixture: os dígitos são lidos direto das
+    colunas do formato, sem procurar separadores.
+
+    Args:
+        dados (bytes | mmap.mmap | numpy.ndarray): Registros concatenados
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+
+    Returns:
+        numpy.ndarray: Vetor uint32 com as bases
+
+    Raises:
+        ValueError: Se o tamanho não for múltiplo do registro, se um separador
+        estiver fora do lugar ou se algum CPF for inválido
+    """
+    from .lote import LARGURA, POSICOES, SEPARADORES
+    from .matriz import ZERO, np
+    from .vetorizado import validar_digitos
+
+    largura = LARGURA[formato]
+    registros = np.frombuffer(dados, dtype=np.uint8)
+    if len(registros) % largura:
+        raise ValueError(f"Tamanho {len(registros)} não é múltiplo do registro de {largura} bytes.")
+    registros = registros.reshape(-1, largura)
+
+    bases = np.empty(len(registros), dtype=np.uint32)
+    separadores = list(SEPARADORES[formato].items())
+    for inicio in range(0, len(registros), TAMANHO_BLOCO):
+        bloco = registros[inicio:inicio + TAMANHO_BLOCO]
+        digitos = bloco[:, POSICOES[formato]] - np.uint8(ZERO)
+        _, motivos = validar_digitos(digitos)
+        # Dígitos fora de 0-9 (o uint8 dá a volta) ou separadores trocados
+        motivos[(digitos > 9).any(axis=1)] = Motivo.NAO_NUMERICO
+        for coluna, caractere in separadores:
+            motivos[bloco[:, coluna] != ord(caractere)] = Motivo.NAO_NUMERICO
+        _conferir(motivos, inicio)
+        bases[inicio:inicio + len(bloco)] = bases_de_digitos(digitos)
+    return bases
+
+
+def desempacotar(bases, formato):
+    """
+    Converte bases em registros de texto, um CPF por linha.
+
+    Args:
+        bases (numpy.ndarray): Vetor de bases
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+
+    Returns:
+        bytes: Registros de largura fixa, no mesmo formato de gerar_lote
+    """
+    from .lote import LARGURA, codificar
+    from .matriz import np
+
+    saida = np.empty((len(bases), LARGURA[formato]), dtype=np.uint8)
+    for inicio in range(0, len(bases), TAMANHO_BLOCO):
+        bloco = bases[inicio:inicio + TAMANHO_BLOCO]
+        codificar(digitos_de_bases(bloco), formato, saida[inicio:inicio + len(bloco)])
+    return saida.tobytes()
+
+
+def desempacotar_textos(bases, formato):
+    """
+    Converte bases em uma lista de str.
+
+    Args:
+        bases (numpy.ndarray): Vetor de bases
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+
+    Returns:
+        list: CPFs como texto, sem quebra de linha
+    """
+    return desempacotar(bases, formato).decode("ascii").splitlines()
+
+
+def gravar_empacotado(caminho, bases, por_regiao=False, ordenar=False):
+    """
+    Grava as bases em um arquivo empacotado.
+
+    Args:
+        caminho (str): Arquivo de saída
+        bases (numpy.ndarray): Vetor de bases
+        por_regiao (bool): Agrupa as bases pela região fiscal (ordenação
+            estável) e preenche o índice de regiões
+        ordenar (bool): Remove as repetições e grava em ordem crescente
+
+    Raises:
+        ValueError: Se por_regiao e ordenar forem pedidos juntos
+    """
+    from .matriz import np
+
+    if por_regiao and ordenar:
+        raise ValueError("O arquivo é agrupado por região ou ordenado, não os dois.")
+
+    bases = np.asarray(bases, dtype=np.uint32)
+    opcoes, fins = 0, [0] * 10
+    if ordenar:
+        # sort + máscara de vizinhos: mais rápido que np.unique para uint32
+        bases = np.sort(bases)
+        if len(bases):
+            bases = bases[np.concatenate(([True], bases[1:] != bases[:-1]))]
+        opcoes = OPCAO_ORDENADO
+    if por_regiao:
+        regioes = (bases % 10).astype(np.uint8)
+        bases = bases[np.argsort(regioes, kind="stable")]
+        opcoes = OPCAO_POR_REGIAO
+        fins = np.cumsum(np.bincount(regioes, minlength=10)).tolist()
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, len(bases), opcoes, 0, *fins))
+        arquivo.write(bases.astype("<u4", copy=False).tobytes())
+
+
+class ArquivoEmpacotado:
+    """
+    Arquivo empacotado mapeado em memória (somente leitura).
+
+    Os vetores de bases, regiao() e visao() apontam direto para o
+    mapeamento. Se algum deles ainda existir quando o arquivo for fechado,
+    o mapeamento só é desfeito quando o último for liberado. Para usar os
+    dados depois de fechar, faça uma cópia (ex.: arquivo.regiao(8).copy()).
+
+    Atributos:
+        quantidade (int): Quantidade de CPFs no arquivo
+        por_regiao (bool): Se as bases estão agrupadas com índice de regiões
+        ordenado (bool): Se as bases são distintas e estão em ordem crescente
+    """
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mapa) < TAMANHO_CABECALHO:
+            self._mapa.close()
+            raise ValueError(f"{caminho} não é um arquivo empacotado de CPFs.")
+        assinatura, self.quantidade, opcoes, _, *fins = _CABECALHO.unpack_from(self._mapa)
+        if assinatura != ASSINATURA or len(self._mapa) != TAMANHO_CABECALHO + 4 * self.quantidade:
+            self._mapa.close()
+            raise ValueError(f"{caminho} não é um arquivo empacotado de CPFs.")
+        self.por_regiao = bool(opcoes & OPCAO_POR_REGIAO)
+        self.ordenado = bool(opcoes & OPCAO_ORDENADO)
+        self._fins = fins
+        self.caminho = caminho
+
+    def __len__(self):
+        return self.quantidade
+
+    def base(self, indice):
+        """Base (9 primeiros dígitos como número) do CPF na posição indice."""
+        if not 0 <= indice < self.quantidade:
+            raise IndexError(f"Posição {indice} fora do arquivo de {self.quantidade} CPFs.")
+        return _BASE.unpack_from(self._mapeamento(), TAMANHO_CABECALHO + 4 * indice)[0]
+
+    def cpf(self, indice):
+        """
+        Lê um CPF sem NumPy.
+
+        Args:
+            indice (int): Posição no arquivo
+
+        Returns:
+            str: CPF no formato XXX.XXX.XXX-XX
+        """
+        digitos = [int(digito) for digito in f"{self.base(indice):09d}"]
+        return formatar_cpf(digitos, *calcular_digitos_verificadores(digitos))
+
+    @property
+    def bases(self):
+        """Vetor uint32 de todas as bases, sem cópia (requer NumPy)."""
+        from .matriz import np
+
+        return np.frombuffer(self._mapeamento(), dtype="<u4", offset=TAMANHO_CABECALHO)
+
+    def visao(self):
+        """
+        memoryview uint32 das bases, sem cópia e sem NumPy.
+
+        Usa a ordem de bytes da máquina, que nas plataformas suportadas é a
+        mesma little-endian do arquivo. Chame release() antes de fechar().
+        """
+        return memoryview(self._mapeamento())[TAMANHO_CABECALHO:].cast("I")
+
+    def intervalo_regiao(self, regiao):
+        """
+        Posições (inicio, fim) das bases de uma região fiscal.
+
+        Args:
+            regiao (int): Dígito da região fiscal (0-9)
+
+        Returns:
+            tuple: (inicio, fim), fatia meio aberta do arquivo
+
+        Raises:
+            ValueError: Se a região não for um dígito de 0 a 9 ou se o
+                arquivo não tiver o índice de regiões
+        """
+        if regiao not in range(10):
+            raise ValueError(f"Região fiscal deve ser um dígito de 0 a 9, não {regiao!r}.")
+        if not self.por_regiao:
+            raise ValueError(f"{self.caminho} foi gravado sem o índice de regiões.")
+        return (self._fins[regiao - 1] if regiao else 0), self._fins[regiao]
+
+    def regiao(self, regiao):
+        """Vetor uint32 com as bases de uma região fiscal, sem cópia (requer NumPy)."""
+        inicio, fim = self.intervalo_regiao(regiao)
+        return self.bases[inicio:fim]
+
+    def blocos(self, formato, tamanho_bloco=TAMANHO_BLOCO):
+        """
+        Percorre o arquivo como registros de texto, um bloco por vez.
+
+        Args:
+            formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+            tamanho_bloco (int): CPFs por bloco
+
+        Yields:
+            bytes: Registros de largura fixa do bloco
+        """
+        bases = self.bases
+        for inicio in range(0, len(bases), tamanho_bloco):
+            yield desempacotar(bases[inicio:inicio + tamanho_bloco], formato)
+
+    def _mapeamento(self):
+        """O mmap do arquivo, ou ValueError se ele já foi fechado."""
+        if self._mapa is None:
+            raise ValueError(f"{self.caminho} já foi fechado.")
+        return self._mapa
+
+    def fechar(self):
+        """
+        Fecha o arquivo e desfaz o mapeamento.
+
+        Com vetores ou visões ainda vivos, o mapeamento fica com eles e é
+        desfeito quando o último for liberado; o arquivo é dado como
+        fechado de qualquer forma.
+        """
+        if self._mapa is None:
+            return
+        mapa, self._mapa = self._mapa, None
+        try:
+            mapa.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
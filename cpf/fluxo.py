@@ -0,0 +1,384 @@
+"""
+Validação de Arquivos em Fluxo
+Autor: Felipe Alcântara
+Descrição: Valida uma coluna de arquivos CSV, TSV ou de uma linha por CPF,
+lendo blocos de tamanho fixo para que a memória não cresça com o arquivo.
+
+Cada bloco é tratado como um único buffer NumPy: as linhas e o campo da coluna
+escolhida são localizados por posição, e as linhas de saída são copiadas do
+próprio buffer, sem criar objetos Python por linha.
+"""
+
+import csv
+import time
+
+from .matriz import np
+from .motivos import Motivo
+from .vetorizado import (
+    LARGURA_MAXIMA,
+    NOMES_MOTIVOS,
+    _caracteres_numpy,
+    caracteres_por_offsets,
+    validar_caracteres,
+)
+
+# Quantidade de bytes lidos por vez
+TAMANHO_BLOCO = 8 << 20
+
+# Separador de campos de cada formato de entrada (None = linha inteira)
+SEPARADORES = {"csv": ",", "tsv": "\t", "linhas": None}
+
+_NOVA_LINHA = ord("\n")
+_RETORNO = ord("\r")
+_ASPAS = ord('"')
+
+
+class Estatisticas:
+    """Contadores de uma validação em fluxo."""
+
+    def __init__(self):
+        self.linhas = 0
+        self.bytes = 0
+        self.segundos = 0.0
+        self.por_motivo = np.zeros(len(NOMES_MOTIVOS), dtype=np.int64)
+
+    def resumo(self):
+        """
+        Monta o relatório final da validação.
+
+        Returns:
+            str: Linhas, vazão em linhas/s e MB/s e contagem por motivo
+        """
+        segundos = max(self.segundos, 1e-9)
+        linhas = [
+            f"Linhas: {self.linhas:,} em {self.segundos:.2f} s",
+            f"Vazão:  {self.linhas / segundos:,.0f} linhas/s | {self.bytes / segundos / 1e6:,.1f} MB/s",
+        ]
+        for nome, quantidade in zip(NOMES_MOTIVOS, self.por_motivo.tolist()):
+            linhas.append(f"  {nome:<20} {quantidade:>14,}")
+        return "\n".join(linhas)
+
+    def contagem(self):
+        """
+        Contagem de linhas por motivo, para relatórios.
+
+        Returns:
+            dict: Motivo -> quantidade, no mesmo formato de contar_motivos
+        """
+        return dict(zip(Motivo, self.por_motivo.tolist()))
+
+
+def detectar_formato(caminho):
+    """
+    Escolhe o formato de entrada pela extensão do arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo ou "-" para a entrada padrão
+
+    Returns:
+        str: "csv", "tsv" ou "linhas"
+    """
+    extensao = caminho.rsplit(".", 1)[-1].lower() if "." in caminho else ""
+    return extensao if extensao in ("csv", "tsv") else "linhas"
+
+
+def ler_blocos(arquivo, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê um arquivo binário em blocos que sempre terminam em uma linha completa.
+
+    Args:
+        arquivo: Arquivo aberto em modo binário
+        tamanho_bloco (int): Quantidade de bytes lidos por vez
+
+    Yields:
+        bytes: Bloco com uma ou mais linhas, terminado em '\\n'
+
+    Raises:
+        ValueError: Se o tamanho do bloco não for positivo
+    """
+    if tamanho_bloco < 1:
+        raise ValueError(f"O tamanho do bloco deve ser positivo, não {tamanho_bloco}.")
+    sobra = b""
+    while True:
+        lido = arquivo.read(tamanho_bloco)
+        if not lido:
+            break
+        bloco = sobra + lido if sobra else lido
+        corte = bloco.rfind(b"\n") + 1
+        if corte == 0:
+            # Linha maior que o bloco: continua acumulando até achar o fim
+            sobra = bloco
+            continue
+        sobra = bloco[corte:]
+        yield bloco[:corte] if corte < len(bloco) else bloco
+
+    if sobra:
+        yield sobra + b"\n"
+
+
+def localizar_linhas(dados):
+    """
+    Encontra o início e o fim de cada linha de um bloco.
+
+    Args:
+        dados (numpy.ndarray): Bloco uint8 terminado em '\\n'
+
+    Returns:
+        tuple: (inicios, fins, quebras) - início de cada linha, fim do conteúdo
+        (sem '\\r\\n') e posição do '\\n' que encerra a linha
+    """
+    quebras = np.flatnonzero(dados == _NOVA_LINHA)
+    inicios = np.empty_like(quebras)
+    inicios[:1] = 0
+    inicios[1:] = quebras[:-1] + 1
+    fins = quebras - ((quebras > inicios) & (dados[quebras - 1] == _RETORNO))
+    return inicios, fins, quebras
+
+
+def localizar_campo(dados, inicios, fins, separador, indice):
+    """
+    Encontra o campo de número `indice` (a partir de 0) em cada linha.
+
+    Linhas com menos campos recebem um campo vazio.
+
+    Args:
+        dados (numpy.ndarray): Bloco uint8
+        inicios (numpy.ndarray): Início de cada linha
+        fins (numpy.ndarray): Fim do conteúdo de cada linha
+        separador (str | None): Separador de campos ou None para a linha inteira
+        indice (int): Índice do campo desejado
+
+    Returns:
+        tuple: (inicios_campo, fins_campo)
+    """
+    if separador is None:
+        return inicios, fins
+
+    posicoes = np.flatnonzero(dados == ord(separador))
+    primeiro = np.searchsorted(posicoes, inicios)
+    quantos = np.searchsorted(posicoes, fins) - primeiro
+    if len(posicoes) == 0:
+        posicoes = np.zeros(1, dtype=np.intp)
+    ultima = len(posicoes) - 1
+
+    if indice == 0:
+        inicio_campo = inicios
+    else:
+        anterior = posicoes[np.minimum(primeiro + indice - 1, ultima)] + 1
+        inicio_campo = np.where(indice <= quantos, anterior, fins)
+    proximo = posicoes[np.minimum(primeiro + indice, ultima)]
+    fim_campo = np.where(indice < quantos, proximo, fins)
+    return inicio_campo, fim_campo
+
+
+def juntar_segmentos(fonte, inicios, tamanhos):
+    """
+    Concatena vários trechos de um buffer em um só, sem laço em Python.
+
+    Args:
+        fonte (numpy.ndarray): Buffer uint8 de origem
+        inicios (numpy.ndarray): Início de cada trecho em `fonte`
+        tamanhos (numpy.ndarray): Tamanho de cada trecho
+
+    Returns:
+        numpy.ndarray: Buffer uint8 com os trechos em sequência
+    """
+    total = int(tamanhos.sum())
+    deslocamentos = np.cumsum(tamanhos) - tamanhos
+    indices = np.arange(total) + np.repeat(inicios - deslocamentos, tamanhos)
+    return fonte[indices]
+
+
+# Campo que validar_caracteres sempre marca como longo (motivo TAMANHO)
+_CAMPO_LONGO = "0" * (LARGURA_MAXIMA + 1)
+
+
+def _campos_com_aspas(dados, inicios, fins, separador, indice):
+    """Caminho lento para blocos CSV com aspas, que podem esconder separadores."""
+    texto = dados.tobytes()
+    campos = []
+    for inicio, fim in zip(inicios.tolist(), fins.tolist()):
+        linha = texto[inicio:fim].decode("utf-8", errors="replace")
+        try:
+            registro = next(csv.reader([linha], delimiter=separador), [])
+        except csv.Error:
+            # Campo acima do limite do módulo csv: a linha é tratada como longa
+            registro = [_CAMPO_LONGO] * (indice + 1)
+        # Um caractere além do limite basta para marcar o campo como longo
+        campos.append(registro[indice][:LARGURA_MAXIMA + 1] if indice < len(registro) else "")
+    return _caracteres_numpy(np.array(campos, dtype=object))
+
+
+def _anotacoes(separador):
+    """Tabela com o sufixo '<separador><motivo>\\n' de cada código de motivo."""
+    sufixos = [f"{separador or ','}{nome}\n".encode() for nome in NOMES_MOTIVOS]
+    tamanhos = np.array([len(sufixo) for sufixo in sufixos])
+    inicios = np.cumsum(tamanhos) - tamanhos
+    return np.frombuffer(b"".join(sufixos), dtype=np.uint8), inicios, tamanhos
+
+
+def indice_da_coluna(coluna, cabecalho, separador):
+    """
+    Converte o número (a partir de 1) ou o nome da coluna em índice.
+
+    Args:
+        coluna (int | str): Número da coluna ou nome no cabeçalho
+        cabecalho (bytes | None): Linha de cabeçalho, se o arquivo tiver uma
+        separador (str | None): Separador de campos
+
+    Returns:
+        int: Índice do campo (a partir de 0)
+
+    Raises:
+        ValueError: Se o separador não for um único caractere ASCII ou se a
+            coluna não existir
+    """
+    # O separador é comparado byte a byte com o bloco lido (ord(separador))
+    if separador is not None and (len(separador) != 1 or not separador.isascii() or separador in "\r\n"):
+        raise ValueError(f"O separador deve ser um único caractere ASCII, não {separador!r}.")
+    if str(coluna).isdigit():
+        if int(coluna) < 1:
+            raise ValueError("O número da coluna começa em 1.")
+        return int(coluna) - 1
+    if cabecalho is None:
+        raise ValueError(f"A coluna {coluna!r} foi pedida pelo nome, mas o arquivo não tem cabeçalho.")
+    texto = cabecalho.decode("utf-8").rstrip("\r\n")
+    nomes = next(csv.reader([texto], delimiter=separador)) if separador else [texto]
+    if coluna not in nomes:
+        raise ValueError(f"Coluna {coluna!r} não encontrada no cabeçalho: {', '.join(nomes)}.")
+    return nomes.index(coluna)
+
+
+def escrever_cabecalho(linha, separador, validos=None, invalidos=None, anotado=None):
+    """
+    Repete a linha de cabeçalho nas saídas, com a coluna "motivo" na anotada.
+
+    Args:
+        linha (bytes): Linha de cabeçalho, com a quebra de linha
+        separador (str | None): Separador de campos
+        validos, invalidos, anotado: Arquivos binários de saída (opcionais)
+    """
+    for saida in (validos, invalidos):
+        if saida is not None:
+            saida.write(linha)
+    if anotado is not None:
+        anotado.write(linha.rstrip(b"\r\n") + f"{separador or ','}motivo\n".encode())
+
+
+def caracteres_do_bloco(dados, separador, indice):
+    """
+    Extrai a coluna de CPFs de todas as linhas de um bloco.
+
+    Args:
+        dados (numpy.ndarray): Bloco uint8 terminado em '\\n'
+        separador (str | None): Separador de campos
+        indice (int): Índice do campo com o CPF
+
+    Returns:
+        tuple: (linhas, caracteres, longas) - linhas é o trio devolvido por
+        localizar_linhas; caracteres e longas, o par de caracteres_por_offsets
+    """
+    linhas = inicios, fins, _ = localizar_linhas(dados)
+
+    if separador == "," and _ASPAS in dados:
+        caracteres, longas = _campos_com_aspas(dados, inicios, fins, separador, indice)
+    else:
+        inicio_campo, fim_campo = localizar_campo(dados, inicios, fins, separador, indice)
+        caracteres, longas = caracteres_por_offsets(dados, inicio_campo, fim_campo - inicio_campo)
+
+    return linhas, caracteres, longas
+
+
+def validar_bloco(dados, separador, indice):
+    """
+    Valida a coluna de CPFs de todas as linhas de um bloco.
+
+    Args:
+        dados (numpy.ndarray): Bloco uint8 terminado em '\\n'
+        separador (str | None): Separador de campos
+        indice (int): Índice do campo com o CPF
+
+    Returns:
+        tuple: (linhas, validos, motivos) - linhas é o trio devolvido por
+        localizar_linhas
+    """
+    linhas, caracteres, longas = caracteres_do_bloco(dados, separador, indice)
+    validos, motivos = validar_caracteres(caracteres, longas)
+    return linhas, validos, motivos
+
+
+def escrever_bloco(dados, linhas, validos_bloco, motivos, separador,
+                   validos=None, invalidos=None, anotado=None):
+    """
+    Grava as linhas de um bloco já validado nas saídas pedidas.
+
+    Args:
+        dados (numpy.ndarray): Bloco uint8
+        linhas (tuple): Trio (inicios, fins, quebras) de localizar_linhas
+        validos_bloco (numpy.ndarray): Máscara das linhas válidas
+        motivos (numpy.ndarray): Código do motivo de cada linha
+        separador (str | None): Separador usado na coluna de anotação
+        validos, invalidos, anotado: Arquivos binários de saída (opcionais)
+    """
+    inicios, fins, quebras = linhas
+    tamanhos_linha = quebras + 1 - inicios
+
+    if validos is not None:
+        validos.write(juntar_segmentos(dados, inicios[validos_bloco], tamanhos_linha[validos_bloco]))
+    if invalidos is not None:
+        mascara = ~validos_bloco
+        invalidos.write(juntar_segmentos(dados, inicios[mascara], tamanhos_linha[mascara]))
+    if anotado is not None:
+        # Intercala o conteúdo de cada linha com o sufixo do seu motivo
+        tabela, inicios_anotacao, tamanhos_anotacao = _anotacoes(separador)
+        fonte = np.concatenate([dados, tabela])
+        segmentos_inicio = np.column_stack([inicios, len(dados) + inicios_anotacao[motivos]]).ravel()
+        segmentos_tamanho = np.column_stack([fins - inicios, tamanhos_anotacao[motivos]]).ravel()
+        anotado.write(juntar_segmentos(fonte, segmentos_inicio, segmentos_tamanho))
+
+
+def validar_arquivo(entrada, coluna=1, separador=None, cabecalho=False,
+                    validos=None, invalidos=None, anotado=None, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Valida em fluxo a coluna de CPFs de um arquivo.
+
+    Args:
+        entrada: Arquivo de entrada aberto em modo binário
+        coluna (int | str): Número da coluna (a partir de 1) ou nome no cabeçalho
+        separador (str | None): Separador de campos; None para uma linha por CPF
+        cabecalho (bool): Se a primeira linha é um cabeçalho
+        validos: Arquivo binário que recebe as linhas válidas (opcional)
+        invalidos: Arquivo binário que recebe as linhas inválidas (opcional)
+        anotado: Arquivo binário que recebe todas as linhas com o motivo no
+            final, como uma coluna a mais (opcional)
+        tamanho_bloco (int): Quantidade de bytes lidos por vez
+
+    Returns:
+        Estatisticas: Linhas, bytes, tempo e contagem por motivo
+    """
+    estatisticas = Estatisticas()
+    indice = None
+    inicio = time.perf_counter()
+
+    for bloco in ler_blocos(entrada, tamanho_bloco):
+        estatisticas.bytes += len(bloco)
+
+        if indice is None:
+            linha_cabecalho = None
+            if cabecalho:
+                fim_cabecalho = bloco.index(b"\n") + 1
+                linha_cabecalho, bloco = bloco[:fim_cabecalho], bloco[fim_cabecalho:]
+                escrever_cabecalho(linha_cabecalho, separador, validos, invalidos, anotado)
+            indice = indice_da_coluna(coluna, linha_cabecalho, separador)
+            if not bloco:
+                continue
+
+        dados = np.frombuffer(bloco, dtype=np.uint8)
+        linhas, validos_bloco, motivos = validar_bloco(dados, separador, indice)
+
+        estatisticas.linhas += len(motivos)
+        estatisticas.por_motivo += np.bincount(motivos, minlength=len(NOMES_MOTIVOS))
+        escrever_bloco(dados, linhas, validos_bloco, motivos, separador, validos, invalidos, anotado)
+
+    estatisticas.segundos = time.perf_counter() - inicio
+    return estatisticas
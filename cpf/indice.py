@@ -0,0 +1,153 @@
+"""
+Índice Pré-calculado de Dígitos Verificadores
+Autor: Felipe Alcântara
+Descrição: Guarda os dois verificadores de todas as 10^9 bases de CPF em um
+arquivo de 1 GB (4 bits por verificador, um byte por base), mapeado em
+memória para responder com uma única consulta.
+
+O arquivo é gerado uma única vez com gerar_indice. A leitura usa apenas o
+módulo mmap, então consultas avulsas funcionam sem NumPy.
+"""
+
+import mmap
+import struct
+
+# Cabeçalho do arquivo: assinatura + quantidade de bases (uint64 little-endian)
+ASSINATURA = b"CPFIDX\x01\x00"
+_CABECALHO = struct.Struct("<8sQ")
+TAMANHO_CABECALHO = _CABECALHO.size
+
+# Quantidade de bases de CPF (9 dígitos)
+TOTAL_BASES = 10 ** 9
+
+
+def gerar_indice(caminho, limite=TOTAL_BASES):
+    """
+    Gera o arquivo de índice com os verificadores das bases 0 até limite - 1.
+
+    A base é dividida em 6 dígitos altos e 3 baixos: as somas ponderadas das
+    duas partes são pré-calculadas e combinadas por soma externa, gerando um
+    milhão de bases por vez sem decompor cada número em dígitos.
+
+    Args:
+        caminho (str): Arquivo de saída
+        limite (int): Quantidade de bases indexadas (múltiplo de 1000)
+
+    Raises:
+        ValueError: Se o limite não for múltiplo de 1000 ou passar de 10^9
+    """
+    from .matriz import TABELA_DIGITO, np
+    from .nucleo import PESOS_PRIMEIRO
+
+    if limite % 1000 or not 0 < limite <= TOTAL_BASES:
+        raise ValueError(f"O limite deve ser múltiplo de 1000 entre 1000 e 10^9, não {limite}.")
+
+    def somas(quantidade, pesos):
+        """Soma ponderada e soma simples dos dígitos de 0 até quantidade - 1."""
+        numeros = np.arange(quantidade)
+        ponderada = np.zeros(quantidade, dtype=np.int32)
+        simples = np.zeros(quantidade, dtype=np.int32)
+        for posicao, peso in enumerate(reversed(pesos)):
+            digito = (numeros // 10 ** posicao % 10).astype(np.int32)
+            ponderada += peso * digito
+            simples += digito
+        return ponderada, simples
+
+    baixa_ponderada, baixa_simples = somas(1000, PESOS_PRIMEIRO[6:])
+    alta_ponderada, alta_simples = somas(limite // 1000, PESOS_PRIMEIRO[:6])
+    altas_por_vez = 1000
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, limite))
+        for inicio in range(0, limite // 1000, altas_por_vez):
+            fim = min(inicio + altas_por_vez, limite // 1000)
+            soma = alta_ponderada[inicio:fim, None] + baixa_ponderada[None, :]
+            primeiro = TABELA_DIGITO[soma]
+            simples = alta_simples[inicio:fim, None] + baixa_simples[None, :]
+            segundo = TABELA_DIGITO[soma + simples + 2 * primeiro.astype(np.int32)]
+            arquivo.write((primeiro << 4) | segundo)
+
+
+class IndiceVerificadores:
+    """
+    Índice de verificadores mapeado em memória (somente leitura).
+
+    Cada byte guarda o primeiro verificador nos 4 bits altos e o segundo nos
+    4 bits baixos.
+    """
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        assinatura, self.quantidade = _CABECALHO.unpack_from(self._mapa)
+        if assinatura != ASSINATURA or len(self._mapa) != TAMANHO_CABECALHO + self.quantidade:
+            self._mapa.close()
+            raise ValueError(f"{caminho} não é um índice de verificadores válido.")
+        self.caminho = caminho
+
+    def verificadores(self, base):
+        """
+        Consulta os verificadores de uma base.
+
+        Args:
+            base (int): Os 9 primeiros dígitos como número (0 a 999.999.999)
+
+        Returns:
+            tuple: (primeiro_verificador, segundo_verificador)
+
+        Raises:
+            ValueError: Se a base estiver fora do índice
+        """
+        if not 0 <= base < self.quantidade:
+            raise ValueError(f"Base fora do índice (0 a {self.quantidade - 1}): {base}.")
+        byte = self._mapa[TAMANHO_CABECALHO + base]
+        return byte >> 4, byte & 15
+
+    def verificadores_texto(self, cpf_limpo):
+        """
+        Consulta os verificadores a partir do CPF só com números.
+
+        Args:
+            cpf_limpo (str): Texto cujos 9 primeiros caracteres são a base
+
+        Returns:
+            tuple: (primeiro_verificador, segundo_verificador)
+
+        Raises:
+            ValueError: Se a base não for um número dentro do índice
+        """
+        return self.verificadores(int(cpf_limpo[:9]))
+
+    def verificadores_lote(self, bases):
+        """
+        Consulta os verificadores de muitas bases de uma vez (requer NumPy).
+
+        Args:
+            bases (numpy.ndarray): Vetor de bases inteiras
+
+        Returns:
+            tuple: (primeiros, segundos), vetores uint8
+
+        Raises:
+            ValueError: Se alguma base estiver fora do índice
+        """
+        from .matriz import np
+
+        bases = np.asarray(bases)
+        if bases.size and (bases.min() < 0 or bases.max() >= self.quantidade):
+            raise ValueError(f"Há bases fora do índice (0 a {self.quantidade - 1}).")
+        tabela = np.frombuffer(self._mapa, dtype=np.uint8, offset=TAMANHO_CABECALHO)
+        bytes_ = tabela[bases]
+        return bytes_ >> 4, bytes_ & 15
+
+    def fechar(self):
+        """Desfaz o mapeamento do arquivo."""
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
@@ -0,0 +1,109 @@
+"""
+Enumeração de Intervalos de CPF
+Autor: Felipe Alcântara
+Descrição: Gera, em ordem, todos os CPFs válidos de um intervalo de bases,
+reaproveitando as somas ponderadas entre bases vizinhas.
+
+As dez bases com os nove dígitos iguais (d × 111.111.111) dariam CPFs
+inválidos e ficam de fora da enumeração e da contagem.
+
+A base de 9 dígitos é dividida em 6 dígitos altos e 3 baixos. A parte alta
+(somas e texto "XXX.XXX.") só é recalculada a cada 1000 bases; a parte baixa
+vem de tabelas com as 1000 combinações possíveis. Assim, cada CPF custa
+apenas duas somas e uma consulta ao DIGITO_POR_SOMA.
+
+NOTA: Este módulo usa apenas Python puro para continuar funcionando no
+navegador através do Brython.
+"""
+
+from .nucleo import DIGITO_POR_SOMA, PESOS_PRIMEIRO
+
+# Maior base de CPF (9 dígitos)
+BASE_MAXIMA = 10 ** 9 - 1
+
+# Bases com os nove dígitos iguais: 000000000, 111111111, ..., 999999999
+BASES_REPETIDAS = tuple(digito * 111_111_111 for digito in range(10))
+
+# Tabelas da parte baixa (3 últimos dígitos da base), indexadas de 0 a 999
+_BAIXA_TEXTO = tuple(f"{numero:03d}" for numero in range(1000))
+_BAIXA_PONDERADA = tuple(
+    sum(peso * int(digito) for peso, digito in zip(PESOS_PRIMEIRO[6:], texto))
+    for texto in _BAIXA_TEXTO
+)
+_BAIXA_SIMPLES = tuple(sum(map(int, texto)) for texto in _BAIXA_TEXTO)
+
+# Os dois verificadores já como texto, indexados por 10 × primeiro + segundo
+_VERIFICADORES_TEXTO = tuple(f"{numero:02d}" for numero in range(100))
+
+
+def enumerar_cpfs(inicio, fim, regiao=None, formatado=True):
+    """
+    Gera todos os CPFs válidos com base entre inicio e fim (inclusive).
+
+    Args:
+        inicio (int): Primeira base do intervalo (0 a 999.999.999)
+        fim (int): Última base do intervalo (inclusive)
+        regiao (int, optional): Dígito da região fiscal (9º dígito). Se
+            informado, só as bases terminadas nele são geradas.
+        formatado (bool): Se True, gera XXX.XXX.XXX-XX; senão, só os números
+
+    Yields:
+        str: CPF válido, em ordem crescente de base
+
+    Raises:
+        ValueError: Se o intervalo ou a região forem inválidos
+    """
+    if not 0 <= inicio <= fim <= BASE_MAXIMA:
+        raise ValueError(f"Intervalo inválido: {inicio} a {fim} (as bases vão de 0 a {BASE_MAXIMA}).")
+    if regiao is not None and regiao not in range(10):
+        raise ValueError(f"A região deve ser um dígito de 0 a 9, não {regiao!r}.")
+
+    passo = 1 if regiao is None else 10
+    pesos_altos = PESOS_PRIMEIRO[:6]
+    separador = "-" if formatado else ""
+
+    for alta in range(inicio // 1000, fim // 1000 + 1):
+        # Parte alta: calculada uma única vez para até 1000 bases
+        texto_alto = f"{alta:06d}"
+        digitos_altos = tuple(map(int, texto_alto))
+        ponderada_alta = sum(peso * digito for peso, digito in zip(pesos_altos, digitos_altos))
+        simples_alta = sum(digitos_altos)
+        if formatado:
+            texto_alto = f"{texto_alto[:3]}.{texto_alto[3:]}."
+
+        primeira = inicio - alta * 1000 if alta == inicio // 1000 else 0
+        ultima = fim - alta * 1000 if alta == fim // 1000 else 999
+        if regiao is not None:
+            primeira += (regiao - primeira) % 10
+
+        bases = range(primeira, ultima + 1, passo)
+        if alta % 111_111 == 0:
+            # Bloco de d × 111.111: a base d × 111.111.111 fica de fora
+            repetida = alta // 111_111 * 111
+            bases = [baixa for baixa in bases if baixa != repetida]
+
+        for baixa in bases:
+            soma = ponderada_alta + _BAIXA_PONDERADA[baixa]
+            primeiro = DIGITO_POR_SOMA[soma]
+            segundo = DIGITO_POR_SOMA[soma + simples_alta + _BAIXA_SIMPLES[baixa] + 2 * primeiro]
+            yield (texto_alto + _BAIXA_TEXTO[baixa] + separador
+                   + _VERIFICADORES_TEXTO[10 * primeiro + segundo])
+
+
+def contar_cpfs(inicio, fim, regiao=None):
+    """
+    Conta quantos CPFs enumerar_cpfs geraria, sem gerá-los.
+
+    Args:
+        inicio (int): Primeira base do intervalo
+        fim (int): Última base do intervalo (inclusive)
+        regiao (int, optional): Dígito da região fiscal
+
+    Returns:
+        int: Quantidade de CPFs no intervalo
+    """
+    repetidas = sum(inicio <= base <= fim and regiao in (None, base % 10) for base in BASES_REPETIDAS)
+    if regiao is None:
+        return fim - inicio + 1 - repetidas
+    primeira = inicio + (regiao - inicio) % 10
+    return (0 if primeira > fim else (fim - primeira) // 10 + 1) - repetidas
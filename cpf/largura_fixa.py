@@ -0,0 +1,222 @@
+"""
+Validação de Arquivos de Largura Fixa
+Autor: Felipe Alcântara
+Descrição: Valida arquivos de registros de largura fixa mapeando-os em memória,
+sem ler o arquivo para buffers intermediários.
+
+O arquivo vira uma matriz (registros, tamanho_registro) uint8 apoiada direto
+no mmap, e o campo do CPF é apenas uma fatia dessa matriz. Para cada bloco de
+registros, os 11 dígitos são copiados para um buffer de trabalho reutilizado,
+onde ord('0') é subtraído no próprio buffer antes do cálculo dos verificadores.
+"""
+
+import mmap
+import time
+
+from .fluxo import Estatisticas, escrever_bloco
+from .matriz import ZERO, np
+from .motivos import CARACTERES_PERMITIDOS
+from .vetorizado import NOMES_MOTIVOS, validar_caracteres, validar_digitos
+
+# Colunas dos 11 dígitos dentro do campo, para cada largura de campo aceita
+COLUNAS_DIGITOS = {
+    11: np.arange(11),                                       # XXXXXXXXXXX
+    14: np.array([0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13]),      # XXX.XXX.XXX-XX
+}
+
+# Caracteres aceitos nas posições da máscara sem sair do caminho rápido
+_SEPARADORES_MASCARA = np.zeros(256, dtype=bool)
+_SEPARADORES_MASCARA[list(map(ord, CARACTERES_PERMITIDOS))] = True
+
+# Quantidade de registros processados por vez
+REGISTROS_POR_BLOCO = 1 << 18
+
+
+def detectar_tamanho_registro(mapa):
+    """
+    Descobre o tamanho do registro pela posição da primeira quebra de linha.
+
+    Args:
+        mapa (mmap.mmap): Arquivo mapeado em memória
+
+    Returns:
+        int: Tamanho do registro, incluindo a quebra de linha
+
+    Raises:
+        ValueError: Se o arquivo não tiver nenhuma quebra de linha
+    """
+    quebra = mapa.find(b"\n")
+    if quebra < 0:
+        raise ValueError("Arquivo sem quebras de linha: informe o tamanho do registro.")
+    return quebra + 1
+
+
+class _Trabalho:
+    """Buffers de trabalho reutilizados entre os blocos."""
+
+    def __init__(self, registros_por_bloco):
+        self.digitos = np.empty((registros_por_bloco, 11), dtype=np.uint8)
+
+
+def validar_registros(campo, trabalho=None):
+    """
+    Valida um bloco de campos de CPF de largura fixa (11 ou 14 bytes).
+
+    Registros fora do layout esperado (espaços, dígitos ou letras no lugar da
+    máscara, CPF desalinhado) passam pelo caminho geral de validar_caracteres,
+    para que o resultado seja sempre o mesmo de validar_cpf.
+
+    Args:
+        campo (numpy.ndarray): Visão (N, largura) uint8 do campo em cada registro
+        trabalho (_Trabalho | None): Buffers reutilizáveis com ao menos N linhas
+
+    Returns:
+        tuple: (validos, motivos) - máscara booleana e vetor uint8 de motivos
+    """
+    largura = campo.shape[1]
+    colunas = COLUNAS_DIGITOS[largura]
+    quantidade = len(campo)
+
+    if trabalho is None or len(trabalho.digitos) < quantidade:
+        trabalho = _Trabalho(quantidade)
+    digitos = trabalho.digitos[:quantidade]
+
+    np.take(campo, colunas, axis=1, out=digitos)
+    np.subtract(digitos, ZERO, out=digitos)
+    # Com uint8, qualquer caractere que não seja dígito fica >= 10
+    no_layout = (digitos <= 9).all(axis=1)
+
+    if largura == 14:
+        # A máscara só pode ter caracteres permitidos que não sejam dígitos
+        separadores = campo[:, [3, 7, 11]]
+        no_layout &= _SEPARADORES_MASCARA[separadores].all(axis=1)
+
+    digitos[~no_layout] = 0
+    validos, motivos = validar_digitos(digitos)
+
+    fora = np.flatnonzero(~no_layout)
+    if len(fora):
+        motivos[fora] = validar_caracteres(campo[fora])[1]
+
+    return motivos == 0, motivos
+
+
+def blocos_largura_fixa(caminho, tamanho_registro=None, posicao=0, largura=None,
+                        registros_por_bloco=REGISTROS_POR_BLOCO):
+    """
+    Percorre um arquivo de largura fixa mapeado em memória, bloco a bloco.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        tamanho_registro (int | None): Bytes por registro, incluindo a quebra de
+            linha (padrão: posição da primeira quebra de linha + 1)
+        posicao (int): Posição do campo de CPF dentro do registro
+        largura (int | None): 11 (só dígitos) ou 14 (com máscara); padrão:
+            o tamanho do registro sem a quebra de linha
+        registros_por_bloco (int): Registros processados por vez
+
+    Yields:
+        tuple: (dados, linhas, validos, motivos) - dados é a visão do bloco no
+        mmap e linhas o trio (inicios, fins, quebras) usado por escrever_bloco
+
+    Raises:
+        ValueError: Se a posição for negativa, o tamanho do registro não for
+            positivo ou o layout não couber no registro
+    """
+    if posicao < 0:
+        raise ValueError(f"A posição do CPF no registro não pode ser negativa ({posicao}).")
+    if tamanho_registro is not None and tamanho_registro < 1:
+        raise ValueError(f"O tamanho do registro deve ser positivo, não {tamanho_registro}.")
+
+    with open(caminho, "rb") as arquivo:
+        try:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Arquivo vazio não pode ser mapeado
+
+    # O mmap é fechado pelo coletor de lixo quando a última visão NumPy sumir
+    tamanho_registro = tamanho_registro or detectar_tamanho_registro(mapa)
+    fim_conteudo = tamanho_registro
+    if mapa[tamanho_registro - 1:tamanho_registro] == b"\n":
+        fim_conteudo -= 1
+        if mapa[fim_conteudo - 1:fim_conteudo] == b"\r":
+            fim_conteudo -= 1
+    largura = largura or fim_conteudo - posicao
+    if largura not in COLUNAS_DIGITOS or posicao + largura > fim_conteudo:
+        raise ValueError(
+            f"Campo de CPF deve ter 11 ou 14 bytes dentro do registro de {tamanho_registro} bytes "
+            f"(posição {posicao}, largura {largura})."
+        )
+
+    arquivo_inteiro = np.frombuffer(mapa, dtype=np.uint8)
+    completos = len(mapa) // tamanho_registro
+    registros = arquivo_inteiro[:completos * tamanho_registro].reshape(completos, tamanho_registro)
+    trabalho = _Trabalho(min(registros_por_bloco, max(completos, 1)))
+    separacao = (0, fim_conteudo, tamanho_registro - 1)
+
+    for inicio in range(0, completos, registros_por_bloco):
+        bloco = registros[inicio:inicio + registros_por_bloco]
+        validos, motivos = validar_registros(bloco[:, posicao:posicao + largura], trabalho)
+        inicios = np.arange(len(bloco)) * tamanho_registro
+        linhas = tuple(inicios + deslocamento for deslocamento in separacao)
+        yield bloco.reshape(-1), linhas, validos, motivos
+
+    resto = arquivo_inteiro[completos * tamanho_registro:]
+    if len(resto):
+        # Último registro sem a quebra de linha final
+        if len(resto) < posicao + largura:
+            raise ValueError(f"Registro final incompleto ({len(resto)} bytes).")
+        ultimo = np.concatenate([resto, np.frombuffer(b"\n", dtype=np.uint8)])
+        validos, motivos = validar_registros(ultimo[None, posicao:posicao + largura])
+        fim = np.array([len(resto)])
+        yield ultimo, (np.array([0]), fim, fim), validos, motivos
+
+
+def validar_largura_fixa(caminho, tamanho_registro=None, posicao=0, largura=None):
+    """
+    Valida todos os registros de um arquivo de largura fixa.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        tamanho_registro (int | None): Bytes por registro, incluindo a quebra de linha
+        posicao (int): Posição do campo de CPF dentro do registro
+        largura (int | None): 11 (só dígitos) ou 14 (com máscara)
+
+    Returns:
+        tuple: (validos, motivos) - máscara booleana e vetor uint8 de motivos
+    """
+    partes = [(validos, motivos) for _, _, validos, motivos
+              in blocos_largura_fixa(caminho, tamanho_registro, posicao, largura)]
+    if not partes:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=np.uint8)
+    validos, motivos = zip(*partes)
+    return np.concatenate(validos), np.concatenate(motivos)
+
+
+def validar_arquivo_largura_fixa(caminho, tamanho_registro=None, posicao=0, largura=None,
+                                 validos=None, invalidos=None, anotado=None, separador=None):
+    """
+    Valida um arquivo de largura fixa e grava as saídas como fluxo.validar_arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        tamanho_registro (int | None): Bytes por registro, incluindo a quebra de linha
+        posicao (int): Posição do campo de CPF dentro do registro
+        largura (int | None): 11 (só dígitos) ou 14 (com máscara)
+        validos, invalidos, anotado: Arquivos binários de saída (opcionais)
+        separador (str | None): Separador da coluna de motivo na saída anotada
+
+    Returns:
+        Estatisticas: Linhas, bytes, tempo e contagem por motivo
+    """
+    estatisticas = Estatisticas()
+    inicio = time.perf_counter()
+
+    for dados, linhas, validos_bloco, motivos in blocos_largura_fixa(caminho, tamanho_registro, posicao, largura):
+        estatisticas.linhas += len(motivos)
+        estatisticas.bytes += len(dados)
+        estatisticas.por_motivo += np.bincount(motivos, minlength=len(NOMES_MOTIVOS))
+        escrever_bloco(dados, linhas, validos_bloco, motivos, separador, validos, invalidos, anotado)
+
+    estatisticas.segundos = time.perf_counter() - inicio
+    return estatisticas
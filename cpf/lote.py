@@ -0,0 +1,252 @@
+"""
+Gerador de CPF em Lote
+Autor: Felipe Alcântara
+Descrição: Gera milhões de CPFs válidos por segundo a partir de bytes
+aleatórios sorteados em bloco, sem chamar random.randint por dígito.
+"""
+
+import random
+
+from .matriz import ZERO, calcular_verificadores, np
+
+# Formatos de saída aceitos por gerar_lote
+FORMATO_MASCARA = "mascara"    # b"XXX.XXX.XXX-XX\n" (15 bytes por CPF)
+FORMATO_NUMEROS = "numeros"    # b"XXXXXXXXXXX\n" (12 bytes por CPF)
+FORMATO_DIGITOS = "digitos"    # numpy.ndarray (N, 11) uint8 com valores 0-9
+FORMATOS = (FORMATO_MASCARA, FORMATO_NUMEROS, FORMATO_DIGITOS)
+
+# Largura de cada registro e coluna de cada dígito nos formatos de texto
+LARGURA = {FORMATO_MASCARA: 15, FORMATO_NUMEROS: 12}
+POSICOES = {
+    FORMATO_MASCARA: [0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13],
+    FORMATO_NUMEROS: list(range(11)),
+}
+SEPARADORES = {
+    FORMATO_MASCARA: {3: ".", 7: ".", 11: "-", 14: "\n"},
+    FORMATO_NUMEROS: {11: "\n"},
+}
+
+# Quantidade de CPFs processados por vez (limita as matrizes temporárias)
+TAMANHO_BLOCO = 1 << 18
+
+# Bytes >= 250 são descartados para que "byte % 10" seja uniforme
+_LIMITE_UNIFORME = 250
+
+
+def validar_parametros(regiao, formato):
+    """
+    Confere a região fiscal e o formato pedidos para um lote.
+
+    Args:
+        regiao (int | None): Dígito da região fiscal (0-9) ou None
+        formato (str): Um dos valores de FORMATOS
+
+    Raises:
+        ValueError: Se a região ou o formato forem inválidos
+    """
+    if regiao is not None and regiao not in range(10):
+        raise ValueError(f"Região fiscal deve ser um dígito de 0 a 9, não {regiao!r}.")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato deve ser um de {', '.join(FORMATOS)}, não {formato!r}.")
+
+
+def sortear_digitos(quantidade, sortear_bytes=random.randbytes):
+    """
+    Sorteia dígitos uniformes de 0 a 9 a partir de bytes aleatórios em bloco.
+
+    Args:
+        quantidade (int): Quantidade de dígitos desejada
+        sortear_bytes (callable): Função que devolve N bytes aleatórios
+
+    Returns:
+        numpy.ndarray: Vetor uint8 com os dígitos sorteados
+    """
+    digitos = np.empty(quantidade, dtype=np.uint8)
+    preenchidos = 0
+
+    while preenchidos < quantidade:
+        falta = quantidade - preenchidos
+        # Sorteia uma pequena sobra para compensar os bytes descartados
+        brutos = np.frombuffer(sortear_bytes(falta + falta // 32 + 64), dtype=np.uint8)
+        aceitos = brutos[brutos < _LIMITE_UNIFORME][:falta]
+        np.remainder(aceitos, 10, out=digitos[preenchidos:preenchidos + len(aceitos)])
+        preenchidos += len(aceitos)
+
+    return digitos
+
+
+def gerar_matriz(quantidade, regiao=None, sortear_bytes=random.randbytes):
+    """
+    Gera uma matriz de CPFs válidos, um por linha.
+
+    Linhas sorteadas com os nove dígitos da base iguais (000000000 a
+    999999999) são sorteadas de novo, porque o CPF seria inválido.
+
+    Args:
+        quantidade (int): Quantidade de CPFs
+        regiao (int | numpy.ndarray | None): Fixa o 9º dígito na região
+            fiscal escolhida, ou em uma região por linha se for um vetor
+        sortear_bytes (callable): Função que devolve N bytes aleatórios
+
+    Returns:
+        numpy.ndarray: Matriz (N, 11) uint8 com os dígitos de cada CPF
+    """
+    cpfs = np.empty((quantidade, 11), dtype=np.uint8)
+    sorteados = 9 if regiao is None else 8
+
+    cpfs[:, :sorteados] = sortear_digitos(quantidade * sorteados, sortear_bytes).reshape(quantidade, sorteados)
+    if regiao is not None:
+        cpfs[:, 8] = regiao
+
+    # Só as linhas com os dois primeiros dígitos iguais precisam da comparação completa
+    repetidas = np.flatnonzero(cpfs[:, 0] == cpfs[:, 1])
+    repetidas = repetidas[(cpfs[repetidas, :9] == cpfs[repetidas, :1]).all(axis=1)]
+    while repetidas.size:
+        cpfs[repetidas, :sorteados] = sortear_digitos(repetidas.size * sorteados, sortear_bytes).reshape(-1, sorteados)
+        repetidas = repetidas[(cpfs[repetidas, :9] == cpfs[repetidas, :1]).all(axis=1)]
+
+    cpfs[:, 9], cpfs[:, 10] = calcular_verificadores(cpfs[:, :9])
+    return cpfs
+
+
+def codificar(cpfs, formato, destino=None):
+    """
+    Converte uma matriz de dígitos em registros de texto ASCII de largura fixa.
+
+    Args:
+        cpfs (numpy.ndarray): Matriz (N, 11) com os dígitos de cada CPF
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+        destino (numpy.ndarray | None): Matriz (N, largura) uint8 já alocada
+
+    Returns:
+        numpy.ndarray: Matriz (N, largura) uint8 com os registros
+    """
+    if destino is None:
+        destino = np.empty((len(cpfs), LARGURA[formato]), dtype=np.uint8)
+
+    for coluna, caractere in SEPARADORES[formato].items():
+        destino[:, coluna] = ord(caractere)
+    destino[:, POSICOES[formato]] = cpfs + ZERO
+
+    return destino
+
+
+def gerar_lote(n, regiao=None, formato=FORMATO_MASCARA, sortear_bytes=random.randbytes):
+    """
+    Gera N CPFs válidos de uma só vez.
+
+    Os dígitos vêm de bytes aleatórios sorteados em bloco e os verificadores
+    são calculados de forma vetorizada, TAMANHO_BLOCO CPFs por vez.
+
+    Args:
+        n (int): Quantidade de CPFs
+        regiao (int | None): Dígito da região fiscal (0-9) ou None para aleatória
+        formato (str): FORMATO_MASCARA, FORMATO_NUMEROS ou FORMATO_DIGITOS
+        sortear_bytes (callable): Função que devolve N bytes aleatórios
+
+    Returns:
+        bytearray | numpy.ndarray: Registros de texto separados por '\\n' ou,
+        no formato FORMATO_DIGITOS, a matriz (N, 11) uint8
+
+    Raises:
+        ValueError: Se a quantidade, a região ou o formato forem inválidos
+    """
+    if n < 0:
+        raise ValueError(f"A quantidade de CPFs não pode ser negativa ({n}).")
+    validar_parametros(regiao, formato)
+
+    if formato == FORMATO_DIGITOS:
+        saida = np.empty((n, 11), dtype=np.uint8)
+        visao = saida
+    else:
+        saida = bytearray(n * LARGURA[formato])
+        visao = np.frombuffer(saida, dtype=np.uint8).reshape(n, LARGURA[formato])
+
+    for inicio in range(0, n, TAMANHO_BLOCO):
+        fim = min(inicio + TAMANHO_BLOCO, n)
+        cpfs = gerar_matriz(fim - inicio, regiao, sortear_bytes)
+        if formato == FORMATO_DIGITOS:
+            visao[inicio:fim] = cpfs
+        else:
+            codificar(cpfs, formato, visao[inicio:fim])
+
+    return saida
+
+
+def distribuir_cotas(total, proporcoes):
+    """
+    Converte proporções por região em quantidades exatas que somam o total.
+
+    Usa o método dos maiores restos: cada região recebe a parte inteira da
+    sua fatia e as unidades que sobram vão para as maiores partes decimais.
+
+    Args:
+        total (int): Quantidade total de CPFs
+        proporcoes (dict): Dígito da região -> peso (ex.: {8: 0.22, 6: 0.10})
+
+    Returns:
+        dict: Dígito da região -> quantidade de CPFs
+
+    Raises:
+        ValueError: Se houver região inválida ou a soma dos pesos não for positiva
+    """
+    for regiao in proporcoes:
+        validar_parametros(regiao, FORMATO_DIGITOS)
+    soma = sum(proporcoes.values())
+    if soma <= 0 or any(peso < 0 for peso in proporcoes.values()):
+        raise ValueError("As proporções devem ser não negativas e com soma positiva.")
+
+    fatias = {regiao: total * peso / soma for regiao, peso in proporcoes.items()}
+    cotas = {regiao: int(fatia) for regiao, fatia in fatias.items()}
+    sobra = total - sum(cotas.values())
+    for regiao in sorted(fatias, key=lambda regiao: fatias[regiao] - cotas[regiao], reverse=True)[:sobra]:
+        cotas[regiao] += 1
+    return cotas
+
+
+def gerar_por_cotas(cotas, formato=FORMATO_MASCARA, tamanho_bloco=TAMANHO_BLOCO, gerador=None):
+    """
+    Gera exatamente cotas[regiao] CPFs de cada região, embaralhados, em blocos.
+
+    A cada bloco, a quantidade de cada região é sorteada da distribuição
+    hipergeométrica multivariada sobre o que ainda falta gerar. O resultado
+    é uma ordem uniformemente embaralhada do total, mas só um bloco fica em
+    memória por vez, seja qual for a quantidade total.
+
+    Args:
+        cotas (dict): Dígito da região fiscal (0-9) -> quantidade de CPFs
+        formato (str): FORMATO_MASCARA, FORMATO_NUMEROS ou FORMATO_DIGITOS
+        tamanho_bloco (int): Quantidade de CPFs em cada bloco gerado
+        gerador (numpy.random.Generator | None): Fonte de aleatoriedade
+
+    Yields:
+        bytearray | numpy.ndarray: Bloco no mesmo formato de gerar_lote
+
+    Raises:
+        ValueError: Se houver região, quantidade ou formato inválidos
+    """
+    for regiao, quantidade in cotas.items():
+        validar_parametros(regiao, formato)
+        if quantidade < 0:
+            raise ValueError(f"A cota da região {regiao} não pode ser negativa ({quantidade}).")
+    if gerador is None:
+        gerador = np.random.default_rng()
+
+    regioes = np.array(list(cotas), dtype=np.uint8)
+    restantes = np.array(list(cotas.values()), dtype=np.int64)
+
+    while restantes.sum():
+        quantidade = int(min(tamanho_bloco, restantes.sum()))
+        no_bloco = gerador.multivariate_hypergeometric(restantes, quantidade)
+        restantes -= no_bloco
+
+        coluna_regiao = np.repeat(regioes, no_bloco)
+        gerador.shuffle(coluna_regiao)
+        cpfs = gerar_matriz(quantidade, coluna_regiao, gerador.bytes)
+
+        if formato == FORMATO_DIGITOS:
+            yield cpfs
+        else:
+            bloco = bytearray(quantidade * LARGURA[formato])
+            codificar(cpfs, formato, np.frombuffer(bloco, dtype=np.uint8).reshape(quantidade, -1))
+            yield bloco
@@ -0,0 +1,52 @@
+"""
+Motor Vetorizado do CPF
+Autor: Felipe Alcântara
+Descrição: Calcula dígitos verificadores de muitos CPFs de uma vez, usando
+matrizes NumPy de dígitos (uint8).
+
+NOTA: NumPy é uma dependência opcional, necessária apenas para as operações
+em lote. Instale com: pip install numpy
+"""
+
+try:
+    import numpy as np
+except ImportError as erro:  # pragma: no cover - depende do ambiente
+    raise ImportError(
+        "As operações em lote do pacote cpf precisam do NumPy. "
+        "Instale com: pip install numpy"
+    ) from erro
+
+from .nucleo import DIGITO_POR_SOMA, PESOS_PRIMEIRO, PESOS_SEGUNDO
+
+# Tabela soma ponderada → dígito verificador, como vetor NumPy
+TABELA_DIGITO = np.asarray(DIGITO_POR_SOMA, dtype=np.uint8)
+
+# Pesos do primeiro verificador como vetor coluna para o produto matricial
+VETOR_PESOS = np.asarray(PESOS_PRIMEIRO, dtype=np.int32)
+
+# Pesos dos dois verificadores lado a lado, para os 10 primeiros dígitos:
+# digitos[:, :10] @ MATRIZ_PESOS devolve as duas somas de uma vez
+MATRIZ_PESOS = np.array([PESOS_PRIMEIRO + (0,), PESOS_SEGUNDO], dtype=np.int32).T
+
+# Código ASCII do caractere '0'
+ZERO = ord("0")
+
+
+def calcular_verificadores(bases):
+    """
+    Calcula os dois dígitos verificadores de cada linha da matriz.
+
+    Usa o mesmo atalho do núcleo: a soma do segundo verificador é a soma
+    ponderada do primeiro mais a soma simples dos dígitos e 2 × o primeiro.
+
+    Args:
+        bases (numpy.ndarray): Matriz (N, 9) com os 9 primeiros dígitos
+
+    Returns:
+        tuple: (primeiros, segundos), vetores uint8 de tamanho N
+    """
+    bases = bases.astype(np.int32, copy=False)
+    soma = bases @ VETOR_PESOS
+    primeiros = TABELA_DIGITO[soma]
+    segundos = TABELA_DIGITO[soma + bases.sum(axis=1) + 2 * primeiros.astype(np.int32)]
+    return primeiros, segundos
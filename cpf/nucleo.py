@@ -0,0 +1,121 @@
+"""
+Núcleo de Cálculo do CPF
+Autor: Felipe Alcântara
+Descrição: Motor de dígitos verificadores baseado em tabelas pré-calculadas,
+compartilhado pelas versões de terminal e web.
+
+NOTA: Este módulo usa apenas Python puro para continuar funcionando no
+navegador através do Brython.
+"""
+
+# Pesos aplicados aos 9 primeiros dígitos em cada verificador
+PESOS_PRIMEIRO = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+PESOS_SEGUNDO = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Maior soma ponderada possível no cálculo do segundo verificador
+# (9 × (11 + 10 + ... + 3) + 9 × 2)
+_SOMA_MAXIMA = 9 * sum(PESOS_SEGUNDO)
+
+# Dígito verificador para cada resto da divisão por 11
+DIGITO_POR_RESTO = tuple(0 if resto < 2 else 11 - resto for resto in range(11))
+
+# Dígito verificador indexado diretamente pela soma ponderada (evita o % 11)
+DIGITO_POR_SOMA = tuple(DIGITO_POR_RESTO[soma % 11] for soma in range(_SOMA_MAXIMA + 1))
+
+# Tabela do str.translate que apaga todo caractere ASCII que não é dígito
+_APAGAR_NAO_DIGITOS_ASCII = dict.fromkeys(codigo for codigo in range(128) if not 48 <= codigo <= 57)
+
+
+def limpar_cpf(cpf):
+    """
+    Remove todos os caracteres não numéricos do CPF.
+
+    Tem o mesmo resultado de re.sub(r'\\D', '', cpf), mas trata sem regex os
+    formatos mais comuns: 11 dígitos puros e a máscara XXX.XXX.XXX-XX.
+    Outros textos ASCII passam por uma tabela do str.translate, e só os que
+    têm caracteres fora do ASCII caem na regra geral.
+
+    Args:
+        cpf (str): CPF em qualquer formato
+
+    Returns:
+        str: CPF apenas com números
+    """
+    if len(cpf) == 11 and cpf.isdecimal():
+        return cpf
+    if len(cpf) == 14 and cpf[3] == "." and cpf[7] == "." and cpf[11] == "-":
+        limpo = cpf[:3] + cpf[4:7] + cpf[8:11] + cpf[12:]
+        if limpo.isdecimal():
+            return limpo
+    if cpf.isascii():
+        return cpf.translate(_APAGAR_NAO_DIGITOS_ASCII)
+    return "".join(filter(str.isdecimal, cpf))
+
+
+def calcular_digitos_verificadores(digitos):
+    """
+    Calcula os dois dígitos verificadores do CPF em uma única passada.
+
+    Como o peso de cada dígito no segundo verificador é o peso do primeiro
+    mais um, a soma do segundo é a soma do primeiro acrescida da soma simples
+    dos dígitos e de 2 × o primeiro verificador. Nenhuma lista intermediária
+    é criada.
+
+    Args:
+        digitos (list): Sequência com os 9 primeiros dígitos do CPF (lista,
+            tupla ou bytes com valores de 0 a 9)
+
+    Returns:
+        tuple: (primeiro_verificador, segundo_verificador)
+    """
+    d0, d1, d2, d3, d4, d5, d6, d7, d8 = digitos
+    soma = 10*d0 + 9*d1 + 8*d2 + 7*d3 + 6*d4 + 5*d5 + 4*d6 + 3*d7 + 2*d8
+    primeiro = DIGITO_POR_SOMA[soma]
+    segundo = DIGITO_POR_SOMA[soma + d0 + d1 + d2 + d3 + d4 + d5 + d6 + d7 + d8 + 2*primeiro]
+    return primeiro, segundo
+
+
+def calcular_primeiro_digito(digitos):
+    """
+    Calcula o primeiro dígito verificador do CPF.
+
+    Args:
+        digitos (list): Lista com os 9 primeiros dígitos do CPF
+
+    Returns:
+        int: Primeiro dígito verificador
+    """
+    d0, d1, d2, d3, d4, d5, d6, d7, d8 = digitos
+    return DIGITO_POR_SOMA[10*d0 + 9*d1 + 8*d2 + 7*d3 + 6*d4 + 5*d5 + 4*d6 + 3*d7 + 2*d8]
+
+
+def calcular_segundo_digito(digitos, primeiro_digito):
+    """
+    Calcula o segundo dígito verificador do CPF.
+
+    Args:
+        digitos (list): Lista com os 9 primeiros dígitos do CPF
+        primeiro_digito (int): Primeiro dígito verificador
+
+    Returns:
+        int: Segundo dígito verificador
+    """
+    d0, d1, d2, d3, d4, d5, d6, d7, d8 = digitos
+    return DIGITO_POR_SOMA[11*d0 + 10*d1 + 9*d2 + 8*d3 + 7*d4 + 6*d5 + 5*d6 + 4*d7 + 3*d8
+                           + 2*primeiro_digito]
+
+
+def formatar_cpf(digitos, digito1, digito2):
+    """
+    Formata o CPF no padrão XXX.XXX.XXX-XX.
+
+    Args:
+        digitos (list): Lista com os 9 primeiros dígitos
+        digito1 (int): Primeiro dígito verificador
+        digito2 (int): Segundo dígito verificador
+
+    Returns:
+        str: CPF formatado
+    """
+    cpf_numeros = ''.join(map(str, digitos))
+    return f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{digito1}{digito2}"
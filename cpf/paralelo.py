@@ -0,0 +1,208 @@
+"""
+Validação Paralela de Arquivos
+Autor: Felipe Alcântara
+Descrição: Divide arquivos grandes em fatias alinhadas em quebras de linha e
+valida cada fatia em um processo separado, aproveitando todos os núcleos.
+
+Os motivos de todas as linhas ficam em um único vetor em memória
+compartilhada, onde cada processo escreve a partir da primeira linha da sua
+fatia. As saídas de cada fatia vão para arquivos temporários, concatenados
+na ordem original no final.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from .fluxo import (
+    TAMANHO_BLOCO,
+    Estatisticas,
+    escrever_bloco,
+    escrever_cabecalho,
+    indice_da_coluna,
+    ler_blocos,
+    validar_bloco,
+)
+from .matriz import np
+from .vetorizado import NOMES_MOTIVOS
+
+# Fatias por processo: mais de uma equilibra a carga quando as fatias demoram
+# tempos diferentes
+FATIAS_POR_PROCESSO = 4
+
+# Nomes das saídas, na ordem em que são passadas para escrever_bloco
+SAIDAS = ("validos", "invalidos", "anotado")
+
+
+class _Fatia:
+    """Arquivo somente leitura restrito a um intervalo de bytes."""
+
+    def __init__(self, arquivo, inicio, fim):
+        arquivo.seek(inicio)
+        self.arquivo = arquivo
+        self.restante = fim - inicio
+
+    def read(self, tamanho):
+        lido = self.arquivo.read(min(tamanho, self.restante))
+        self.restante -= len(lido)
+        return lido
+
+
+def dividir_em_fatias(caminho, quantidade, inicio=0):
+    """
+    Divide um arquivo em intervalos de bytes que começam sempre no início de uma linha.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        quantidade (int): Quantidade desejada de fatias
+        inicio (int): Primeiro byte considerado (depois do cabeçalho, por exemplo)
+
+    Returns:
+        list: Pares (inicio, fim) sem sobreposição, cobrindo o arquivo inteiro
+    """
+    tamanho = os.path.getsize(caminho)
+    passo = max((tamanho - inicio) // max(quantidade, 1), 1)
+    limites = [inicio]
+
+    with open(caminho, "rb") as arquivo:
+        for alvo in range(inicio + passo, tamanho, passo):
+            if alvo <= limites[-1]:
+                continue
+            # Avança até logo depois da próxima quebra de linha
+            arquivo.seek(alvo - 1)
+            arquivo.readline()
+            posicao = arquivo.tell()
+            if posicao >= tamanho:
+                break
+            if posicao > limites[-1]:
+                limites.append(posicao)
+
+    limites.append(tamanho)
+    return [(a, b) for a, b in zip(limites, limites[1:]) if b > a]
+
+
+def _contar_linhas(tarefa):
+    """Conta as linhas de uma fatia (a última linha pode não ter '\\n')."""
+    caminho, inicio, fim, tamanho_bloco = tarefa
+    linhas = 0
+    ultimo = b"\n"
+    with open(caminho, "rb") as arquivo:
+        fatia = _Fatia(arquivo, inicio, fim)
+        while bloco := fatia.read(tamanho_bloco):
+            linhas += bloco.count(b"\n")
+            ultimo = bloco[-1:]
+    return linhas + (ultimo != b"\n")
+
+
+def _validar_fatia(tarefa):
+    """Valida uma fatia, grava os motivos na memória compartilhada e as saídas em arquivos parciais."""
+    (caminho, inicio, fim, primeira_linha, total_linhas, nome_memoria,
+     separador, indice, caminhos_parciais, tamanho_bloco) = tarefa
+
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        motivos_compartilhados = np.ndarray((total_linhas,), dtype=np.uint8, buffer=memoria.buf)
+        linha = primeira_linha
+
+        with contextlib.ExitStack() as pilha:
+            saidas = [pilha.enter_context(open(parcial, "wb")) if parcial else None
+                      for parcial in caminhos_parciais]
+            arquivo = pilha.enter_context(open(caminho, "rb"))
+
+            for bloco in ler_blocos(_Fatia(arquivo, inicio, fim), tamanho_bloco):
+                dados = np.frombuffer(bloco, dtype=np.uint8)
+                linhas, validos_bloco, motivos = validar_bloco(dados, separador, indice)
+                motivos_compartilhados[linha:linha + len(motivos)] = motivos
+                linha += len(motivos)
+                escrever_bloco(dados, linhas, validos_bloco, motivos, separador, *saidas)
+
+        del motivos_compartilhados
+    finally:
+        memoria.close()
+
+
+def validar_arquivo_paralelo(caminho, processos=None, coluna=1, separador=None, cabecalho=False,
+                             validos=None, invalidos=None, anotado=None, tamanho_bloco=TAMANHO_BLOCO,
+                             devolver_motivos=False):
+    """
+    Valida a coluna de CPFs de um arquivo usando vários processos.
+
+    Produz exatamente as mesmas saídas de fluxo.validar_arquivo, na mesma
+    ordem de linhas, qualquer que seja a quantidade de processos.
+
+    Args:
+        caminho (str): Caminho do arquivo (precisa permitir seek; não aceita "-")
+        processos (int | None): Quantidade de processos (padrão: núcleos da máquina)
+        coluna (int | str): Número da coluna (a partir de 1) ou nome no cabeçalho
+        separador (str | None): Separador de campos; None para uma linha por CPF
+        cabecalho (bool): Se a primeira linha é um cabeçalho
+        validos, invalidos, anotado: Arquivos binários de saída (opcionais)
+        tamanho_bloco (int): Quantidade de bytes lidos por vez em cada processo
+        devolver_motivos (bool): Devolve também o vetor de motivos de todas as linhas
+
+    Returns:
+        Estatisticas | tuple: As estatísticas ou, com devolver_motivos,
+        (estatisticas, motivos)
+
+    Raises:
+        ValueError: Se o tamanho do bloco não for positivo
+    """
+    if tamanho_bloco < 1:
+        raise ValueError(f"O tamanho do bloco deve ser positivo, não {tamanho_bloco}.")
+    processos = processos or os.cpu_count() or 1
+    estatisticas = Estatisticas()
+    inicio = time.perf_counter()
+
+    with open(caminho, "rb") as arquivo:
+        linha_cabecalho = arquivo.readline() if cabecalho else None
+    indice = indice_da_coluna(coluna, linha_cabecalho, separador)
+    saidas = dict(zip(SAIDAS, (validos, invalidos, anotado)))
+    if linha_cabecalho:
+        escrever_cabecalho(linha_cabecalho, separador, validos, invalidos, anotado)
+
+    fatias = dividir_em_fatias(caminho, processos * FATIAS_POR_PROCESSO,
+                               len(linha_cabecalho) if linha_cabecalho else 0)
+
+    if os.name == "posix":
+        # Os processos filhos precisam herdar o rastreador de recursos do pai;
+        # senão cada um inicia o seu e acusa a memória compartilhada como vazada
+        resource_tracker.ensure_running()
+
+    with multiprocessing.Pool(processos) as pool, tempfile.TemporaryDirectory(prefix="cpf-") as temporario:
+        linhas_por_fatia = pool.map(_contar_linhas, [(caminho, a, b, tamanho_bloco) for a, b in fatias])
+        primeiras = np.concatenate([[0], np.cumsum(linhas_por_fatia, dtype=np.int64)])
+        total_linhas = int(primeiras[-1])
+
+        memoria = shared_memory.SharedMemory(create=True, size=max(total_linhas, 1))
+        try:
+            tarefas = []
+            for numero, (a, b) in enumerate(fatias):
+                parciais = [os.path.join(temporario, f"{nome}-{numero}") if saidas[nome] is not None else None
+                            for nome in SAIDAS]
+                tarefas.append((caminho, a, b, int(primeiras[numero]), total_linhas, memoria.name,
+                                separador, indice, parciais, tamanho_bloco))
+            pool.map(_validar_fatia, tarefas)
+
+            # Concatena as saídas parciais na ordem original das fatias
+            for nome, saida in saidas.items():
+                if saida is None:
+                    continue
+                for numero in range(len(fatias)):
+                    with open(os.path.join(temporario, f"{nome}-{numero}"), "rb") as parcial:
+                        shutil.copyfileobj(parcial, saida, 1 << 20)
+
+            motivos = np.ndarray((total_linhas,), dtype=np.uint8, buffer=memoria.buf)
+            estatisticas.por_motivo += np.bincount(motivos, minlength=len(NOMES_MOTIVOS))
+            motivos = motivos.copy() if devolver_motivos else None
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+    estatisticas.linhas = total_linhas
+    estatisticas.bytes = os.path.getsize(caminho)
+    estatisticas.segundos = time.perf_counter() - inicio
+    return (estatisticas, motivos) if devolver_motivos else estatisticas
@@ -0,0 +1,499 @@
+"""
+Servidor HTTP de Validação e Geração
+Autor: Felipe Alcântara
+Descrição: Serviço HTTP/JSON local, feito só com asyncio, que valida CPFs
+avulsos e em lote e gera CPFs em fluxo.
+
+Requisições avulsas que chegam ao mesmo tempo são agrupadas em micro-lotes
+e validadas em uma única chamada de validar_coluna. O lote é fechado quando
+atinge lote_maximo ou quando o primeiro CPF já esperou espera_maxima.
+
+A geração responde em Transfer-Encoding: chunked. Cada pedaço já sai
+codificado em bytes de gerar_lote, e o próximo só é gerado depois que o
+buffer de envio da conexão esvazia (drain), então um cliente lento não faz
+o servidor acumular dados.
+
+Rotas:
+    POST /validar        {"cpf": "..."}         -> {"cpf", "valido", "motivo"}
+    POST /validar/lote   {"cpfs": ["...", ...]} -> {"resultados": [...], "validos"}
+    GET  /cpfs?n=N[&regiao=D][&formato=mascara|numeros][&saida=ndjson|csv][&semente=S]
+    GET  /metricas       Latência p50/p99 e histogramas de latência e de lote
+"""
+
+import asyncio
+import collections
+import json
+import random
+import sys
+import time
+import traceback
+from urllib.parse import parse_qs
+
+from .aleatorio import FluxosAleatorios
+from .lote import FORMATO_MASCARA, FORMATO_NUMEROS, LARGURA, codificar, gerar_matriz, validar_parametros
+from .matriz import np
+from .motivos import NOMES_MOTIVOS
+from .vetorizado import validar_coluna
+
+# Padrões do agrupamento em micro-lotes
+LOTE_MAXIMO = 1024
+ESPERA_MAXIMA = 0.002    # segundos
+
+# Maior corpo de requisição aceito
+TAMANHO_MAXIMO_CORPO = 16 << 20
+
+# CPFs gerados por pedaço da resposta em fluxo
+CPFS_POR_PEDACO = 1 << 14
+
+# Limite do buffer de envio a partir do qual drain() espera o cliente ler
+LIMITE_BUFFER_ENVIO = 1 << 20
+
+# Maior quantidade de CPFs pedida em GET /cpfs
+MAXIMO_GERACAO = 10 ** 9
+
+# Formatos de GET /cpfs: saída -> (Content-Type, prefixo de cada linha, sufixo)
+SAIDAS_GERACAO = {
+    "ndjson": ("application/x-ndjson", b'{"cpf":"', b'"}\n'),
+    "csv": ("text/csv", b"", b"\n"),
+}
+
+# Limites superiores (ms) das faixas do histograma de latência
+FAIXAS_LATENCIA_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Quantidade de latências recentes usadas no cálculo de p50/p99
+JANELA_LATENCIAS = 1 << 16
+
+_TEXTOS_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class ErroRequisicao(Exception):
+    """Requisição inválida; vira uma resposta HTTP com o status indicado."""
+
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+Requisicao = collections.namedtuple(
+    "Requisicao", ["metodo", "caminho", "consulta", "cabecalhos", "corpo", "manter_conexao"]
+)
+
+
+class Metricas:
+    """Latência das requisições e tamanho dos micro-lotes."""
+
+    def __init__(self):
+        self.requisicoes = 0
+        self.latencias = collections.deque(maxlen=JANELA_LATENCIAS)
+        self.por_faixa_latencia = [0] * (len(FAIXAS_LATENCIA_MS) + 1)
+        self.lotes = 0
+        self.cpfs_em_lotes = 0
+        # Faixas em potências de 2: chave k conta os lotes de 2^(k-1) a 2^k - 1
+        self.por_faixa_lote = collections.Counter()
+
+    def registrar_requisicao(self, segundos):
+        """Registra a latência de uma requisição."""
+        milissegundos = segundos * 1000
+        self.requisicoes += 1
+        self.latencias.append(milissegundos)
+        faixa = 0
+        while faixa < len(FAIXAS_LATENCIA_MS) and milissegundos > FAIXAS_LATENCIA_MS[faixa]:
+            faixa += 1
+        self.por_faixa_latencia[faixa] += 1
+
+    def registrar_lote(self, tamanho):
+        """Registra o tamanho de um micro-lote validado."""
+        self.lotes += 1
+        self.cpfs_em_lotes += tamanho
+        self.por_faixa_lote[tamanho.bit_length()] += 1
+
+    def percentil(self, fracao):
+        """Latência (ms) do percentil pedido entre as requisições recentes."""
+        if not self.latencias:
+            return None
+        ordenadas = sorted(self.latencias)
+        return ordenadas[min(int(fracao * len(ordenadas)), len(ordenadas) - 1)]
+
+    def resumo(self):
+        """
+        Monta o relatório exposto em GET /metricas.
+
+        Returns:
+            dict: Contagens, p50/p99 e os dois histogramas
+        """
+        faixas = [f"<={limite}" for limite in FAIXAS_LATENCIA_MS] + [f">{FAIXAS_LATENCIA_MS[-1]}"]
+        return {
+            "requisicoes": self.requisicoes,
+            "latencia_ms": {
+                "p50": self.percentil(0.50),
+                "p99": self.percentil(0.99),
+                "histograma": dict(zip(faixas, self.por_faixa_latencia)),
+            },
+            "micro_lotes": {
+                "lotes": self.lotes,
+                "tamanho_medio": self.cpfs_em_lotes / self.lotes if self.lotes else None,
+                "histograma": {
+                    (f"{1 << (k - 1)}-{(1 << k) - 1}" if k > 1 else "1"): self.por_faixa_lote[k]
+                    for k in sorted(self.por_faixa_lote)
+                },
+            },
+        }
+
+
+class AgrupadorLotes:
+    """
+    Junta validações avulsas concorrentes em micro-lotes vetorizados.
+
+    Atributos:
+        lote_maximo (int): Maior quantidade de CPFs em um micro-lote
+        espera_maxima (float): Tempo máximo (s) que o primeiro CPF espera
+    """
+
+    def __init__(self, lote_maximo=LOTE_MAXIMO, espera_maxima=ESPERA_MAXIMA, metricas=None):
+        if lote_maximo < 1:
+            raise ValueError(f"O lote máximo deve ser pelo menos 1, não {lote_maximo}.")
+        if not espera_maxima >= 0:
+            raise ValueError(f"A espera máxima não pode ser negativa ({espera_maxima}).")
+        self.lote_maximo = lote_maximo
+        self.espera_maxima = espera_maxima
+        self.metricas = metricas or Metricas()
+        self._pendentes = collections.deque()
+        self._chegou = asyncio.Event()
+        self._cheio = asyncio.Event()
+
+    async def validar(self, cpf):
+        """
+        Valida um CPF dentro do próximo micro-lote.
+
+        Args:
+            cpf (str): CPF em qualquer formato
+
+        Returns:
+            int: Código do Motivo
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendentes.append((cpf, futuro))
+        self._chegou.set()
+        if len(self._pendentes) >= self.lote_maximo:
+            self._cheio.set()
+        return await futuro
+
+    async def executar(self):
+        """Laço que fecha e valida os micro-lotes (roda até ser cancelado)."""
+        while True:
+            await self._chegou.wait()
+            if len(self._pendentes) < self.lote_maximo and self.espera_maxima > 0:
+                self._cheio.clear()
+                try:
+                    await asyncio.wait_for(self._cheio.wait(), self.espera_maxima)
+                except asyncio.TimeoutError:
+                    pass
+
+            quantidade = min(len(self._pendentes), self.lote_maximo)
+            lote = [self._pendentes.popleft() for _ in range(quantidade)]
+            if not self._pendentes:
+                self._chegou.clear()
+
+            try:
+                _, motivos = validar_coluna(np.array([cpf for cpf, _ in lote], dtype=object))
+            except Exception as erro:
+                # Um lote com problema não pode derrubar o laço dos próximos
+                for _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+                continue
+
+            self.metricas.registrar_lote(quantidade)
+            for (_, futuro), motivo in zip(lote, motivos.tolist()):
+                if not futuro.done():
+                    futuro.set_result(motivo)
+
+
+def _ler_json(corpo, campo, tipo):
+    """Lê o campo obrigatório de um corpo JSON, conferindo o tipo."""
+    try:
+        valor = json.loads(corpo)[campo]
+    except (ValueError, TypeError, KeyError):
+        raise ErroRequisicao(400, f'O corpo deve ser um JSON com o campo "{campo}".') from None
+    if not isinstance(valor, tipo):
+        raise ErroRequisicao(400, f'O campo "{campo}" tem o tipo errado.')
+    return valor
+
+
+def montar_resposta(status, corpo, manter_conexao, tipo="application/json"):
+    """
+    Monta uma resposta HTTP/1.1 completa.
+
+    Args:
+        status (int): Código HTTP
+        corpo (bytes): Corpo da resposta
+        manter_conexao (bool): Se a conexão continua aberta depois
+        tipo (str): Content-Type
+
+    Returns:
+        bytes: Cabeçalhos e corpo
+    """
+    cabecalhos = (
+        f"HTTP/1.1 {status} {_TEXTOS_STATUS.get(status, '')}\r\n"
+        f"Content-Type: {tipo}\r\n"
+        f"Content-Length: {len(corpo)}\r\n"
+        f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n\r\n"
+    )
+    return cabecalhos.encode("latin-1") + corpo
+
+
+async def ler_requisicao(leitor):
+    """
+    Lê uma requisição HTTP/1.1 da conexão.
+
+    Args:
+        leitor (asyncio.StreamReader): Conexão do cliente
+
+    Returns:
+        Requisicao | None: Requisição lida, ou None se o cliente fechou a conexão
+
+    Raises:
+        ErroRequisicao: Se a requisição for malformada ou grande demais
+    """
+    linha = await leitor.readline()
+    if not linha:
+        return None
+    try:
+        metodo, caminho, versao = linha.decode("latin-1").split()
+    except ValueError:
+        raise ErroRequisicao(400, "Linha de requisição inválida.") from None
+
+    cabecalhos = {}
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+
+    # Só dígitos ASCII: int() aceitaria sinal, espaços e "_" (ex.: "-1", "1_0")
+    valor = cabecalhos.get("content-length", "") or "0"
+    if not (valor.isascii() and valor.isdigit()):
+        raise ErroRequisicao(400, "Content-Length inválido.")
+    tamanho = int(valor)
+    if tamanho > TAMANHO_MAXIMO_CORPO:
+        raise ErroRequisicao(413, "Corpo da requisição grande demais.")
+    corpo = await leitor.readexactly(tamanho) if tamanho else b""
+
+    conexao = cabecalhos.get("connection", "").lower()
+    manter_conexao = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+    caminho, _, consulta = caminho.partition("?")
+    return Requisicao(metodo, caminho, parse_qs(consulta), cabecalhos, corpo, manter_conexao)
+
+
+def _parametro(consulta, nome, padrao, converter=str):
+    """Lê um parâmetro da query string, convertendo o tipo."""
+    if nome not in consulta:
+        return padrao
+    try:
+        return converter(consulta[nome][-1])
+    except ValueError:
+        raise ErroRequisicao(400, f'Parâmetro "{nome}" inválido.') from None
+
+
+def codificar_pedaco(cpfs, formato, prefixo, sufixo):
+    """
+    Codifica um bloco de CPFs em linhas de texto com prefixo e sufixo fixos.
+
+    Args:
+        cpfs (numpy.ndarray): Matriz (N, 11) com os dígitos de cada CPF
+        formato (str): FORMATO_MASCARA ou FORMATO_NUMEROS
+        prefixo (bytes): Texto antes de cada CPF
+        sufixo (bytes): Texto depois de cada CPF (inclui a quebra de linha)
+
+    Returns:
+        bytes: Todas as linhas do bloco
+    """
+    largura_cpf = LARGURA[formato] - 1
+    inicio_sufixo = len(prefixo) + largura_cpf
+    linhas = np.empty((len(cpfs), inicio_sufixo + len(sufixo)), dtype=np.uint8)
+    linhas[:, :len(prefixo)] = np.frombuffer(prefixo, dtype=np.uint8)
+    # codificar grava a quebra de linha na primeira coluna do sufixo; o sufixo a sobrescreve
+    codificar(cpfs, formato, linhas[:, len(prefixo):inicio_sufixo + 1])
+    linhas[:, inicio_sufixo:] = np.frombuffer(sufixo, dtype=np.uint8)
+    return linhas.tobytes()
+
+
+class ServidorCPF:
+    """
+    Servidor HTTP/JSON de validação com micro-lotes e de geração em fluxo.
+
+    Atributos:
+        agrupador (AgrupadorLotes): Agrupador das validações avulsas
+        metricas (Metricas): Métricas expostas em GET /metricas
+    """
+
+    def __init__(self, lote_maximo=LOTE_MAXIMO, espera_maxima=ESPERA_MAXIMA):
+        self.metricas = Metricas()
+        self.agrupador = AgrupadorLotes(lote_maximo, espera_maxima, self.metricas)
+        self.rotas = {
+            ("POST", "/validar"): self.validar,
+            ("POST", "/validar/lote"): self.validar_lote,
+            ("GET", "/cpfs"): self.gerar,
+            ("GET", "/metricas"): self.exibir_metricas,
+        }
+
+    async def validar(self, requisicao, escritor):
+        """POST /validar: valida um CPF dentro de um micro-lote."""
+        cpf = _ler_json(requisicao.corpo, "cpf", str)
+        motivo = await self.agrupador.validar(cpf)
+        return {"cpf": cpf, "valido": motivo == 0, "motivo": NOMES_MOTIVOS[motivo]}
+
+    async def validar_lote(self, requisicao, escritor):
+        """POST /validar/lote: valida a lista inteira em uma chamada vetorizada."""
+        cpfs = _ler_json(requisicao.corpo, "cpfs", list)
+        if not all(isinstance(cpf, str) for cpf in cpfs):
+            raise ErroRequisicao(400, 'O campo "cpfs" deve ser uma lista de textos.')
+        validos, motivos = validar_coluna(np.array(cpfs, dtype=object))
+        return {
+            "resultados": [{"valido": motivo == 0, "motivo": NOMES_MOTIVOS[motivo]} for motivo in motivos.tolist()],
+            "validos": int(validos.sum()),
+        }
+
+    async def gerar(self, requisicao, escritor):
+        """GET /cpfs: gera N CPFs e os envia em fluxo, pedaço a pedaço."""
+        consulta = requisicao.consulta
+        n = _parametro(consulta, "n", None, int)
+        regiao = _parametro(consulta, "regiao", None, int)
+        formato = _parametro(consulta, "formato", FORMATO_MASCARA)
+        saida = _parametro(consulta, "saida", "ndjson")
+        semente = _parametro(consulta, "semente", None, int)
+
+        if n is None or not 0 <= n <= MAXIMO_GERACAO:
+            raise ErroRequisicao(400, f'Informe "n" entre 0 e {MAXIMO_GERACAO}.')
+        if formato not in (FORMATO_MASCARA, FORMATO_NUMEROS):
+            raise ErroRequisicao(400, f'"formato" deve ser {FORMATO_MASCARA} ou {FORMATO_NUMEROS}.')
+        if saida not in SAIDAS_GERACAO:
+            raise ErroRequisicao(400, f'"saida" deve ser um de {", ".join(SAIDAS_GERACAO)}.')
+        try:
+            validar_parametros(regiao, formato)
+        except ValueError as erro:
+            raise ErroRequisicao(400, str(erro)) from None
+
+        tipo, prefixo, sufixo = SAIDAS_GERACAO[saida]
+        fluxos = FluxosAleatorios(semente) if semente is not None else None
+        escritor.transport.set_write_buffer_limits(high=LIMITE_BUFFER_ENVIO)
+        escritor.write(
+            f"HTTP/1.1 200 OK\r\nContent-Type: {tipo}\r\nTransfer-Encoding: chunked\r\n"
+            f"Connection: {'keep-alive' if requisicao.manter_conexao else 'close'}\r\n\r\n".encode("latin-1")
+        )
+        if saida == "csv":
+            escritor.write(b"4\r\ncpf\n\r\n")
+
+        try:
+            for indice, inicio in enumerate(range(0, n, CPFS_POR_PEDACO)):
+                # Com semente, o pedaço i sempre usa o fluxo i: a resposta se repete
+                sortear_bytes = fluxos.gerador(indice).bytes if fluxos else random.randbytes
+                cpfs = gerar_matriz(min(CPFS_POR_PEDACO, n - inicio), regiao, sortear_bytes)
+                pedaco = codificar_pedaco(cpfs, formato, prefixo, sufixo)
+                escritor.writelines([b"%x\r\n" % len(pedaco), pedaco, b"\r\n"])
+                # Espera o cliente ler antes de gerar o próximo pedaço
+                await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as erro:
+            # Com os cabeçalhos já enviados não dá para responder 500: a conexão
+            # é encerrada sem o pedaço final, e o cliente vê a resposta incompleta
+            print("Erro no meio da geração em fluxo:", file=sys.stderr)
+            traceback.print_exc()
+            raise ConnectionAbortedError("geração interrompida") from erro
+
+        escritor.write(b"0\r\n\r\n")
+        await escritor.drain()
+
+    async def exibir_metricas(self, requisicao, escritor):
+        """GET /metricas: latências e histogramas."""
+        return self.metricas.resumo()
+
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão, com keep-alive, até o cliente encerrar."""
+        try:
+            while True:
+                try:
+                    requisicao = await ler_requisicao(leitor)
+                    if requisicao is None:
+                        break
+                    metodo, caminho, manter_conexao = requisicao.metodo, requisicao.caminho, requisicao.manter_conexao
+                    inicio = time.perf_counter()
+
+                    rota = self.rotas.get((metodo, caminho))
+                    if rota is None:
+                        existe = any(caminho == destino for _, destino in self.rotas)
+                        raise ErroRequisicao(405 if existe else 404, f"Rota {metodo} {caminho} não existe.")
+
+                    # Rotas em fluxo escrevem a resposta sozinhas e devolvem None
+                    resposta = await rota(requisicao, escritor)
+                    if resposta is not None:
+                        escritor.write(montar_resposta(200, json.dumps(resposta).encode(), manter_conexao))
+                        await escritor.drain()
+                        if caminho.startswith("/validar"):
+                            self.metricas.registrar_requisicao(time.perf_counter() - inicio)
+                except ErroRequisicao as erro:
+                    manter_conexao = False
+                    corpo = json.dumps({"erro": str(erro)}).encode()
+                    escritor.write(montar_resposta(erro.status, corpo, manter_conexao))
+                    await escritor.drain()
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:
+                    # Falha inesperada: o cliente recebe 500 e a conexão é encerrada
+                    print(f"Erro ao atender {escritor.get_extra_info('peername')}:", file=sys.stderr)
+                    traceback.print_exc()
+                    manter_conexao = False
+                    corpo = json.dumps({"erro": "Erro interno do servidor."}).encode()
+                    escritor.write(montar_resposta(500, corpo, manter_conexao))
+                    await escritor.drain()
+
+                if not manter_conexao:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host="127.0.0.1", porta=8080):
+        """
+        Abre a porta e inicia o agrupador de micro-lotes.
+
+        Args:
+            host (str): Endereço de escuta
+            porta (int): Porta TCP (0 escolhe uma livre)
+
+        Returns:
+            asyncio.Server: Servidor aberto
+        """
+        self._tarefa_lotes = asyncio.create_task(self.agrupador.executar())
+        return await asyncio.start_server(self.atender, host, porta)
+
+
+def servir(host="127.0.0.1", porta=8080, lote_maximo=LOTE_MAXIMO, espera_maxima=ESPERA_MAXIMA, ao_iniciar=None):
+    """
+    Roda o servidor até ser interrompido.
+
+    Args:
+        host (str): Endereço de escuta
+        porta (int): Porta TCP
+        lote_maximo (int): Maior quantidade de CPFs em um micro-lote
+        espera_maxima (float): Tempo máximo (s) de espera para fechar um micro-lote
+        ao_iniciar (callable | None): Chamada com o endereço (host, porta) em uso
+    """
+    async def principal():
+        servidor = await ServidorCPF(lote_maximo, espera_maxima).iniciar(host, porta)
+        if ao_iniciar is not None:
+            ao_iniciar(servidor.sockets[0].getsockname()[:2])
+        async with servidor:
+            await servidor.serve_forever()
+
+    asyncio.run(principal())
@@ -0,0 +1,165 @@
+"""
+Gerador de CPFs Únicos
+Autor: Felipe Alcântara
+Descrição: Gera CPFs sem repetição, em qualquer quantidade, sem guardar os
+já gerados em memória.
+
+Em vez de sortear bases independentes, uma permutação com chave (rede de
+Feistel sobre números decimais, que preserva o formato) embaralha o espaço
+de 10^9 bases. O i-ésimo CPF é a imagem do índice i: índices distintos dão
+bases distintas, e o estado inteiro é só a chave e o cursor (próximo índice).
+
+As bases com os nove dígitos iguais (000000000 a 999999999) dariam CPFs
+inválidos e ficam de fora: a permutação é restrita aos primeiros
+10^9 - 10 números (imagens fora do intervalo são permutadas de novo até
+caírem nele) e cada número é levado à base de mesma ordem entre as que
+sobram.
+"""
+
+from .lote import FORMATO_DIGITOS, FORMATO_MASCARA, LARGURA, TAMANHO_BLOCO, codificar, validar_parametros
+from .matriz import calcular_verificadores, np
+
+# Quantidade de rodadas da rede de Feistel (par, para as metades voltarem
+# aos tamanhos originais no final)
+RODADAS = 10
+
+# Constantes de mistura da função de rodada (finalizador do splitmix64)
+_MISTURA_1 = np.uint64(0x9E3779B97F4A7C15)
+_MISTURA_2 = np.uint64(0xBF58476D1CE4E5B9)
+_MISTURA_3 = np.uint64(0x94D049BB133111EB)
+
+# Potências de 10 usadas para separar as bases em dígitos
+_POTENCIAS = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+
+def _misturar(valores, chave):
+    """
+    Função de rodada: embaralha os valores (uint64) com a chave da rodada.
+
+    Devolve só os 32 bits altos, para que somar a outra metade nunca
+    transborde os 64 bits (o transbordo quebraria a bijeção da rodada).
+    """
+    x = valores + chave
+    x *= _MISTURA_1
+    x ^= x >> np.uint64(30)
+    x *= _MISTURA_2
+    x ^= x >> np.uint64(27)
+    x *= _MISTURA_3
+    x ^= x >> np.uint64(31)
+    x >>= np.uint64(32)
+    return x
+
+
+class GeradorUnico:
+    """
+    Sequência de CPFs distintos definida por uma chave.
+
+    A mesma chave (e região) sempre produz a mesma sequência. Para continuar
+    uma geração interrompida, basta criar o gerador com o cursor salvo.
+
+    Atributos:
+        chave (int): Chave da permutação
+        regiao (int | None): Dígito da região fiscal fixo no 9º dígito
+        cursor (int): Índice do próximo CPF da sequência
+        total (int): Quantidade de CPFs distintos disponíveis
+    """
+
+    def __init__(self, chave, regiao=None, cursor=0):
+        validar_parametros(regiao, FORMATO_DIGITOS)
+        self.chave = chave
+        self.regiao = regiao
+        # Números permutados: a base inteira, ou os 8 primeiros dígitos com a região fixa
+        casas = 9 if regiao is None else 8
+        if regiao is None:
+            excluidos = [digito * 111_111_111 for digito in range(10)]
+        else:
+            excluidos = [regiao * 11_111_111]
+        self.total = 10 ** casas - len(excluidos)
+        if not 0 <= cursor <= self.total:
+            raise ValueError(f"O cursor deve estar entre 0 e {self.total}, não {cursor}.")
+        self.cursor = cursor
+
+        # Metades do número: 10^5 × 10^4 para 9 dígitos, 10^4 × 10^4 para 8
+        self._modulos = (10 ** ((casas + 1) // 2), 10 ** (casas // 2))
+        # O número v vira o v-ésimo que não é excluído: v + quantos excluídos
+        # e_j têm e_j - j <= v
+        self._limites = np.array(excluidos, dtype=np.int64) - np.arange(len(excluidos))
+        self._chaves = np.random.SeedSequence(chave).generate_state(RODADAS, dtype=np.uint64)
+
+    def _feistel(self, indices):
+        """Rede de Feistel sobre todos os números de 8 ou 9 dígitos (uint64)"""
+        modulo_esquerda, modulo_direita = self._modulos
+        esquerda = indices // np.uint64(modulo_direita)
+        direita = indices % np.uint64(modulo_direita)
+
+        # Cada rodada troca as metades; com RODADAS par, os tamanhos voltam
+        for chave in self._chaves:
+            mistura = _misturar(direita, chave)
+            mistura += esquerda
+            mistura %= np.uint64(modulo_esquerda)
+            esquerda, direita = direita, mistura
+            modulo_esquerda, modulo_direita = modulo_direita, modulo_esquerda
+
+        return esquerda * np.uint64(modulo_direita) + direita
+
+    def permutar(self, indices):
+        """
+        Aplica a permutação a um vetor de índices.
+
+        Args:
+            indices (numpy.ndarray): Índices de 0 a total - 1
+
+        Returns:
+            numpy.ndarray: Bases de 9 dígitos (int64), distintas entre si e
+            nunca com os nove dígitos iguais
+        """
+        numeros = self._feistel(np.asarray(indices, dtype=np.uint64))
+
+        # Passeio pelo ciclo: quem sai de [0, total) é permutado de novo
+        fora = np.flatnonzero(numeros >= self.total)
+        while fora.size:
+            numeros[fora] = self._feistel(numeros[fora])
+            fora = fora[numeros[fora] >= self.total]
+
+        numeros = numeros.astype(np.int64)
+        numeros += np.searchsorted(self._limites, numeros, side="right")
+        return numeros if self.regiao is None else numeros * 10 + self.regiao
+
+    def gerar(self, quantidade, formato=FORMATO_MASCARA, tamanho_bloco=TAMANHO_BLOCO):
+        """
+        Gera os próximos CPFs da sequência, em blocos, avançando o cursor.
+
+        O cursor é atualizado a cada bloco entregue, então pode ser salvo a
+        qualquer momento para retomar exatamente do ponto em que parou.
+
+        Args:
+            quantidade (int): Quantidade de CPFs
+            formato (str): FORMATO_MASCARA, FORMATO_NUMEROS ou FORMATO_DIGITOS
+            tamanho_bloco (int): Quantidade de CPFs em cada bloco
+
+        Yields:
+            bytearray | numpy.ndarray: Bloco no mesmo formato de gerar_lote
+
+        Raises:
+            ValueError: Se a quantidade passar do que ainda resta na sequência
+        """
+        validar_parametros(self.regiao, formato)
+        if not 0 <= quantidade <= self.total - self.cursor:
+            raise ValueError(f"Restam {self.total - self.cursor} CPFs distintos, não há {quantidade}.")
+
+        fim = self.cursor + quantidade
+        while self.cursor < fim:
+            proximo = min(self.cursor + tamanho_bloco, fim)
+            bases = self.permutar(np.arange(self.cursor, proximo, dtype=np.uint64))
+
+            cpfs = np.empty((len(bases), 11), dtype=np.uint8)
+            cpfs[:, :9] = bases[:, None] // _POTENCIAS % 10
+            cpfs[:, 9], cpfs[:, 10] = calcular_verificadores(cpfs[:, :9])
+
+            self.cursor = proximo
+            if formato == FORMATO_DIGITOS:
+                yield cpfs
+            else:
+                bloco = bytearray(len(cpfs) * LARGURA[formato])
+                codificar(cpfs, formato, np.frombuffer(bloco, dtype=np.uint8).reshape(len(cpfs), -1))
+                yield bloco
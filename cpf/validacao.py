@@ -0,0 +1,208 @@
+"""
+Validação de CPF
+Autor: Felipe Alcântara
+Descrição: Validação de um CPF com resultado estruturado e leve, usada pelo
+validador de terminal e pela versão web.
+
+O resultado guarda só o Motivo, o CPF limpo e os verificadores calculados;
+os textos de exibição (CPF formatado, etc.) são montados apenas quando
+acessados, e as mensagens de erro ficam com a camada de apresentação. Quem
+só precisa de True/False usa cpf_valido.
+
+NOTA: Este módulo usa apenas Python puro para continuar funcionando no
+navegador através do Brython.
+"""
+
+from .motivos import CARACTERES_PERMITIDOS, Motivo
+from .nucleo import DIGITO_POR_SOMA, calcular_digitos_verificadores, limpar_cpf
+
+# Tabela do bytes.translate que converte b"0".."9" nos valores 0..9
+_ASCII_PARA_DIGITO = bytes(range(256)).replace(b"0123456789", bytes(range(10)))
+
+# Tabela do str.translate que apaga os dígitos ASCII e os caracteres permitidos
+_APAGAR_PERMITIDOS = dict.fromkeys(map(ord, "0123456789" + CARACTERES_PERMITIDOS))
+
+
+def _digitos(cpf_limpo):
+    """Converte o CPF limpo (só dígitos ASCII) em bytes com os valores 0 a 9."""
+    return cpf_limpo.encode().translate(_ASCII_PARA_DIGITO)
+
+
+def _tem_caractere_invalido(cpf, cpf_limpo):
+    """Confere se o CPF tem algo além de dígitos ASCII e CARACTERES_PERMITIDOS."""
+    if not cpf_limpo.isascii():
+        return True
+    if len(cpf) == len(cpf_limpo):
+        return False
+    # Máscara XXX.XXX.XXX-XX: os únicos não dígitos são os três separadores
+    if len(cpf) == 14 and len(cpf_limpo) == 11 and cpf[3] == "." and cpf[7] == "." and cpf[11] == "-":
+        return False
+    return bool(cpf.translate(_APAGAR_PERMITIDOS))
+
+
+def motivo_cpf(cpf):
+    """
+    Classifica um CPF, sem montar nenhuma informação extra.
+
+    Args:
+        cpf (str): CPF em qualquer formato
+
+    Returns:
+        Motivo: Motivo.VALIDO ou o motivo da invalidação
+    """
+    cpf_limpo = limpar_cpf(cpf)
+    if _tem_caractere_invalido(cpf, cpf_limpo):
+        return Motivo.NAO_NUMERICO
+    if len(cpf_limpo) != 11:
+        return Motivo.TAMANHO
+    if cpf_limpo == cpf_limpo[0] * 11:
+        return Motivo.REPETIDO
+    digitos = _digitos(cpf_limpo)
+    primeiro, segundo = calcular_digitos_verificadores(digitos[:9])
+    if primeiro != digitos[9]:
+        return Motivo.PRIMEIRO_VERIFICADOR
+    if segundo != digitos[10]:
+        return Motivo.SEGUNDO_VERIFICADOR
+    return Motivo.VALIDO
+
+
+def cpf_valido(cpf):
+    """
+    Confere se um CPF é válido, sem montar nenhuma informação extra.
+
+    Os formatos comuns (11 dígitos ou XXX.XXX.XXX-XX) são conferidos direto
+    sobre os códigos ASCII, sem limpar o texto nem montar o vetor de dígitos;
+    os outros passam por motivo_cpf.
+
+    Args:
+        cpf (str): CPF em qualquer formato
+
+    Returns:
+        bool: True se o CPF for válido
+    """
+    if len(cpf) == 14 and cpf[3] == "." and cpf[7] == "." and cpf[11] == "-":
+        cpf_limpo = cpf[:3] + cpf[4:7] + cpf[8:11] + cpf[12:]
+    elif len(cpf) == 11:
+        cpf_limpo = cpf
+    else:
+        return motivo_cpf(cpf) is Motivo.VALIDO
+    if not (cpf_limpo.isascii() and cpf_limpo.isdigit()):
+        return motivo_cpf(cpf) is Motivo.VALIDO
+    if cpf_limpo == cpf_limpo[0] * 11:
+        return False
+
+    # Códigos ASCII: cada dígito vale código - 48, e os pesos 10..2 somam 54
+    c = cpf_limpo.encode()
+    simples = c[0] + c[1] + c[2] + c[3] + c[4] + c[5] + c[6] + c[7] + c[8] - 48 * 9
+    soma = (10 * c[0] + 9 * c[1] + 8 * c[2] + 7 * c[3] + 6 * c[4] + 5 * c[5] + 4 * c[6] + 3 * c[7] + 2 * c[8]
+            - 48 * 54)
+    primeiro = DIGITO_POR_SOMA[soma]
+    if primeiro != c[9] - 48:
+        return False
+    return DIGITO_POR_SOMA[soma + simples + 2 * primeiro] == c[10] - 48
+
+
+class ResultadoValidacao:
+    """
+    Resultado da validação de um CPF.
+
+    Os campos de exibição são propriedades calculadas a partir do CPF limpo
+    só quando acessadas, e __slots__ evita um dicionário por instância.
+
+    Atributos:
+        motivo (Motivo): Motivo.VALIDO ou o motivo da invalidação
+        cpf_limpo (str): CPF apenas com números
+        primeiro_calculado (int | None): 1º verificador correto (None se o
+            CPF foi recusado antes do cálculo)
+        segundo_calculado (int | None): 2º verificador correto
+    """
+
+    __slots__ = ("motivo", "cpf_limpo", "primeiro_calculado", "segundo_calculado")
+
+    def __init__(self, motivo, cpf_limpo, primeiro_calculado=None, segundo_calculado=None):
+        self.motivo = motivo
+        self.cpf_limpo = cpf_limpo
+        self.primeiro_calculado = primeiro_calculado
+        self.segundo_calculado = segundo_calculado
+
+    def __bool__(self):
+        return self.motivo is Motivo.VALIDO
+
+    def __repr__(self):
+        return f"ResultadoValidacao(motivo={self.motivo.name}, cpf_limpo={self.cpf_limpo!r})"
+
+    @property
+    def valido(self):
+        """Se o CPF é válido."""
+        return self.motivo is Motivo.VALIDO
+
+    @property
+    def cpf_formatado(self):
+        """CPF no padrão XXX.XXX.XXX-XX (None se não tiver 11 dígitos)."""
+        cpf = self.cpf_limpo
+        if len(cpf) != 11:
+            return None
+        return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:11]}"
+
+    @property
+    def nove_primeiros(self):
+        """Os 9 primeiros dígitos separados por espaço."""
+        return ' '.join(self.cpf_limpo[:9])
+
+    @property
+    def primeiro_verificador(self):
+        """1º dígito verificador calculado."""
+        return self.primeiro_calculado
+
+    @property
+    def segundo_verificador(self):
+        """2º dígito verificador calculado."""
+        return self.segundo_calculado
+
+    @property
+    def nono_digito(self):
+        """9º dígito, que indica a região fiscal (None se não tiver 11 dígitos)."""
+        return int(self.cpf_limpo[8]) if len(self.cpf_limpo) == 11 else None
+
+    @property
+    def verificadores_informados(self):
+        """Verificadores digitados, quando são eles o motivo da invalidação."""
+        if self.motivo not in (Motivo.PRIMEIRO_VERIFICADOR, Motivo.SEGUNDO_VERIFICADOR):
+            return None
+        return self.cpf_limpo[9:11]
+
+    @property
+    def verificadores_corretos(self):
+        """Verificadores corretos, quando os informados não conferem."""
+        if self.motivo not in (Motivo.PRIMEIRO_VERIFICADOR, Motivo.SEGUNDO_VERIFICADOR):
+            return None
+        return f"{self.primeiro_calculado}{self.segundo_calculado}"
+
+
+def validar_cpf(cpf):
+    """
+    Valida um CPF completo.
+
+    Args:
+        cpf (str): CPF em qualquer formato
+
+    Returns:
+        ResultadoValidacao: Resultado (verdadeiro em contexto booleano se válido)
+    """
+    cpf_limpo = limpar_cpf(cpf)
+    if _tem_caractere_invalido(cpf, cpf_limpo):
+        return ResultadoValidacao(Motivo.NAO_NUMERICO, cpf_limpo)
+    if len(cpf_limpo) != 11:
+        return ResultadoValidacao(Motivo.TAMANHO, cpf_limpo)
+    if cpf_limpo == cpf_limpo[0] * 11:
+        return ResultadoValidacao(Motivo.REPETIDO, cpf_limpo)
+
+    digitos = _digitos(cpf_limpo)
+    primeiro, segundo = calcular_digitos_verificadores(digitos[:9])
+    if primeiro != digitos[9]:
+        motivo = Motivo.PRIMEIRO_VERIFICADOR
+    elif segundo != digitos[10]:
+        motivo = Motivo.SEGUNDO_VERIFICADOR
+    else:
+        motivo = Motivo.VALIDO
+    return ResultadoValidacao(motivo, cpf_limpo, primeiro, segundo)
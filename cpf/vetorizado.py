@@ -0,0 +1,254 @@
+"""
+Validador Vetorizado de CPF
+Autor: Felipe Alcântara
+Descrição: Valida colunas inteiras de CPFs (NumPy, Arrow ou pandas) sem criar
+nenhum objeto Python por linha.
+
+Cada bloco da coluna vira uma matriz de caracteres (N, largura) uint8, da qual
+os dígitos são extraídos para uma matriz (N, 11). Os dois verificadores saem
+de um único produto matricial com os pesos.
+"""
+
+from .matriz import MATRIZ_PESOS, TABELA_DIGITO, ZERO, np
+from .motivos import CARACTERES_PERMITIDOS, NOMES_MOTIVOS, Motivo  # noqa: F401
+
+# Códigos do motivo de cada linha (vetor uint8 devolvido por validar_coluna)
+MOTIVO_VALIDO = Motivo.VALIDO
+MOTIVO_TAMANHO = Motivo.TAMANHO
+MOTIVO_REPETIDO = Motivo.REPETIDO
+MOTIVO_PRIMEIRO = Motivo.PRIMEIRO_VERIFICADOR
+MOTIVO_SEGUNDO = Motivo.SEGUNDO_VERIFICADOR
+MOTIVO_NAO_NUMERICO = Motivo.NAO_NUMERICO
+
+# Códigos ASCII que podem aparecer junto dos dígitos (0 é o preenchimento
+# das linhas mais curtas que a matriz)
+_PERMITIDOS = np.zeros(256, dtype=bool)
+_PERMITIDOS[[0, *map(ord, CARACTERES_PERMITIDOS)]] = True
+_PERMITIDOS[ZERO:ZERO + 10] = True
+
+# Linhas com mais caracteres que isso são tratadas como tamanho inválido,
+# para que uma única linha gigante não estoure a matriz do bloco inteiro
+LARGURA_MAXIMA = 64
+
+# Quantidade de linhas convertidas e validadas por vez
+TAMANHO_BLOCO = 1 << 16
+
+
+def extrair_digitos(caracteres):
+    """
+    Extrai os dígitos de cada linha, ignorando qualquer outro caractere.
+
+    Equivale a limpar_cpf aplicado a todas as linhas de uma vez: a soma
+    acumulada da máscara de dígitos dá a posição de cada dígito na linha limpa,
+    e os dígitos são espalhados direto para essa coluna.
+
+    Args:
+        caracteres (numpy.ndarray): Matriz (N, largura) uint8 com códigos ASCII
+
+    Returns:
+        tuple: (digitos, quantidade) - matriz (N, 11) uint8 com os 11 primeiros
+        dígitos de cada linha (zeros onde faltarem) e vetor com quantos dígitos
+        cada linha tem
+    """
+    eh_digito = (caracteres >= ZERO) & (caracteres <= ZERO + 9)
+    quantidade = eh_digito.sum(axis=1)
+
+    # Coluna 11 é descartável: recebe os não dígitos e os dígitos excedentes
+    posicao = np.cumsum(eh_digito, axis=1, dtype=np.int16)
+    destino = np.where(eh_digito & (posicao <= 11), posicao - 1, 11).astype(np.intp)
+
+    digitos = np.zeros((len(caracteres), 12), dtype=np.uint8)
+    np.put_along_axis(digitos, destino, caracteres - np.uint8(ZERO), axis=1)
+    return digitos[:, :11], quantidade
+
+
+def linhas_nao_numericas(caracteres):
+    """
+    Marca as linhas com caracteres além de dígitos e CARACTERES_PERMITIDOS.
+
+    Args:
+        caracteres (numpy.ndarray): Matriz (N, largura) uint8 com códigos ASCII
+
+    Returns:
+        numpy.ndarray: Máscara booleana das linhas com MOTIVO_NAO_NUMERICO
+    """
+    return ~_PERMITIDOS[caracteres].all(axis=1)
+
+
+def validar_digitos(digitos, quantidade=None):
+    """
+    Valida uma matriz de CPFs já separados em dígitos.
+
+    Args:
+        digitos (numpy.ndarray): Matriz (N, 11) uint8 com valores de 0 a 9
+        quantidade (numpy.ndarray | None): Quantos dígitos cada linha tinha
+            originalmente; linhas diferentes de 11 recebem MOTIVO_TAMANHO
+
+    Returns:
+        tuple: (validos, motivos) - máscara booleana e vetor uint8 de motivos
+    """
+    somas = digitos[:, :10].astype(np.int32) @ MATRIZ_PESOS
+    calculados = TABELA_DIGITO[somas]
+
+    motivos = np.full(len(digitos), MOTIVO_VALIDO, dtype=np.uint8)
+    # Aplicados do menos para o mais prioritário, como em validar_cpf
+    motivos[calculados[:, 1] != digitos[:, 10]] = MOTIVO_SEGUNDO
+    motivos[calculados[:, 0] != digitos[:, 9]] = MOTIVO_PRIMEIRO
+    motivos[(digitos == digitos[:, :1]).all(axis=1)] = MOTIVO_REPETIDO
+    if quantidade is not None:
+        motivos[quantidade != 11] = MOTIVO_TAMANHO
+
+    return motivos == MOTIVO_VALIDO, motivos
+
+
+def validar_caracteres(caracteres, longas=None):
+    """
+    Valida uma matriz de caracteres, uma linha por CPF.
+
+    Args:
+        caracteres (numpy.ndarray): Matriz (N, largura) uint8 com códigos ASCII
+        longas (numpy.ndarray | None): Linhas truncadas em LARGURA_MAXIMA
+
+    Returns:
+        tuple: (validos, motivos) - máscara booleana e vetor uint8 de motivos
+    """
+    digitos, quantidade = extrair_digitos(caracteres)
+    if longas is not None:
+        quantidade[longas] = 0
+    validos, motivos = validar_digitos(digitos, quantidade)
+
+    nao_numericas = linhas_nao_numericas(caracteres)
+    if nao_numericas.any():
+        motivos[nao_numericas] = MOTIVO_NAO_NUMERICO
+        validos &= ~nao_numericas
+    return validos, motivos
+
+
+def _caracteres_numpy(valores):
+    """Converte um bloco de array NumPy de textos em matriz (N, largura) uint8."""
+    if valores.dtype.kind == "O":
+        # Cada texto é cortado antes da conversão: astype("U") alargaria o
+        # bloco inteiro até o maior texto. O caractere a mais que sobra marca
+        # a linha como longa logo abaixo.
+        valores = np.array([
+            valor[:LARGURA_MAXIMA + 1] if isinstance(valor, (str, bytes)) else valor
+            for valor in valores.tolist()
+        ], dtype="U")
+
+    if valores.dtype.kind == "S":
+        largura = valores.dtype.itemsize
+        caracteres = np.ascontiguousarray(valores).view(np.uint8).reshape(len(valores), largura)
+    elif valores.dtype.kind == "U":
+        largura = valores.dtype.itemsize // 4
+        pontos = np.ascontiguousarray(valores).view(np.uint32).reshape(len(valores), largura)
+        caracteres = pontos
+    else:
+        raise TypeError(f"Coluna de CPFs deve conter textos, não {valores.dtype}.")
+
+    # O corte é feito na visão, antes de qualquer cópia com a largura toda
+    longas = None
+    if largura > LARGURA_MAXIMA:
+        longas = caracteres[:, LARGURA_MAXIMA:].any(axis=1)
+        caracteres = caracteres[:, :LARGURA_MAXIMA]
+    if caracteres.dtype != np.uint8:
+        # Caracteres fora do ASCII nunca são dígitos nem permitidos
+        caracteres = np.where(caracteres < 128, caracteres, 128).astype(np.uint8)
+    return caracteres, longas
+
+
+def _caracteres_arrow(array):
+    """Converte um pyarrow.StringArray em matriz (N, largura) uint8 sem cópias por linha."""
+    tipo = str(array.type)
+    if tipo not in ("string", "utf8", "large_string", "large_utf8", "binary", "large_binary"):
+        return _caracteres_numpy(np.asarray(array.to_numpy(zero_copy_only=False), dtype="U"))
+
+    tipo_offset = np.int64 if tipo.startswith("large") else np.int32
+    _, buffer_offsets, buffer_dados = array.buffers()[:3]
+    offsets = np.frombuffer(buffer_offsets, dtype=tipo_offset)[array.offset:array.offset + len(array) + 1]
+    dados = np.frombuffer(buffer_dados, dtype=np.uint8) if buffer_dados is not None else np.zeros(0, np.uint8)
+
+    tamanhos = np.diff(offsets)
+    if array.null_count:
+        tamanhos = np.where(array.is_null().to_numpy(zero_copy_only=False), 0, tamanhos)
+
+    return caracteres_por_offsets(dados, offsets[:-1], tamanhos)
+
+
+def caracteres_por_offsets(dados, inicios, tamanhos):
+    """
+    Monta a matriz de caracteres a partir de um buffer e da posição de cada linha.
+
+    Args:
+        dados (numpy.ndarray): Buffer uint8 com o texto de todas as linhas
+        inicios (numpy.ndarray): Posição inicial de cada linha no buffer
+        tamanhos (numpy.ndarray): Quantidade de bytes de cada linha
+
+    Returns:
+        tuple: (caracteres, longas) - matriz (N, largura) uint8 e máscara das
+        linhas maiores que LARGURA_MAXIMA
+    """
+    if len(dados) == 0:
+        dados = np.zeros(1, dtype=np.uint8)
+
+    longas = tamanhos > LARGURA_MAXIMA
+    largura = int(min(tamanhos.max(initial=0), LARGURA_MAXIMA))
+    colunas = np.arange(largura)
+    dentro = colunas < tamanhos[:, None]
+    indices = np.where(dentro, inicios[:, None] + colunas, 0)
+    caracteres = np.where(dentro, dados[indices], 0).astype(np.uint8)
+    return caracteres, longas
+
+
+def _blocos(coluna, tamanho_bloco):
+    """Percorre a coluna em blocos de matrizes de caracteres."""
+    if hasattr(coluna, "array") and hasattr(coluna.array, "__arrow_array__"):
+        # pandas.Series com dtype string/Arrow: passa pelos buffers do Arrow
+        import pyarrow
+
+        coluna = pyarrow.chunked_array([pyarrow.array(coluna.array)])
+    elif hasattr(coluna, "to_numpy") and not hasattr(coluna, "buffers") and not hasattr(coluna, "chunks"):
+        # pandas.Series com dtype object
+        coluna = coluna.to_numpy()
+
+    if hasattr(coluna, "chunks"):
+        for pedaco in coluna.chunks:
+            for inicio in range(0, len(pedaco), tamanho_bloco):
+                yield _caracteres_arrow(pedaco.slice(inicio, tamanho_bloco))
+    elif hasattr(coluna, "buffers"):
+        for inicio in range(0, len(coluna), tamanho_bloco):
+            yield _caracteres_arrow(coluna.slice(inicio, tamanho_bloco))
+    else:
+        valores = np.asarray(coluna)
+        for inicio in range(0, len(valores), tamanho_bloco):
+            yield _caracteres_numpy(valores[inicio:inicio + tamanho_bloco])
+
+
+def validar_coluna(coluna, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Valida uma coluna inteira de CPFs em qualquer formato.
+
+    Segue as mesmas regras de validar_cpf: além dos dígitos, só são aceitos
+    CARACTERES_PERMITIDOS, e a linha precisa ter 11 dígitos, não ser uma
+    sequência repetida e ter os dois verificadores corretos. Apenas dígitos
+    ASCII são reconhecidos.
+
+    Args:
+        coluna: numpy.ndarray de textos (dtype U, S ou object),
+            pyarrow.Array/ChunkedArray de strings ou pandas.Series
+        tamanho_bloco (int): Quantidade de linhas processadas por vez
+
+    Returns:
+        tuple: (validos, motivos) - máscara booleana e vetor uint8 com o
+        código MOTIVO_* de cada linha
+    """
+    total = len(coluna)
+    validos = np.empty(total, dtype=bool)
+    motivos = np.empty(total, dtype=np.uint8)
+
+    inicio = 0
+    for caracteres, longas in _blocos(coluna, tamanho_bloco):
+        fim = inicio + len(caracteres)
+        validos[inicio:fim], motivos[inicio:fim] = validar_caracteres(caracteres, longas)
+        inicio = fim
+
+    return validos, motivos
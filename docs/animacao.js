@@ -0,0 +1,179 @@
+/*
+ * Animação de Fundo
+ * Autor: Felipe Alcântara
+ * Descrição: Motor dos números que surgem e somem no fundo da página.
+ *
+ * As partículas ficam em um pool de tamanho fixo (vetores tipados, sem
+ * objetos novos nem .filter a cada quadro); uma partícula que some é
+ * trocada pela última viva. O motor mede o custo de cada quadro e o
+ * intervalo entre quadros e ajusta o limite de partículas para caber no
+ * orçamento, crescendo de volta devagar quando sobra tempo.
+ *
+ * O mesmo arquivo roda na página (window.MotorAnimacao.criar(canvas)) ou
+ * como Web Worker com um OffscreenCanvas, recebendo mensagens
+ * {tipo, args} com o nome de um método do motor. No worker, a mensagem
+ * {tipo: 'pronto'} avisa a página de que o script carregou.
+ */
+(function (global) {
+    'use strict';
+
+    const TAMANHO_POOL = 256;         // Máximo de partículas vivas
+    const LIMITE_MINIMO = 24;         // O ajuste nunca desce abaixo disso
+    const QUADRO_MS = 1000 / 60;      // Quadro de referência (60 fps)
+    const ORCAMENTO_MS = 4;           // Custo máximo do quadro para o motor
+    const INTERVALO_MAXIMO_MS = 25;   // Abaixo de ~40 fps, o limite cai
+    const CHANCE_POR_QUADRO = 0.7;    // Chance de nascer um número a cada quadro de 60 fps
+    const QUADROS_DE_ESPERA = 30;     // Quadros sem novo ajuste depois de um corte
+
+    // Textos e fontes pré-montados (tamanhos de 14 a 33 px)
+    const DIGITOS = '0123456789'.split('');
+    const FONTES = [];
+    for (let tamanho = 0; tamanho < 34; tamanho++) {
+        FONTES.push(`bold ${tamanho}px monospace`);
+    }
+
+    function criarMotor(canvas) {
+        const ctx = canvas.getContext('2d');
+        const agendar = global.requestAnimationFrame
+            ? global.requestAnimationFrame.bind(global)
+            : (funcao) => setTimeout(() => funcao(performance.now()), QUADRO_MS);
+        const desagendar = global.cancelAnimationFrame
+            ? global.cancelAnimationFrame.bind(global)
+            : clearTimeout;
+
+        // Pool de partículas: uma posição de cada vetor por partícula
+        const x = new Float32Array(TAMANHO_POOL);
+        const y = new Float32Array(TAMANHO_POOL);
+        const opacidade = new Float32Array(TAMANHO_POOL);
+        const queda = new Float32Array(TAMANHO_POOL);
+        const tamanho = new Uint8Array(TAMANHO_POOL);
+        const digito = new Uint8Array(TAMANHO_POOL);
+
+        let vivos = 0;
+        let limite = TAMANHO_POOL;
+        let custoMedio = 0;
+        let intervaloMedio = QUADRO_MS;
+        let ultimo = 0;
+        let espera = 0;
+        let quadro = null;
+        let escuro = false;
+
+        function nascer() {
+            const i = vivos++;
+            x[i] = Math.random() * canvas.width;
+            y[i] = Math.random() * canvas.height;
+            digito[i] = Math.floor(Math.random() * 10);
+            opacidade[i] = 1;
+            queda[i] = Math.random() * 0.003 + 0.002;
+            tamanho[i] = Math.floor(Math.random() * 20) + 14;
+        }
+
+        function ajustarLimite(custo, intervalo) {
+            custoMedio = custoMedio * 0.9 + custo * 0.1;
+            intervaloMedio = intervaloMedio * 0.9 + intervalo * 0.1;
+            if (espera > 0) {
+                espera--;
+            } else if (custoMedio > ORCAMENTO_MS || intervaloMedio > INTERVALO_MAXIMO_MS) {
+                // Corta já o excedente e espera as médias refletirem o corte
+                limite = Math.max(LIMITE_MINIMO, Math.floor(Math.min(limite, vivos) * 0.8));
+                vivos = Math.min(vivos, limite);
+                espera = QUADROS_DE_ESPERA;
+            } else if (custoMedio < ORCAMENTO_MS / 2 && limite < TAMANHO_POOL) {
+                limite++;
+            }
+        }
+
+        function passo(agora) {
+            // Quadros atrasados contam como mais tempo, até 100 ms
+            const intervalo = ultimo ? Math.min(agora - ultimo, 100) : QUADRO_MS;
+            const escala = intervalo / QUADRO_MS;
+            const inicio = performance.now();
+            ultimo = agora;
+
+            ctx.clearRect(0, 0, canvas.width, canvas.height);
+            if (vivos < limite && Math.random() < 1 - Math.pow(1 - CHANCE_POR_QUADRO, escala)) {
+                nascer();
+            }
+
+            // Brilho e cor fixos no quadro; a opacidade de cada número vem do globalAlpha
+            ctx.shadowBlur = escuro ? 15 : 20;
+            ctx.shadowColor = escuro ? 'rgba(255, 255, 255, 0.8)' : 'rgba(0, 0, 0, 0.9)';
+            ctx.fillStyle = escuro ? '#fff' : '#000';
+            let fonte = -1;
+            for (let i = 0; i < vivos;) {
+                opacidade[i] -= queda[i] * escala;
+                if (opacidade[i] <= 0) {
+                    // Some: a última partícula viva ocupa o lugar
+                    vivos--;
+                    x[i] = x[vivos];
+                    y[i] = y[vivos];
+                    opacidade[i] = opacidade[vivos];
+                    queda[i] = queda[vivos];
+                    tamanho[i] = tamanho[vivos];
+                    digito[i] = digito[vivos];
+                    continue;
+                }
+                if (tamanho[i] !== fonte) {
+                    fonte = tamanho[i];
+                    ctx.font = FONTES[fonte];
+                }
+                ctx.globalAlpha = opacidade[i];
+                ctx.fillText(DIGITOS[digito[i]], x[i], y[i]);
+                i++;
+            }
+            ctx.globalAlpha = 1;
+            ctx.shadowBlur = 0;
+
+            ajustarLimite(performance.now() - inicio, intervalo);
+            quadro = agendar(passo);
+        }
+
+        return {
+            retomar() {
+                if (quadro === null) {
+                    ultimo = 0;
+                    quadro = agendar(passo);
+                }
+            },
+            pausar(limpar) {
+                if (quadro !== null) {
+                    desagendar(quadro);
+                    quadro = null;
+                }
+                if (limpar) {
+                    vivos = 0;
+                    ctx.clearRect(0, 0, canvas.width, canvas.height);
+                }
+            },
+            redimensionar(largura, altura) {
+                canvas.width = largura;
+                canvas.height = altura;
+            },
+            tema(modoEscuro) {
+                escuro = modoEscuro;
+            },
+            estado() {
+                return { vivos: vivos, limite: limite, custoMedio: custoMedio, intervaloMedio: intervaloMedio };
+            },
+        };
+    }
+
+    global.MotorAnimacao = { criar: criarMotor, TAMANHO_POOL: TAMANHO_POOL };
+
+    // Como Web Worker: avisa que carregou ("pronto") e o primeiro pedido
+    // traz o OffscreenCanvas
+    if (typeof WorkerGlobalScope !== 'undefined' && global instanceof WorkerGlobalScope) {
+        let motor = null;
+        global.onmessage = (evento) => {
+            const { tipo, args } = evento.data;
+            if (tipo === 'iniciar') {
+                motor = criarMotor(args[0]);
+            } else if (tipo === 'estado') {
+                global.postMessage(motor && motor.estado());
+            } else if (motor) {
+                motor[tipo](...args);
+            }
+        };
+        global.postMessage({ tipo: 'pronto' });
+    }
+})(self);
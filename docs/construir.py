@@ -0,0 +1,351 @@
+"""
+Construção do Pacote Web
+Autor: Felipe Alcântara
+Descrição: Monta em docs/dist uma versão da página que não depende de CDN:
+o brython.min.js local e um brython_modules.js com apenas os módulos que
+gerador.py e trabalhador.py importam.
+
+O brython_stdlib.js completo tem uns 4 MB e centenas de módulos. O pacote
+guarda só o fecho das importações das páginas: os módulos da biblioteca
+padrão que elas usam (com as dependências declaradas no próprio
+brython_stdlib.js) e os módulos do pacote cpf em Python puro. O código
+Python que vai para o pacote perde docstrings e comentários, o que
+diminui o que o Brython precisa baixar e traduzir na partida.
+
+Também mantém docs/cpf, a cópia dos módulos do pacote cpf que as páginas
+importam. A pasta docs é publicada sozinha (GitHub Pages, checkouts sem
+links simbólicos), então a cópia é feita de arquivos comuns; depois de
+alterar esses módulos em cpf/, rode com --copiar-nucleo.
+
+Uso:
+    python docs/construir.py [--brython PASTA] [--saida PASTA]
+    python docs/construir.py --copiar-nucleo
+
+Sem --brython, os arquivos do Brython na versão usada por index.html são
+baixados do CDN uma única vez e guardados em ~/.cache/cpf-brython. Depois,
+basta servir a pasta de saída:
+    python -m http.server 8000 --directory docs/dist
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import shutil
+import sys
+import urllib.request
+
+DOCS = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(DOCS)
+
+# Scripts Python da página (o primeiro é o principal, o segundo roda no worker)
+SCRIPTS = ("gerador.py", "trabalhador.py")
+
+# Arquivos copiados sem alteração
+ESTATICOS = ("style.css", "animacao.js")
+
+# Onde os módulos locais são procurados, nesta ordem
+CAMINHOS_LOCAIS = (DOCS, RAIZ)
+
+# Módulos do pacote cpf copiados para docs/cpf (os que as páginas importam)
+NUCLEO_WEB = ("__init__.py", "motivos.py", "nucleo.py", "validacao.py")
+
+CDN = "https://cdn.jsdelivr.net/npm/brython@{versao}/{arquivo}"
+CACHE = os.path.join(os.path.expanduser("~"), ".cache", "cpf-brython")
+
+# Tags do Brython no CDN em index.html
+PADRAO_BRYTHON = re.compile(r'<script src="https://cdn\.jsdelivr\.net/npm/brython@([\d.]+)/(brython(?:_stdlib)?(?:\.min)?\.js)"></script>')
+
+
+def nucleo_desatualizado():
+    """
+    Lista os módulos de NUCLEO_WEB cuja cópia em docs/cpf difere de cpf/.
+
+    Returns:
+        list: Nomes dos arquivos ausentes ou diferentes em docs/cpf
+    """
+    def ler(caminho):
+        if not os.path.isfile(caminho):
+            return None
+        with open(caminho, "rb") as arquivo:
+            return arquivo.read()
+
+    return [arquivo for arquivo in NUCLEO_WEB
+            if ler(os.path.join(DOCS, "cpf", arquivo)) != ler(os.path.join(RAIZ, "cpf", arquivo))]
+
+
+def copiar_nucleo():
+    """
+    Copia para docs/cpf os módulos do pacote cpf que as páginas importam.
+
+    Returns:
+        list: Nomes dos arquivos que mudaram
+    """
+    destino = os.path.join(DOCS, "cpf")
+    os.makedirs(destino, exist_ok=True)
+    diferentes = nucleo_desatualizado()
+    for arquivo in diferentes:
+        shutil.copyfile(os.path.join(RAIZ, "cpf", arquivo), os.path.join(destino, arquivo))
+    return diferentes
+
+
+def versao_brython(pagina):
+    """
+    Lê a versão do Brython carregada pela página.
+
+    Args:
+        pagina (str): HTML de index.html
+
+    Returns:
+        str: Versão (ex.: "3.12.0")
+
+    Raises:
+        ValueError: Se a página não carregar o Brython do CDN
+    """
+    encontrado = PADRAO_BRYTHON.search(pagina)
+    if encontrado is None:
+        raise ValueError("index.html não carrega o Brython do CDN.")
+    return encontrado.group(1)
+
+
+def obter_brython(versao, pasta=None):
+    """
+    Localiza brython.min.js e brython_stdlib.js, baixando se preciso.
+
+    Args:
+        versao (str): Versão do Brython
+        pasta (str | None): Pasta com os dois arquivos; None para usar o cache
+
+    Returns:
+        tuple: (caminho do brython.min.js, caminho do brython_stdlib.js)
+    """
+    if pasta is None:
+        pasta = os.path.join(CACHE, versao)
+        os.makedirs(pasta, exist_ok=True)
+        for arquivo in ("brython.min.js", "brython_stdlib.js"):
+            destino = os.path.join(pasta, arquivo)
+            if not os.path.exists(destino):
+                print(f"Baixando {arquivo} {versao}...", file=sys.stderr)
+                with urllib.request.urlopen(CDN.format(versao=versao, arquivo=arquivo)) as resposta:
+                    dados = resposta.read()
+                with open(destino + ".parcial", "wb") as saida:
+                    saida.write(dados)
+                os.replace(destino + ".parcial", destino)
+    nucleo = os.path.join(pasta, "brython.min.js")
+    if not os.path.exists(nucleo):
+        nucleo = os.path.join(pasta, "brython.js")
+    return nucleo, os.path.join(pasta, "brython_stdlib.js")
+
+
+def ler_vfs(caminho):
+    """
+    Lê o sistema de arquivos virtual de um brython_stdlib.js.
+
+    Cada módulo é [extensão, código, importações] e os pacotes têm um
+    quarto item igual a 1.
+
+    Args:
+        caminho (str): Arquivo brython_stdlib.js (ou brython_modules.js)
+
+    Returns:
+        dict: Nome do módulo -> entrada
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        texto = arquivo.read()
+    inicio = texto.index("{", texto.index("var scripts"))
+    vfs, _ = json.JSONDecoder().raw_decode(texto, inicio)
+    vfs.pop("$timestamp", None)
+    return vfs
+
+
+def enxugar(codigo):
+    """
+    Remove docstrings e comentários de um código Python.
+
+    Args:
+        codigo (str): Código-fonte
+
+    Returns:
+        str: Código equivalente, sem docstrings nem comentários
+    """
+    arvore = ast.parse(codigo)
+    for no in ast.walk(arvore):
+        if isinstance(no, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            corpo = no.body
+            if corpo and isinstance(corpo[0], ast.Expr) and isinstance(corpo[0].value, ast.Constant) \
+                    and isinstance(corpo[0].value.value, str):
+                no.body = corpo[1:] or [ast.Pass()]
+    return ast.unparse(arvore) + "\n"
+
+
+def importacoes(codigo, modulo, pacote):
+    """
+    Lista os nomes que um código pode importar.
+
+    Para "from a import b", tanto "a" quanto "a.b" entram na lista, porque
+    b pode ser um submódulo; quem consulta descarta os que não existem.
+
+    Args:
+        codigo (str): Código-fonte
+        modulo (str): Nome do módulo (para resolver importações relativas)
+        pacote (bool): Se o módulo é o __init__ de um pacote
+
+    Returns:
+        list: Nomes absolutos de módulos
+    """
+    base = modulo.split(".") if pacote else modulo.split(".")[:-1]
+    nomes = []
+    for no in ast.walk(ast.parse(codigo)):
+        if isinstance(no, ast.Import):
+            nomes.extend(apelido.name for apelido in no.names)
+        elif isinstance(no, ast.ImportFrom):
+            partes = base[:len(base) - no.level + 1] if no.level else []
+            origem = ".".join(partes + ([no.module] if no.module else []))
+            nomes.append(origem)
+            nomes.extend(f"{origem}.{apelido.name}" for apelido in no.names if apelido.name != "*")
+    return nomes
+
+
+def modulo_local(nome):
+    """
+    Procura um módulo Python nas pastas locais.
+
+    Args:
+        nome (str): Nome absoluto do módulo
+
+    Returns:
+        tuple | None: (caminho do arquivo, é_pacote) ou None se não for local
+    """
+    relativo = os.path.join(*nome.split("."))
+    for pasta in CAMINHOS_LOCAIS:
+        inicial = os.path.join(pasta, relativo, "__init__.py")
+        if os.path.isfile(inicial):
+            return inicial, True
+        arquivo = os.path.join(pasta, relativo + ".py")
+        if os.path.isfile(arquivo):
+            return arquivo, False
+    return None
+
+
+def fecho_de_importacoes(scripts, biblioteca):
+    """
+    Calcula os módulos necessários para rodar os scripts.
+
+    Args:
+        scripts (list): Caminhos dos scripts da página
+        biblioteca (dict): VFS da biblioteca padrão do Brython
+
+    Returns:
+        dict: Nome do módulo -> entrada do VFS do pacote
+    """
+    modulos = {}
+    pendentes = []
+    for caminho in scripts:
+        with open(caminho, encoding="utf-8") as arquivo:
+            pendentes.extend(importacoes(arquivo.read(), "__main__", False))
+
+    while pendentes:
+        nome = pendentes.pop()
+        if not nome or nome in modulos:
+            continue
+        # Um submódulo precisa do pacote que o contém
+        if "." in nome:
+            pendentes.append(nome.rsplit(".", 1)[0])
+
+        local = modulo_local(nome)
+        if local is not None:
+            caminho, pacote = local
+            with open(caminho, encoding="utf-8") as arquivo:
+                codigo = arquivo.read()
+            nomes = importacoes(codigo, nome, pacote)
+            modulos[nome] = [".py", enxugar(codigo), sorted(set(nomes))] + ([1] if pacote else [])
+            pendentes.extend(nomes)
+        elif nome in biblioteca:
+            modulos[nome] = biblioteca[nome]
+            if len(biblioteca[nome]) > 2:
+                pendentes.extend(biblioteca[nome][2])
+
+    # Nos módulos locais, "a.b" só fica na lista se b for mesmo um submódulo
+    for nome, entrada in modulos.items():
+        if nome not in biblioteca:
+            entrada[2] = [importado for importado in entrada[2] if importado in modulos]
+    return modulos
+
+
+def gravar_modulos(caminho, modulos):
+    """Grava o VFS do pacote no formato do brython_modules.js"""
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("__BRYTHON__.use_VFS = true;\n")
+        arquivo.write("var scripts = ")
+        json.dump(dict(sorted(modulos.items())), arquivo, ensure_ascii=False, separators=(",", ":"))
+        arquivo.write("\n__BRYTHON__.update_VFS(scripts)\n")
+
+
+def construir(saida, pasta_brython=None):
+    """
+    Monta a página autocontida.
+
+    Args:
+        saida (str): Pasta de saída (recriada do zero)
+        pasta_brython (str | None): Pasta com os arquivos do Brython
+
+    Returns:
+        tuple: (módulos no pacote, módulos da biblioteca padrão no pacote,
+        módulos na biblioteca completa, bytes do brython_modules.js, bytes
+        do brython_stdlib.js)
+    """
+    with open(os.path.join(DOCS, "index.html"), encoding="utf-8") as arquivo:
+        pagina = arquivo.read()
+    nucleo, biblioteca_js = obter_brython(versao_brython(pagina), pasta_brython)
+    biblioteca = ler_vfs(biblioteca_js)
+    modulos = fecho_de_importacoes([os.path.join(DOCS, script) for script in SCRIPTS], biblioteca)
+
+    shutil.rmtree(saida, ignore_errors=True)
+    os.makedirs(saida)
+    shutil.copyfile(nucleo, os.path.join(saida, "brython.min.js"))
+    gravar_modulos(os.path.join(saida, "brython_modules.js"), modulos)
+
+    def trocar(encontrado):
+        if "stdlib" in encontrado.group(2):
+            return '<script src="./brython_modules.js"></script>'
+        return '<script src="./brython.min.js"></script>'
+
+    with open(os.path.join(saida, "index.html"), "w", encoding="utf-8") as arquivo:
+        arquivo.write(PADRAO_BRYTHON.sub(trocar, pagina))
+    for script in SCRIPTS:
+        with open(os.path.join(DOCS, script), encoding="utf-8") as arquivo:
+            codigo = enxugar(arquivo.read())
+        with open(os.path.join(saida, script), "w", encoding="utf-8") as arquivo:
+            arquivo.write(codigo)
+    for estatico in ESTATICOS:
+        shutil.copyfile(os.path.join(DOCS, estatico), os.path.join(saida, estatico))
+
+    padrao = sum(nome in biblioteca for nome in modulos)
+    return (len(modulos), padrao, len(biblioteca), os.path.getsize(os.path.join(saida, "brython_modules.js")),
+            os.path.getsize(biblioteca_js))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monta a versão web autocontida em docs/dist.")
+    parser.add_argument("--brython", help="pasta com brython.min.js e brython_stdlib.js (padrão: baixar do CDN)")
+    parser.add_argument("--saida", default=os.path.join(DOCS, "dist"), help="pasta de saída (padrão: docs/dist)")
+    parser.add_argument("--copiar-nucleo", action="store_true",
+                        help="só atualiza em docs/cpf a cópia dos módulos de cpf/ usados pelas páginas")
+    args = parser.parse_args()
+
+    if args.copiar_nucleo:
+        copiados = copiar_nucleo()
+        print(f"docs/cpf: {', '.join(copiados) if copiados else 'já estava atualizado'}")
+        return
+    desatualizados = nucleo_desatualizado()
+    if desatualizados:
+        sys.exit(f"docs/cpf está desatualizado ({', '.join(desatualizados)}); rode com --copiar-nucleo.")
+
+    modulos, padrao, total, tamanho, tamanho_total = construir(args.saida, args.brython)
+    print(f"{modulos} módulos ({padrao} dos {total} da biblioteca padrão) em {args.saida}")
+    print(f"brython_modules.js: {tamanho / 1024:.0f} KiB (brython_stdlib.js: {tamanho_total / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
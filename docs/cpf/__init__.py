@@ -0,0 +1,61 @@
+"""
+Pacote CPF
+Autor: Felipe Alcântara
+Descrição: Núcleo importável compartilhado pelos geradores e validadores de CPF.
+
+Importar o pacote carrega apenas o núcleo em Python puro. A validação e os
+motores em lote (que dependem do NumPy) são importados na primeira vez em
+que são acessados, para que scripts curtos não paguem por eles na partida.
+"""
+
+from .nucleo import (
+    DIGITO_POR_RESTO,
+    DIGITO_POR_SOMA,
+    PESOS_PRIMEIRO,
+    PESOS_SEGUNDO,
+    calcular_digitos_verificadores,
+    calcular_primeiro_digito,
+    calcular_segundo_digito,
+    formatar_cpf,
+    limpar_cpf,
+)
+
+# Nome exportado -> submódulo importado só no primeiro acesso
+_PREGUICOSOS = {
+    "Motivo": "motivos",
+    "validar_cpf": "validacao",
+    "cpf_valido": "validacao",
+    "motivo_cpf": "validacao",
+    "gerar_lote": "lote",
+    "validar_coluna": "vetorizado",
+    "validar_arquivo": "fluxo",
+    "ConjuntoCPF": "conjunto",
+}
+
+__all__ = [
+    "DIGITO_POR_RESTO",
+    "DIGITO_POR_SOMA",
+    "PESOS_PRIMEIRO",
+    "PESOS_SEGUNDO",
+    "calcular_digitos_verificadores",
+    "calcular_primeiro_digito",
+    "calcular_segundo_digito",
+    "formatar_cpf",
+    "limpar_cpf",
+    *_PREGUICOSOS,
+]
+
+
+def __getattr__(nome):
+    """Importa o submódulo de um nome preguiçoso no primeiro acesso (PEP 562)."""
+    if nome not in _PREGUICOSOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    from importlib import import_module
+
+    valor = getattr(import_module(f".{_PREGUICOSOS[nome]}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PREGUICOSOS))
@@ -0,0 +1,55 @@
+"""
+Motivos de Invalidação do CPF
+Autor: Felipe Alcântara
+Descrição: Códigos estruturados do resultado de uma validação, compartilhados
+pelo validador de um CPF e pelos validadores em lote.
+
+Os validadores devolvem apenas o código; as mensagens para o usuário são
+montadas pela camada de apresentação (terminal, web, linha de comando).
+
+NOTA: Este módulo usa apenas Python puro para continuar funcionando no
+navegador através do Brython.
+"""
+
+from enum import IntEnum
+
+
+class Motivo(IntEnum):
+    """
+    Resultado da validação de um CPF.
+
+    Os valores são os mesmos códigos uint8 usados nos vetores de motivos dos
+    validadores em lote. Quando mais de um motivo se aplica, vale o de maior
+    prioridade: NAO_NUMERICO, TAMANHO, REPETIDO, PRIMEIRO_VERIFICADOR e, por
+    fim, SEGUNDO_VERIFICADOR.
+    """
+
+    VALIDO = 0
+    TAMANHO = 1                  # Não tem exatamente 11 dígitos
+    REPETIDO = 2                 # Sequência de dígitos iguais (111.111.111-11)
+    PRIMEIRO_VERIFICADOR = 3     # Primeiro dígito verificador não confere
+    SEGUNDO_VERIFICADOR = 4      # Segundo dígito verificador não confere
+    NAO_NUMERICO = 5             # Tem caracteres além de dígitos, '.', '-' e espaços
+
+
+# Caracteres aceitos ao redor dos dígitos sem invalidar o CPF
+CARACTERES_PERMITIDOS = " \t\r\n.-"
+
+# Nome curto de cada motivo, indexado pelo código (usado em saídas de texto)
+NOMES_MOTIVOS = tuple(motivo.name.lower() for motivo in Motivo)
+
+
+def contar_motivos(motivos):
+    """
+    Agrega uma sequência de motivos em uma contagem por motivo.
+
+    Args:
+        motivos: Iterável de Motivo (ou dos códigos inteiros equivalentes)
+
+    Returns:
+        dict: Motivo -> quantidade, com todos os motivos presentes
+    """
+    contagem = [0] * len(Motivo)
+    for motivo in motivos:
+        contagem[motivo] += 1
+    return dict(zip(Motivo, contagem))
@@ -6,9 +6,15 @@ NOTA: Este arquivo usa Brython e só funciona no navegador.
 O módulo 'browser' é fornecido automaticamente pelo Brython.
 """
 
-from browser import document, html  # type: ignore
+from browser import document, html, window, worker  # type: ignore
 import random
 
+# Núcleo compartilhado com a versão de terminal (docs/cpf aponta para ../cpf)
+from cpf import calcular_digitos_verificadores, formatar_cpf, limpar_cpf
+from cpf.motivos import Motivo
+from cpf.validacao import motivo_cpf
+from cpf.validacao import validar_cpf as validar_cpf_nucleo
+
 # ==================== FUNÇÕES DO GERADOR ====================
 
 def obter_regioes_fiscais():
@@ -26,83 +32,126 @@ def obter_regioes_fiscais():
         9: "PR, SC"
     }
 
-def gerar_nove_digitos():
-    """Gera 9 dígitos aleatórios"""
-    return [random.randint(0, 9) for _ in range(9)]
+def gerar_nove_digitos(gerador=random):
+    """Gera 9 dígitos aleatórios (gerador: random ou random.Random(semente))"""
+    return [gerador.randint(0, 9) for _ in range(9)]
 
-def gerar_nove_digitos_com_regiao(regiao):
-    """Gera 8 dígitos aleatórios + 1 da região"""
-    digitos = [random.randint(0, 9) for _ in range(8)]
+def gerar_nove_digitos_com_regiao(regiao, gerador=random):
+    """Gera 8 dígitos aleatórios + 1 da região (gerador: random ou random.Random(semente))"""
+    digitos = [gerador.randint(0, 9) for _ in range(8)]
     digitos.append(regiao)
     return digitos
 
-def calcular_primeiro_digito(digitos):
-    """Calcula o primeiro dígito verificador"""
-    soma = sum(digitos[i] * (10 - i) for i in range(9))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
+# ==================== CAMADA DE RENDER ====================
+
+class Painel:
+    """
+    Linhas "rótulo: valor" criadas uma única vez dentro de um container.
+    
+    Cada render só troca o texto dos valores que mudaram e mostra ou
+    esconde linhas, sem apagar e recriar a árvore a cada clique.
+    """
+    
+    def __init__(self, container, rotulos):
+        self.linhas = []
+        self.valores = []
+        for rotulo in rotulos:
+            valor = html.SPAN(Class="valor")
+            linha = html.DIV([html.SPAN(rotulo, Class="label"), valor], Class="detalhes-linha")
+            # Começa escondida, de acordo com o texto None guardado abaixo
+            linha.style.display = "none"
+            container <= linha
+            self.linhas.append(linha)
+            self.valores.append(valor)
+        self.textos = [None] * len(rotulos)
+    
+    def atualizar(self, *textos):
+        """Atualiza os valores na ordem dos rótulos; None esconde a linha"""
+        for i, texto in enumerate(textos):
+            if texto == self.textos[i]:
+                continue
+            if texto is None:
+                self.linhas[i].style.display = "none"
+            else:
+                if self.textos[i] is None:
+                    self.linhas[i].style.display = ""
+                self.valores[i].text = texto
+            self.textos[i] = texto
+
+def trocar_texto(elemento, texto):
+    """Troca o texto de um elemento só se ele mudou"""
+    if elemento.text != texto:
+        elemento.text = texto
 
-def calcular_segundo_digito(digitos, primeiro_digito):
-    """Calcula o segundo dígito verificador"""
-    digitos_completos = digitos + [primeiro_digito]
-    soma = sum(digitos_completos[i] * (11 - i) for i in range(10))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
+def mostrar(elemento, visivel):
+    """Mostra ou esconde um elemento criado uma única vez"""
+    elemento.style.display = "" if visivel else "none"
 
-def formatar_cpf(digitos, digito1, digito2):
-    """Formata o CPF no padrão XXX.XXX.XXX-XX"""
-    cpf_numeros = ''.join(map(str, digitos))
-    return f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{digito1}{digito2}"
+# Com ?renders na URL, index.html define window.registrarRender
+registrar_render = getattr(window, "registrarRender", None)
+
+def medir_render(nome, painel_id):
+    """
+    Mede o custo de cada render quando a página foi aberta com ?renders.
+    
+    O tempo do Python é medido em volta da função; em seguida, ler
+    offsetHeight do painel força o cálculo de estilo e layout, que é
+    medido à parte. Sem ?renders, a função é devolvida sem alteração.
+    """
+    def decorador(funcao):
+        if registrar_render is None:
+            return funcao
+        
+        def medida(*args):
+            inicio = window.performance.now()
+            funcao(*args)
+            meio = window.performance.now()
+            document[painel_id].offsetHeight
+            registrar_render(nome, meio - inicio, window.performance.now() - meio)
+        return medida
+    return decorador
 
 # ==================== FUNÇÕES DE INTERFACE ====================
 
+painel_aleatorio = Painel(document["detalhes-aleatorio"], [
+    "📋 Dígitos gerados: ", "🔢 1º verificador: ", "🔢 2º verificador: ", "🗺️ Região Fiscal: ",
+])
+
+painel_regiao = Painel(document["detalhes-regiao"], [
+    "📋 Dígitos (1-8): ", "🗺️ 9º dígito (região): ", "🔢 1º verificador: ", "🔢 2º verificador: ",
+    "🗺️ Região Fiscal: ",
+])
+
+@medir_render("aleatorio", "resultado-aleatorio")
 def exibir_resultado_aleatorio(cpf_formatado, digitos, digito1, digito2):
     """Exibe o resultado do gerador aleatório"""
     regioes = obter_regioes_fiscais()
     nono_digito = digitos[8]
     regiao = regioes[nono_digito]
     
-    cpf_display = document["cpf-aleatorio"]
-    cpf_display.text = cpf_formatado
-    
-    detalhes = document["detalhes-aleatorio"]
-    detalhes.clear()
-    
-    detalhes <= html.DIV(
-        html.DIV([html.SPAN("📋 Dígitos gerados: ", Class="label"), 
-                  html.SPAN(' '.join(map(str, digitos)), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🔢 1º verificador: ", Class="label"), 
-                  html.SPAN(str(digito1), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🔢 2º verificador: ", Class="label"), 
-                  html.SPAN(str(digito2), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🗺️ Região Fiscal: ", Class="label"), 
-                  html.SPAN(f"Dígito {nono_digito} - {regiao}", Class="valor")], Class="detalhes-linha")
+    trocar_texto(document["cpf-aleatorio"], cpf_formatado)
+    painel_aleatorio.atualizar(
+        ' '.join(map(str, digitos)),
+        str(digito1),
+        str(digito2),
+        f"Dígito {nono_digito} - {regiao}",
     )
     
     document["resultado-aleatorio"].classList.remove("hidden")
 
+@medir_render("regiao", "resultado-regiao")
 def exibir_resultado_regiao(cpf_formatado, digitos, digito1, digito2, regiao_escolhida):
     """Exibe o resultado do gerador por região"""
     regioes = obter_regioes_fiscais()
     regiao = regioes[regiao_escolhida]
     
-    cpf_display = document["cpf-regiao"]
-    cpf_display.text = cpf_formatado
-    
-    detalhes = document["detalhes-regiao"]
-    detalhes.clear()
-    
-    detalhes <= html.DIV(
-        html.DIV([html.SPAN("📋 Dígitos (1-8): ", Class="label"), 
-                  html.SPAN(' '.join(map(str, digitos[:8])), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🗺️ 9º dígito (região): ", Class="label"), 
-                  html.SPAN(str(regiao_escolhida), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🔢 1º verificador: ", Class="label"), 
-                  html.SPAN(str(digito1), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🔢 2º verificador: ", Class="label"), 
-                  html.SPAN(str(digito2), Class="valor")], Class="detalhes-linha") +
-        html.DIV([html.SPAN("🗺️ Região Fiscal: ", Class="label"), 
-                  html.SPAN(regiao, Class="valor")], Class="detalhes-linha")
+    trocar_texto(document["cpf-regiao"], cpf_formatado)
+    painel_regiao.atualizar(
+        ' '.join(map(str, digitos[:8])),
+        str(regiao_escolhida),
+        str(digito1),
+        str(digito2),
+        regiao,
     )
     
     document["resultado-regiao"].classList.remove("hidden")
@@ -112,8 +161,7 @@ def exibir_resultado_regiao(cpf_formatado, digitos, digito1, digito2, regiao_esc
 def gerar_cpf_aleatorio(event):
     """Gera um CPF aleatório"""
     digitos = gerar_nove_digitos()
-    primeiro_digito = calcular_primeiro_digito(digitos)
-    segundo_digito = calcular_segundo_digito(digitos, primeiro_digito)
+    primeiro_digito, segundo_digito = calcular_digitos_verificadores(digitos)
     cpf_formatado = formatar_cpf(digitos, primeiro_digito, segundo_digito)
     
     exibir_resultado_aleatorio(cpf_formatado, digitos, primeiro_digito, segundo_digito)
@@ -149,8 +197,7 @@ def gerar_cpf_por_regiao():
         return
     
     digitos = gerar_nove_digitos_com_regiao(regiao_selecionada)
-    primeiro_digito = calcular_primeiro_digito(digitos)
-    segundo_digito = calcular_segundo_digito(digitos, primeiro_digito)
+    primeiro_digito, segundo_digito = calcular_digitos_verificadores(digitos)
     cpf_formatado = formatar_cpf(digitos, primeiro_digito, segundo_digito)
     
     exibir_resultado_regiao(cpf_formatado, digitos, primeiro_digito, segundo_digito, regiao_selecionada)
@@ -177,146 +224,180 @@ def criar_grid_regioes():
 
 # ==================== VALIDADOR DE CPF ====================
 
-def limpar_cpf(cpf):
-    """Remove todos os caracteres não numéricos"""
-    import re
-    return re.sub(r'\D', '', cpf)
-
 def validar_cpf(cpf):
-    """Valida um CPF completo"""
-    # Remove formatação
-    cpf_limpo = limpar_cpf(cpf)
-    
-    # Verifica se tem 11 dígitos
-    if len(cpf_limpo) != 11:
-        return False, {"erro": f"CPF deve ter 11 dígitos. Você digitou {len(cpf_limpo)} dígitos."}
-    
-    # Verifica se não é sequência repetida
-    if cpf_limpo == cpf_limpo[0] * 11:
-        return False, {"erro": "CPF não pode ser uma sequência de números iguais."}
-    
-    # Converte para lista de inteiros
-    digitos = [int(d) for d in cpf_limpo]
-    
-    # Pega os 9 primeiros dígitos
-    nove_digitos = digitos[:9]
-    
-    # Calcula os dígitos verificadores
-    primeiro_calculado = calcular_primeiro_digito(nove_digitos)
-    segundo_calculado = calcular_segundo_digito(nove_digitos, primeiro_calculado)
-    
-    # Pega os dígitos verificadores informados
-    primeiro_informado = digitos[9]
-    segundo_informado = digitos[10]
-    
-    # Verifica se os dígitos conferem
-    if primeiro_calculado != primeiro_informado or segundo_calculado != segundo_informado:
-        return False, {
-            "erro": "Dígitos verificadores inválidos",
-            "cpf_formatado": f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:11]}",
-            "verificadores_informados": f"{primeiro_informado}{segundo_informado}",
-            "verificadores_corretos": f"{primeiro_calculado}{segundo_calculado}"
-        }
-    
-    # CPF válido!
-    regioes = obter_regioes_fiscais()
-    nono_digito = digitos[8]
-    regiao = regioes[nono_digito]
-    
-    return True, {
-        "cpf_formatado": f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:11]}",
-        "nove_primeiros": ' '.join(map(str, nove_digitos)),
-        "primeiro_verificador": primeiro_calculado,
-        "segundo_verificador": segundo_calculado,
-        "nono_digito": nono_digito,
-        "regiao_fiscal": regiao
-    }
+    """Valida um CPF completo (campos de exibição montados só quando acessados)"""
+    resultado = validar_cpf_nucleo(cpf)
+    return resultado.valido, resultado
 
-def validar_cpf_interface(event):
-    """Valida o CPF digitado pelo usuário"""
-    cpf_input = document["input-cpf"].value.strip()
-    
-    if not cpf_input:
-        return
-    
-    valido, info = validar_cpf(cpf_input)
-    
+def mensagem_de_erro(info):
+    """Monta a mensagem exibida para o motivo da invalidação"""
+    if info.motivo is Motivo.NAO_NUMERICO:
+        return "CPF deve conter apenas números, pontos, traço e espaços."
+    if info.motivo is Motivo.TAMANHO:
+        return f"CPF deve ter 11 dígitos. Você digitou {len(info.cpf_limpo)} dígitos."
+    if info.motivo is Motivo.REPETIDO:
+        return "CPF não pode ser uma sequência de números iguais."
+    if info.motivo is Motivo.PRIMEIRO_VERIFICADOR:
+        return "Primeiro dígito verificador inválido"
+    return "Segundo dígito verificador inválido"
+
+# Painéis do validador: um para CPF válido e outro para inválido, criados uma vez
+display_valido = html.DIV(Class="cpf-display")
+detalhes_validos = html.DIV(Class="detalhes")
+painel_valido = Painel(detalhes_validos, [
+    "📋 Primeiros 9 dígitos: ", "🔢 1º verificador: ", "🔢 2º verificador: ", "🗺️ Região Fiscal: ",
+])
+validos_div = html.DIV([display_valido, detalhes_validos])
+
+invalidos_div = html.DIV(Class="detalhes")
+display_invalido = html.DIV(Class="cpf-display")
+invalidos_div <= display_invalido
+painel_invalido = Painel(invalidos_div, [
+    "❌ Motivo: ", "🔍 Dígitos informados: ", "✅ Dígitos corretos: ",
+])
+
+document["detalhes-validacao"] <= validos_div
+document["detalhes-validacao"] <= invalidos_div
+
+@medir_render("validador", "resultado-validador")
+def exibir_validacao(valido, info):
+    """Exibe o resultado da validação"""
     status_div = document["status-validacao"]
-    detalhes_div = document["detalhes-validacao"]
-    
-    status_div.clear()
-    detalhes_div.clear()
+    mostrar(validos_div, valido)
+    mostrar(invalidos_div, not valido)
     
     if valido:
         # CPF Válido
         status_div.attrs["class"] = "status-valido"
-        status_div <= html.DIV("✅ CPF VÁLIDO!")
-        
-        detalhes_div <= html.DIV(
-            html.DIV(Class="cpf-display", text=info['cpf_formatado']) +
-            html.DIV(
-                html.DIV([html.SPAN("📋 Primeiros 9 dígitos: ", Class="label"), 
-                          html.SPAN(info['nove_primeiros'], Class="valor")], Class="detalhes-linha") +
-                html.DIV([html.SPAN("🔢 1º verificador: ", Class="label"), 
-                          html.SPAN(str(info['primeiro_verificador']), Class="valor")], Class="detalhes-linha") +
-                html.DIV([html.SPAN("🔢 2º verificador: ", Class="label"), 
-                          html.SPAN(str(info['segundo_verificador']), Class="valor")], Class="detalhes-linha") +
-                html.DIV([html.SPAN("🗺️ Região Fiscal: ", Class="label"), 
-                          html.SPAN(f"Dígito {info['nono_digito']} - {info['regiao_fiscal']}", Class="valor")], 
-                         Class="detalhes-linha"),
-                Class="detalhes"
-            )
+        trocar_texto(status_div, "✅ CPF VÁLIDO!")
+        trocar_texto(display_valido, info.cpf_formatado)
+        painel_valido.atualizar(
+            info.nove_primeiros,
+            str(info.primeiro_verificador),
+            str(info.segundo_verificador),
+            f"Dígito {info.nono_digito} - {obter_regioes_fiscais()[info.nono_digito]}",
         )
     else:
-        # CPF Inválido
+        # CPF Inválido: os dígitos só são comparados quando o CPF tem 11 dígitos
         status_div.attrs["class"] = "status-invalido"
-        status_div <= html.DIV("❌ CPF INVÁLIDO!")
-        
-        detalhes_content = html.DIV(Class="detalhes")
-        
-        if "cpf_formatado" in info:
-            detalhes_content <= html.DIV(Class="cpf-display", text=info['cpf_formatado'])
-        
-        detalhes_content <= html.DIV([html.SPAN("❌ Motivo: ", Class="label"), 
-                                       html.SPAN(info['erro'], Class="valor")], Class="detalhes-linha")
-        
-        if "verificadores_informados" in info:
-            detalhes_content += html.DIV([html.SPAN("🔍 Dígitos informados: ", Class="label"), 
-                                          html.SPAN(info['verificadores_informados'], Class="valor")], 
-                                         Class="detalhes-linha")
-            detalhes_content += html.DIV([html.SPAN("✅ Dígitos corretos: ", Class="label"), 
-                                          html.SPAN(info['verificadores_corretos'], Class="valor")], 
-                                         Class="detalhes-linha")
-        
-        detalhes_div <= detalhes_content
+        trocar_texto(status_div, "❌ CPF INVÁLIDO!")
+        tem_verificadores = info.verificadores_informados is not None
+        mostrar(display_invalido, tem_verificadores)
+        if tem_verificadores:
+            trocar_texto(display_invalido, info.cpf_formatado)
+        painel_invalido.atualizar(
+            mensagem_de_erro(info),
+            info.verificadores_informados,
+            info.verificadores_corretos,
+        )
     
     document["resultado-validador"].classList.remove("hidden")
 
-def formatar_cpf_input(event):
-    """Formata o CPF enquanto o usuário digita"""
-    input_elem = event.target
-    valor = limpar_cpf(input_elem.value)
-    
-    if len(valor) > 11:
-        valor = valor[:11]
+def validar_cpf_interface(event):
+    """Valida o CPF digitado pelo usuário"""
+    cpf_input = document["input-cpf"].value.strip()
     
-    # Formata: XXX.XXX.XXX-XX
-    formatado = ""
-    for i, char in enumerate(valor):
-        if i == 3 or i == 6:
-            formatado += "."
-        elif i == 9:
-            formatado += "-"
-        formatado += char
+    if not cpf_input:
+        return
     
-    input_elem.value = formatado
+    valido, info = validar_cpf(cpf_input)
+    exibir_validacao(valido, info)
+
+# ==================== MÁSCARA E VALIDAÇÃO AO VIVO ====================
+
+# Fatias da máscara XXX.XXX.XXX-XX: (início, fim, separador antes do trecho)
+FATIAS_MASCARA = ((0, 3, ""), (3, 6, "."), (6, 9, "."), (9, 11, "-"))
+
+# Fatias que aparecem para cada quantidade de dígitos (0 a 11)
+MASCARA_POR_TAMANHO = tuple(
+    tuple(fatia for fatia in FATIAS_MASCARA if fatia[0] < tamanho) for tamanho in range(12)
+)
+
+# Posição no texto mascarado logo depois do k-ésimo dígito (0 a 11)
+POSICAO_NA_MASCARA = tuple(k + (k > 3) + (k > 6) + (k > 9) for k in range(12))
+
+# Espera depois da última tecla antes de conferir os dígitos verificadores
+ATRASO_VALIDACAO_MS = 150
+
+# Mensagem curta (e classe do campo) para cada motivo
+STATUS_AO_VIVO = {
+    Motivo.VALIDO: ("✅ CPF válido", "valido"),
+    Motivo.NAO_NUMERICO: ("❌ Apenas números, pontos, traço e espaços", "invalido"),
+    Motivo.TAMANHO: ("❌ O CPF deve ter 11 dígitos", "invalido"),
+    Motivo.REPETIDO: ("❌ Sequência de números iguais", "invalido"),
+    Motivo.PRIMEIRO_VERIFICADOR: ("❌ Dígitos verificadores não conferem", "invalido"),
+    Motivo.SEGUNDO_VERIFICADOR: ("❌ Dígitos verificadores não conferem", "invalido"),
+}
+
+validacao_pendente = None
+
+def mascarar(digitos):
+    """Aplica a máscara XXX.XXX.XXX-XX a até 11 dígitos, sem laço caractere a caractere"""
+    return "".join([separador + digitos[inicio:fim]
+                    for inicio, fim, separador in MASCARA_POR_TAMANHO[len(digitos)]])
+
+def mostrar_status_ao_vivo(texto, classe):
+    """Atualiza a linha de status embaixo do campo e a cor da borda"""
+    status = document["status-ao-vivo"]
+    trocar_texto(status, texto)
+    entrada = document["input-cpf"]
+    for nome in ("valido", "invalido"):
+        if nome == classe:
+            entrada.classList.add(nome)
+        else:
+            entrada.classList.remove(nome)
+
+def validar_ao_vivo():
+    """Confere os dígitos já digitados (chamada depois do atraso, não a cada tecla)"""
+    global validacao_pendente
+    validacao_pendente = None
+    
+    digitos = limpar_cpf(document["input-cpf"].value)
+    if not digitos:
+        mostrar_status_ao_vivo("", None)
+    elif len(digitos) < 11:
+        mostrar_status_ao_vivo(f"⌨️ {len(digitos)} de 11 dígitos", None)
+    else:
+        mostrar_status_ao_vivo(*STATUS_AO_VIVO[motivo_cpf(digitos)])
+
+def formatar_cpf_input(event):
+    """Formata o CPF enquanto o usuário digita, mantendo o cursor no lugar"""
+    global validacao_pendente
+    input_elem = event.target
+    valor = input_elem.value
+    cursor = input_elem.selectionStart
+    
+    digitos = limpar_cpf(valor)[:11]
+    formatado = mascarar(digitos)
+    
+    if formatado != valor:
+        # O cursor fica depois do mesmo dígito em que estava antes da máscara
+        digitos_antes = min(len(limpar_cpf(valor[:cursor])), 11) if cursor is not None else len(digitos)
+        posicao = POSICAO_NA_MASCARA[digitos_antes] if digitos_antes < len(digitos) else len(formatado)
+        input_elem.value = formatado
+        if getattr(document.activeElement, "id", None) == input_elem.id:
+            input_elem.setSelectionRange(posicao, posicao)
+    
+    if document["validar-ao-vivo"].checked:
+        if validacao_pendente is not None:
+            window.clearTimeout(validacao_pendente)
+        validacao_pendente = window.setTimeout(validar_ao_vivo, ATRASO_VALIDACAO_MS)
+
+def alternar_validacao_ao_vivo(event):
+    """Liga ou desliga a validação enquanto o usuário digita"""
+    global validacao_pendente
+    if validacao_pendente is not None:
+        window.clearTimeout(validacao_pendente)
+        validacao_pendente = None
+    if event.target.checked:
+        validar_ao_vivo()
+    else:
+        mostrar_status_ao_vivo("", None)
 
 # ==================== FUNÇÃO COPIAR ====================
 
 def copiar_cpf(event):
     """Copia o CPF para a área de transferência"""
-    from browser import window  # type: ignore
-    
     # Identifica qual botão foi clicado
     botao = event.target
     botao_id = botao.id
@@ -344,17 +425,141 @@ def copiar_cpf(event):
     
     window.setTimeout(restaurar_botao, 2000)
 
+# ==================== LOTE (WEB WORKER) ====================
+
+# Estado do lote: trabalhador pronto, pedaços do CSV e URL do último download
+lote = {"trabalhador": None, "partes": [], "url": None, "arquivo": None, "csv": False}
+
+def lote_pronto(trabalhador):
+    """Guarda o trabalhador e libera os botões do lote"""
+    lote["trabalhador"] = trabalhador
+    document["btn-gerar-lote"].disabled = False
+    document["btn-validar-lote"].disabled = False
+
+def iniciar_lote(pedido, titulo, nome_arquivo):
+    """Envia um pedido ao trabalhador e prepara o painel de progresso"""
+    if lote["trabalhador"] is None:
+        return
+    if lote["url"] is not None:
+        window.URL.revokeObjectURL(lote["url"])
+        lote["url"] = None
+    lote["partes"] = []
+    
+    document["btn-gerar-lote"].disabled = True
+    document["btn-validar-lote"].disabled = True
+    document["lote-titulo"].text = titulo
+    document["lote-progresso"].value = 0
+    document["lote-status"].text = "iniciando..."
+    document["lote-contagem"].clear()
+    download = document["lote-download"]
+    download.classList.add("hidden")
+    download.attrs["download"] = nome_arquivo
+    document["resultado-lote"].classList.remove("hidden")
+    
+    lote["trabalhador"].send(pedido)
+
+def mensagem_lote(evento):
+    """Recebe o progresso e o fim de um lote enviados pelo trabalhador"""
+    mensagem = evento.data
+    tipo = mensagem["tipo"]
+    
+    if tipo == "parte":
+        # Cada pedaço do CSV fica separado; o Blob junta tudo sem uma string gigante
+        lote["partes"].append(mensagem["texto"])
+        document["lote-progresso"].max = mensagem["total"]
+        document["lote-progresso"].value = mensagem["feitos"]
+        document["lote-status"].text = f"{mensagem['feitos']:,} de {mensagem['total']:,}".replace(",", ".")
+        return
+    
+    document["btn-gerar-lote"].disabled = False
+    document["btn-validar-lote"].disabled = False
+    
+    if tipo == "erro":
+        document["lote-titulo"].text = "❌ Erro no lote"
+        document["lote-status"].text = mensagem["mensagem"]
+        return
+    
+    total = mensagem["total"]
+    document["lote-titulo"].text = "✅ Lote concluído!"
+    document["lote-status"].text = f"{total:,} CPFs processados".replace(",", ".")
+    contagem = document["lote-contagem"]
+    for nome, quantidade in mensagem["contagem"].items():
+        if quantidade:
+            contagem <= html.DIV([html.SPAN(f"{nome}: ", Class="label"),
+                                  html.SPAN(f"{quantidade:,}".replace(",", "."), Class="valor")],
+                                 Class="detalhes-linha")
+    
+    if lote["partes"]:
+        blob = window.Blob.new(lote["partes"], {"type": "text/csv;charset=utf-8"})
+        lote["url"] = window.URL.createObjectURL(blob)
+        lote["partes"] = []
+        download = document["lote-download"]
+        download.attrs["href"] = lote["url"]
+        download.classList.remove("hidden")
+
+def erro_lote(evento):
+    """Mostra um erro do próprio worker (ex.: falha ao carregar o script)"""
+    document["btn-gerar-lote"].disabled = False
+    document["btn-validar-lote"].disabled = False
+    document["lote-titulo"].text = "❌ Erro no lote"
+    document["lote-status"].text = str(getattr(evento, "message", evento))
+    document["resultado-lote"].classList.remove("hidden")
+
+def gerar_lote(event):
+    """Pede ao trabalhador um lote de CPFs gerados"""
+    regiao = document["lote-regiao"].value
+    iniciar_lote({"tipo": "gerar",
+                  "quantidade": document["lote-quantidade"].value or "0",
+                  "regiao": regiao,
+                  "formato": document["lote-formato"].value},
+                 "⏳ Gerando CPFs...",
+                 f"cpfs_regiao_{regiao}.csv" if regiao else "cpfs.csv")
+
+def validar_lote(event):
+    """Pede ao trabalhador a validação do arquivo enviado ou da lista colada"""
+    if lote["arquivo"] is not None:
+        pedido = {"tipo": "validar", "texto": lote["arquivo"], "primeira_coluna": lote["csv"]}
+    else:
+        pedido = {"tipo": "validar", "texto": document["lote-texto"].value}
+    iniciar_lote(pedido, "⏳ Validando CPFs...", "cpfs_validados.csv")
+
+def carregar_arquivo_lote(event):
+    """Lê o arquivo escolhido; ele tem prioridade sobre a lista colada"""
+    arquivos = event.target.files
+    if not arquivos.length:
+        lote["arquivo"] = None
+        document["lote-texto"].disabled = False
+        return
+    
+    def arquivo_lido(texto):
+        lote["arquivo"] = texto
+        # Em um .csv, o CPF é o primeiro campo de cada linha
+        lote["csv"] = arquivos[0].name.lower().endswith(".csv")
+        # O conteúdo não vai para o textarea: milhares de linhas travariam a página
+        document["lote-texto"].value = ""
+        document["lote-texto"].disabled = True
+        document["lote-texto"].attrs["placeholder"] = f"Arquivo {arquivos[0].name} carregado"
+    
+    arquivos[0].text().then(arquivo_lido)
+
 # Vincula eventos
 document["btn-gerar-aleatorio"].bind("click", gerar_cpf_aleatorio)
 document["btn-gerar-outro"].bind("click", gerar_outro_cpf)
 document["btn-validar"].bind("click", validar_cpf_interface)
 document["input-cpf"].bind("input", formatar_cpf_input)
+document["validar-ao-vivo"].bind("change", alternar_validacao_ao_vivo)
 document["input-cpf"].bind("keypress", lambda e: validar_cpf_interface(e) if e.key == "Enter" else None)
 
 # Vincula botões de copiar
 document["btn-copiar-aleatorio"].bind("click", copiar_cpf)
 document["btn-copiar-regiao"].bind("click", copiar_cpf)
 
+# Vincula eventos do lote
+document["btn-gerar-lote"].bind("click", gerar_lote)
+document["btn-validar-lote"].bind("click", validar_lote)
+document["lote-arquivo"].bind("change", carregar_arquivo_lote)
+
 # Inicializa
 criar_grid_regioes()
+worker.create_worker("trabalhador", lote_pronto, mensagem_lote, erro_lote)
 
@@ -0,0 +1,137 @@
+"""
+Trabalhador em Lote - Versão Web com Brython
+Autor: Felipe Alcântara
+Descrição: Gera e valida CPFs em lote dentro de um Web Worker, fora da
+thread da página, para que a aba continue respondendo com dezenas de
+milhares de CPFs.
+
+Cada pedido chega como {"tipo": "gerar", "quantidade", "regiao", "formato"}
+ou {"tipo": "validar", "texto", "primeira_coluna"}. A resposta é uma sequência de mensagens
+{"tipo": "parte", "feitos", "total", "texto"} com um pedaço do CSV cada,
+seguida de {"tipo": "fim", "total", "contagem"}; um erro vira
+{"tipo": "erro", "mensagem"}.
+
+NOTA: Este arquivo usa Brython e só funciona no navegador, carregado pela
+página como <script type="text/python" class="webworker">.
+"""
+
+from browser import bind, self  # type: ignore
+import random
+
+from cpf import calcular_digitos_verificadores, formatar_cpf
+from cpf.motivos import NOMES_MOTIVOS, Motivo
+from cpf.validacao import motivo_cpf
+
+# CPFs por mensagem de progresso (cada uma leva um pedaço do CSV)
+TAMANHO_PEDACO = 2000
+
+# Limite de uma geração, para não esgotar a memória da aba com o CSV
+MAXIMO_GERACAO = 1_000_000
+
+
+def campo_csv(texto):
+    """Coloca o campo entre aspas quando ele tiver separador, aspas ou quebra de linha"""
+    if any(caractere in texto for caractere in ',"\r\n'):
+        return '"' + texto.replace('"', '""') + '"'
+    return texto
+
+
+def gerar(quantidade, regiao, formato):
+    """
+    Gera CPFs válidos e envia o CSV em pedaços.
+
+    Args:
+        quantidade (int): Quantidade de CPFs
+        regiao (int | None): 9º dígito fixo ou None para região aleatória
+        formato (str): "mascara" (000.000.000-00) ou "numeros" (00000000000)
+
+    Returns:
+        dict: Contagem de CPFs gerados por região fiscal
+    """
+    contagem = {str(digito): 0 for digito in range(10)}
+    cabecalho = "cpf,regiao\n"
+    feitos = 0
+    while feitos < quantidade:
+        tamanho = min(TAMANHO_PEDACO, quantidade - feitos)
+        linhas = []
+        for _ in range(tamanho):
+            digitos = [random.randint(0, 9) for _ in range(9)]
+            if regiao is not None:
+                digitos[8] = regiao
+            primeiro, segundo = calcular_digitos_verificadores(digitos)
+            if formato == "numeros":
+                cpf = "".join(map(str, digitos)) + str(primeiro) + str(segundo)
+            else:
+                cpf = formatar_cpf(digitos, primeiro, segundo)
+            linhas.append(f"{cpf},{digitos[8]}\n")
+            contagem[str(digitos[8])] += 1
+        feitos += tamanho
+        self.send({"tipo": "parte", "feitos": feitos, "total": quantidade,
+                   "texto": cabecalho + "".join(linhas)})
+        cabecalho = ""
+    return contagem
+
+
+def primeiro_campo(linha):
+    """Primeiro campo de uma linha CSV separada por vírgula ou ponto e vírgula, sem as aspas"""
+    linha = linha.strip()
+    if linha.startswith('"'):
+        fim = linha.find('"', 1)
+        return linha[1:fim if fim > 0 else len(linha)].strip()
+    fins = [fim for fim in (linha.find(","), linha.find(";")) if fim >= 0]
+    return linha[:min(fins)].strip() if fins else linha
+
+
+def validar(texto, primeira_coluna=False):
+    """
+    Valida um CPF por linha (linhas em branco são ignoradas) e envia o CSV em pedaços.
+
+    Args:
+        texto (str): Lista colada ou conteúdo do arquivo enviado
+        primeira_coluna (bool): Trata o texto como CSV com o CPF no primeiro
+            campo; uma primeira linha sem dígitos nesse campo é o cabeçalho
+
+    Returns:
+        dict: Contagem por nome curto do motivo (ex.: "valido")
+    """
+    if primeira_coluna:
+        cpfs = [primeiro_campo(linha) for linha in texto.splitlines()]
+        cpfs = [cpf for cpf in cpfs if cpf]
+        if cpfs and not any(caractere.isdigit() for caractere in cpfs[0]):
+            del cpfs[0]
+    else:
+        cpfs = [linha.strip() for linha in texto.splitlines()]
+        cpfs = [cpf for cpf in cpfs if cpf]
+    contagem = [0] * len(Motivo)
+    cabecalho = "cpf,motivo\n"
+    for inicio in range(0, len(cpfs), TAMANHO_PEDACO):
+        linhas = []
+        for cpf in cpfs[inicio:inicio + TAMANHO_PEDACO]:
+            motivo = motivo_cpf(cpf)
+            contagem[motivo] += 1
+            linhas.append(f"{campo_csv(cpf)},{NOMES_MOTIVOS[motivo]}\n")
+        self.send({"tipo": "parte", "feitos": min(inicio + TAMANHO_PEDACO, len(cpfs)),
+                   "total": len(cpfs), "texto": cabecalho + "".join(linhas)})
+        cabecalho = ""
+    return dict(zip(NOMES_MOTIVOS, contagem))
+
+
+@bind(self, "message")
+def receber(evento):
+    """Atende um pedido da página"""
+    pedido = evento.data
+    try:
+        if pedido["tipo"] == "gerar":
+            quantidade = int(pedido["quantidade"])
+            if not 1 <= quantidade <= MAXIMO_GERACAO:
+                raise ValueError(f"A quantidade deve estar entre 1 e {MAXIMO_GERACAO:,}.".replace(",", "."))
+            regiao = pedido.get("regiao")
+            contagem = gerar(quantidade, None if regiao in (None, "") else int(regiao),
+                             pedido.get("formato", "mascara"))
+            total = quantidade
+        else:
+            contagem = validar(pedido["texto"], bool(pedido.get("primeira_coluna")))
+            total = sum(contagem.values())
+        self.send({"tipo": "fim", "total": total, "contagem": contagem})
+    except Exception as erro:
+        self.send({"tipo": "erro", "mensagem": str(erro)})
@@ -0,0 +1,39 @@
+"""
+Testes da Enumeração de Intervalos
+Autor: Felipe Alcântara
+Descrição: Confere que enumerar_cpfs e contar_cpfs deixam de fora as bases
+com os nove dígitos iguais, comparando com o cálculo base a base.
+"""
+
+import pytest
+
+from cpf import calcular_digitos_verificadores, formatar_cpf
+from cpf.intervalo import BASE_MAXIMA, contar_cpfs, enumerar_cpfs
+from cpf.validacao import cpf_valido
+
+
+def esperados(inicio, fim, regiao=None):
+    """CPFs válidos do intervalo, calculados base a base."""
+    cpfs = []
+    for base in range(inicio, fim + 1):
+        digitos = list(map(int, f"{base:09d}"))
+        if (regiao is None or digitos[8] == regiao) and len(set(digitos)) > 1:
+            cpfs.append(formatar_cpf(digitos, *calcular_digitos_verificadores(digitos)))
+    return cpfs
+
+
+@pytest.mark.parametrize("inicio, fim", [(0, 0), (0, 2_500), (111_111_100, 111_111_120),
+                                          (555_554_000, 555_556_000), (BASE_MAXIMA - 1_500, BASE_MAXIMA)])
+@pytest.mark.parametrize("regiao", [None, 0, 1, 5, 9])
+def test_sem_bases_repetidas(inicio, fim, regiao):
+    cpfs = list(enumerar_cpfs(inicio, fim, regiao))
+    assert cpfs == esperados(inicio, fim, regiao)
+    assert all(cpf_valido(cpf) for cpf in cpfs)
+    assert contar_cpfs(inicio, fim, regiao) == len(cpfs)
+
+
+def test_intervalo_so_com_base_repetida():
+    assert list(enumerar_cpfs(0, 0)) == []
+    assert list(enumerar_cpfs(111_111_111, 111_111_111, formatado=False)) == []
+    assert contar_cpfs(777_777_777, 777_777_777, 7) == 0
+    assert list(enumerar_cpfs(111_111_110, 111_111_112, formatado=False)) == ["11111111030", "11111111200"]
@@ -0,0 +1,59 @@
+"""
+Testes do Gerador de CPFs Únicos
+Autor: Felipe Alcântara
+Descrição: Confere que GeradorUnico nunca entrega bases com os nove dígitos
+iguais, sem repetir CPFs, usando trechos da sequência (a sequência inteira
+tem quase 10^9 CPFs).
+"""
+
+import numpy as np
+import pytest
+
+from cpf.lote import FORMATO_DIGITOS
+from cpf.motivos import Motivo
+from cpf.unicos import GeradorUnico
+from cpf.vetorizado import validar_digitos
+
+BASES_REPETIDAS = {digito * 111_111_111 for digito in range(10)}
+
+
+def test_total_exclui_bases_repetidas():
+    assert GeradorUnico(chave=1).total == 10 ** 9 - 10
+    assert GeradorUnico(chave=1, regiao=4).total == 10 ** 8 - 1
+
+
+@pytest.mark.parametrize("regiao", [None, *range(10)])
+def test_nenhum_cpf_repetido(regiao):
+    gerador = GeradorUnico(chave=2024, regiao=regiao)
+    cpfs = np.concatenate(list(gerador.gerar(100_000, FORMATO_DIGITOS, tamanho_bloco=30_000)))
+
+    _, motivos = validar_digitos(cpfs)
+    assert not (motivos == Motivo.REPETIDO).any()
+    assert (motivos == Motivo.VALIDO).all()
+    assert len(np.unique(cpfs, axis=0)) == len(cpfs)
+
+
+@pytest.mark.parametrize("regiao", [None, 0, 5, 9])
+def test_vizinhas_das_bases_repetidas(regiao):
+    # Com a rede de Feistel trocada pela identidade, o índice i vira a
+    # i-ésima base permitida e dá para olhar em volta de cada excluída
+    gerador = GeradorUnico(chave=7, regiao=regiao)
+    gerador._feistel = lambda indices: indices
+
+    excluidos = [regiao * 11_111_111] if regiao is not None else sorted(BASES_REPETIDAS)
+    trechos = [np.arange(max(excluido - 1_000, 0), min(excluido + 1_000, gerador.total), dtype=np.uint64)
+               for excluido in excluidos]
+    bases = gerador.permutar(np.concatenate(trechos))
+
+    assert BASES_REPETIDAS.isdisjoint(bases.tolist())
+    assert len(np.unique(bases)) == len(bases)
+    if regiao is not None:
+        assert (bases % 10 == regiao).all()
+
+
+def test_cursor_no_fim_da_sequencia():
+    gerador = GeradorUnico(chave=3, regiao=2, cursor=10 ** 8 - 11)
+    cpfs = np.concatenate(list(gerador.gerar(10, FORMATO_DIGITOS)))
+    assert validar_digitos(cpfs)[0].all()
+    with pytest.raises(ValueError):
+        next(gerador.gerar(1))
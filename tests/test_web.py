@@ -0,0 +1,32 @@
+"""
+Testes da Cópia do Núcleo na Versão Web
+Autor: Felipe Alcântara
+Descrição: Confere que docs/cpf é uma cópia atualizada, em arquivos comuns,
+de todos os módulos do pacote cpf que as páginas importam.
+"""
+
+import os
+import sys
+
+DOCS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs")
+sys.path.insert(0, DOCS)
+
+import construir  # noqa: E402
+
+
+def test_docs_cpf_sem_link_simbolico():
+    assert not os.path.islink(os.path.join(DOCS, "cpf"))
+    for arquivo in construir.NUCLEO_WEB:
+        assert not os.path.islink(os.path.join(DOCS, "cpf", arquivo))
+
+
+def test_copia_atualizada():
+    assert construir.nucleo_desatualizado() == []
+
+
+def test_copia_cobre_as_importacoes_das_paginas():
+    scripts = [os.path.join(DOCS, script) for script in construir.SCRIPTS]
+    modulos = construir.fecho_de_importacoes(scripts, {})
+    locais = {nome for nome in modulos if nome == "cpf" or nome.startswith("cpf.")}
+    copiados = {"cpf" if arquivo == "__init__.py" else "cpf." + arquivo[:-3] for arquivo in construir.NUCLEO_WEB}
+    assert locais <= copiados